@@ -0,0 +1,69 @@
+import logging
+
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from experimenter.base.redis_client import get_redis_client
+
+
+class CircuitBreaker(object):
+    """
+    Tracks the health of an upstream in Redis so every worker shares it.
+    The circuit trips after CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive
+    failures and then rejects requests for CIRCUIT_BREAKER_RESET_TIMEOUT
+    seconds. After that a single probe request is let through at a time,
+    a successful probe closes the circuit and a failed one opens it again.
+    When Redis is unreachable every request is allowed.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.failures_key = f"circuit_breaker.{name}.failures"
+        self.tripped_key = f"circuit_breaker.{name}.tripped"
+        self.open_key = f"circuit_breaker.{name}.open"
+        self.probe_key = f"circuit_breaker.{name}.probe"
+
+    def allow_request(self):
+        try:
+            redis_client = get_redis_client()
+            if not redis_client.get(self.tripped_key):
+                return True
+
+            if redis_client.get(self.open_key):
+                return False
+
+            # half open, only one probe may be in flight
+            return bool(
+                redis_client.set(
+                    self.probe_key, 1, nx=True, ex=settings.CIRCUIT_BREAKER_RESET_TIMEOUT,
+                )
+            )
+        except RedisError as e:
+            logging.exception(f"Error reading {self.name} circuit breaker: {e}")
+            return True
+
+    def record_success(self):
+        try:
+            redis_client = get_redis_client()
+            # a healthy circuit has nothing to reset, skip the write
+            if redis_client.exists(self.failures_key, self.tripped_key):
+                redis_client.delete(
+                    self.failures_key, self.tripped_key, self.open_key, self.probe_key
+                )
+        except RedisError as e:
+            logging.exception(f"Error closing {self.name} circuit breaker: {e}")
+
+    def record_failure(self):
+        try:
+            redis_client = get_redis_client()
+            failures = redis_client.incr(self.failures_key)
+            probe_failed = redis_client.delete(self.probe_key)
+
+            if probe_failed or failures >= settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+                redis_client.set(self.tripped_key, 1)
+                redis_client.set(
+                    self.open_key, 1, ex=settings.CIRCUIT_BREAKER_RESET_TIMEOUT
+                )
+                logging.warning(f"{self.name} circuit breaker opened")
+        except RedisError as e:
+            logging.exception(f"Error opening {self.name} circuit breaker: {e}")
@@ -0,0 +1,16 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from experimenter.experiments.models import Experiment
+
+
+logger = logging.getLogger()
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the search vectors of all experiments"
+
+    def handle(self, *args, **options):
+        updated = Experiment.objects.update_search_vectors()
+        logger.info("Rebuilt search vectors of {} experiments".format(updated))
@@ -0,0 +1,17 @@
+import functools
+
+import redis
+from django.conf import settings
+
+
+@functools.lru_cache()
+def get_connection_pool(host, port, db):
+    return redis.ConnectionPool(host=host, port=port, db=db)
+
+
+def get_redis_client():
+    return redis.Redis(
+        connection_pool=get_connection_pool(
+            settings.REDIS_HOST, settings.REDIS_PORT, settings.REDIS_DB
+        )
+    )
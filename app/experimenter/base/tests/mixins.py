@@ -0,0 +1,143 @@
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import mock
+from redis.exceptions import LockError, LockNotOwnedError
+
+
+class StubServerMixin(object):
+    """
+    Runs a local HTTP server for the duration of each test so API clients
+    can be exercised end to end. Subclasses implement stubResponse, which
+    receives the request method, path, query and body and returns a
+    (status_code, json_data) tuple. Every request is recorded in
+    self.stub_requests.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.stub_requests = []
+        test_case = self
+
+        class StubHandler(BaseHTTPRequestHandler):
+            def handle_stub_request(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length).decode() if length else ""
+
+                test_case.stub_requests.append((self.command, url.path, query, body))
+                status_code, data = test_case.stubResponse(
+                    self.command, url.path, query, body
+                )
+
+                content = json.dumps(data).encode()
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = handle_stub_request
+
+            def log_message(self, *args):
+                pass
+
+        self.stub_server = HTTPServer(("127.0.0.1", 0), StubHandler)
+        self.stub_url = "http://127.0.0.1:{port}".format(
+            port=self.stub_server.server_address[1]
+        )
+
+        stub_thread = threading.Thread(target=self.stub_server.serve_forever)
+        stub_thread.daemon = True
+        stub_thread.start()
+        self.addCleanup(self.stub_server.server_close)
+        self.addCleanup(self.stub_server.shutdown)
+
+    def stubResponse(self, method, path, query, body):
+        raise NotImplementedError
+
+
+class FakeRedisLock(object):
+    def __init__(self, redis, name, timeout=None, thread_local=True, **kwargs):
+        self.redis = redis
+        self.name = name
+        self.timeout = timeout
+        self.local = type("local", (), {"token": None})()
+
+    def acquire(self, blocking=None, blocking_timeout=None, token=None):
+        token = (token or uuid.uuid4().hex).encode()
+        if self.redis.set(self.name, token, nx=True, ex=self.timeout):
+            self.local.token = token
+            return True
+        return False
+
+    def release(self):
+        expected_token = self.local.token
+        if expected_token is None:
+            raise LockError("Cannot release an unlocked lock")
+        self.local.token = None
+
+        if isinstance(expected_token, str):
+            expected_token = expected_token.encode()
+        if self.redis.get(self.name) != expected_token:
+            raise LockNotOwnedError("Cannot release a lock that's no longer owned")
+        self.redis.delete(self.name)
+
+
+class FakeRedis(object):
+    """
+    An in memory stand in for the parts of the redis client used by
+    experimenter. Expiry is recorded in self.expiries but never enforced,
+    tests can expire keys by deleting them.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.expiries = {}
+
+    def encode(self, value):
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, ex=None, px=None, nx=False):
+        if nx and name in self.data:
+            return None
+        self.data[name] = self.encode(value)
+        self.expiries[name] = ex if px is None else px / 1000
+        return True
+
+    def incr(self, name, amount=1):
+        value = int(self.data.get(name, 0)) + amount
+        self.data[name] = self.encode(value)
+        return value
+
+    def exists(self, *names):
+        return len([name for name in names if name in self.data])
+
+    def delete(self, *names):
+        deleted = [name for name in names if name in self.data]
+        for name in deleted:
+            del self.data[name]
+        return len(deleted)
+
+    def lock(self, name, timeout=None, thread_local=True, **kwargs):
+        return FakeRedisLock(self, name, timeout=timeout, thread_local=thread_local)
+
+
+class MockRedisMixin(object):
+    def setUp(self):
+        super().setUp()
+
+        self.redis = FakeRedis()
+        mock_redis_patcher = mock.patch(
+            "experimenter.base.redis_client.redis.Redis", return_value=self.redis
+        )
+        self.mock_redis = mock_redis_patcher.start()
+        self.addCleanup(mock_redis_patcher.stop)
@@ -0,0 +1,70 @@
+from django.test import TestCase, override_settings
+from redis.exceptions import RedisError
+import mock
+
+from experimenter.base.circuit_breaker import CircuitBreaker
+from experimenter.base.tests.mixins import MockRedisMixin
+
+
+@override_settings(CIRCUIT_BREAKER_FAILURE_THRESHOLD=2, CIRCUIT_BREAKER_RESET_TIMEOUT=60)
+class TestCircuitBreaker(MockRedisMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.circuit_breaker = CircuitBreaker("upstream")
+
+    def test_closed_circuit_allows_requests(self):
+        self.circuit_breaker.record_failure()
+
+        self.assertTrue(self.circuit_breaker.allow_request())
+
+    def test_consecutive_failures_open_circuit(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+
+        self.assertFalse(self.circuit_breaker.allow_request())
+        self.assertEqual(self.redis.expiries[self.circuit_breaker.open_key], 60)
+
+    def test_success_resets_failures(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_success()
+        self.circuit_breaker.record_failure()
+
+        self.assertTrue(self.circuit_breaker.allow_request())
+
+    def test_success_on_closed_circuit_skips_reset(self):
+        with mock.patch.object(self.redis, "delete") as mock_delete:
+            self.circuit_breaker.record_success()
+
+        mock_delete.assert_not_called()
+
+    def test_half_open_circuit_allows_one_probe(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        self.redis.delete(self.circuit_breaker.open_key)
+
+        self.assertTrue(self.circuit_breaker.allow_request())
+        self.assertFalse(self.circuit_breaker.allow_request())
+
+    def test_successful_probe_closes_circuit(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        self.redis.delete(self.circuit_breaker.open_key)
+
+        self.circuit_breaker.allow_request()
+        self.circuit_breaker.record_success()
+
+        self.assertTrue(self.circuit_breaker.allow_request())
+        self.assertTrue(self.circuit_breaker.allow_request())
+
+    @override_settings(CIRCUIT_BREAKER_FAILURE_THRESHOLD=5)
+    def test_failed_probe_opens_circuit(self):
+        self.redis.set(self.circuit_breaker.tripped_key, 1)
+
+        self.assertTrue(self.circuit_breaker.allow_request())
+        self.circuit_breaker.record_failure()
+
+        self.assertFalse(self.circuit_breaker.allow_request())
+
+    def test_redis_errors_allow_requests(self):
+        with mock.patch.object(self.redis, "get", side_effect=RedisError()):
+            self.assertTrue(self.circuit_breaker.allow_request())
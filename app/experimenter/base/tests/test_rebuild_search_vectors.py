@@ -0,0 +1,19 @@
+from django.contrib.postgres.search import SearchQuery
+from django.core.management import call_command
+from django.test import TestCase
+
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import ExperimentFactory
+
+
+class TestRebuildSearchVectors(TestCase):
+    def test_rebuilds_search_vectors(self):
+        experiment = ExperimentFactory.create(name="Fluffy Cat")
+        Experiment.objects.update(search_vector=None)
+
+        call_command("rebuild_search_vectors")
+
+        self.assertEqual(
+            list(Experiment.objects.filter(search_vector=SearchQuery("cat"))),
+            [experiment],
+        )
@@ -0,0 +1,24 @@
+import mock
+from django.test import TestCase, override_settings
+
+from experimenter.base.redis_client import get_redis_client
+
+
+class TestGetRedisClient(TestCase):
+    @override_settings(REDIS_HOST="redis.example.com", REDIS_PORT="6380", REDIS_DB="2")
+    def test_get_redis_client_uses_redis_settings(self):
+        with mock.patch("experimenter.base.redis_client.redis.Redis") as mock_redis:
+            redis_client = get_redis_client()
+
+        self.assertEqual(redis_client, mock_redis.return_value)
+        connection_pool = mock_redis.call_args[1]["connection_pool"]
+        self.assertEqual(
+            connection_pool.connection_kwargs,
+            {"host": "redis.example.com", "port": "6380", "db": "2"},
+        )
+
+    @override_settings(REDIS_HOST="redis.example.com", REDIS_PORT="6380", REDIS_DB="2")
+    def test_get_redis_client_reuses_connection_pool(self):
+        self.assertIs(
+            get_redis_client().connection_pool, get_redis_client().connection_pool
+        )
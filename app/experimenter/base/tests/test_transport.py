@@ -0,0 +1,141 @@
+from django.test import TestCase, override_settings
+from requests.exceptions import ConnectionError
+from markus.testing import MetricsMock
+import markus
+import mock
+
+from experimenter.base.tests.mixins import MockRedisMixin, StubServerMixin
+from experimenter.base.transport import (
+    CircuitOpenError,
+    JitteredRetry,
+    Transport,
+    get_endpoint,
+)
+
+
+@override_settings(
+    HTTP_RETRIES=2, HTTP_RETRY_BACKOFF=0, CIRCUIT_BREAKER_FAILURE_THRESHOLD=2
+)
+class TestTransport(MockRedisMixin, StubServerMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.responses = []
+        self.transport = Transport("upstream")
+
+    def stubResponse(self, method, path, query, body):
+        if self.responses:
+            return self.responses.pop(0)
+        return 200, {"ok": True}
+
+    def test_get_returns_response(self):
+        response = self.transport.get(
+            "{url}/api/recipe/".format(url=self.stub_url), params={"id_in": "1"}
+        )
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(
+            self.stub_requests, [("GET", "/api/recipe/", {"id_in": ["1"]}, "")]
+        )
+
+    def test_sessions_are_pooled_per_host(self):
+        session = self.transport.get_session("http://example.com/a/")
+
+        self.assertIs(self.transport.get_session("http://example.com/b/"), session)
+        self.assertIsNot(self.transport.get_session("http://example.org/a/"), session)
+
+    @override_settings(HTTP_CONNECT_TIMEOUT=1, HTTP_READ_TIMEOUT=2)
+    def test_request_uses_timeouts(self):
+        with mock.patch.object(self.transport, "get_session") as mock_get_session:
+            mock_get_session.return_value.request.return_value.status_code = 200
+            self.transport.put("http://example.com/rest/bug/1", {"a": 1})
+
+        mock_get_session.return_value.request.assert_called_once_with(
+            "PUT", "http://example.com/rest/bug/1", data={"a": 1}, timeout=(1, 2)
+        )
+
+    def test_idempotent_request_is_retried(self):
+        self.responses = [(503, {}), (503, {})]
+
+        response = self.transport.get("{url}/api/".format(url=self.stub_url))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.stub_requests), 3)
+
+    def test_exhausted_retries_return_last_response(self):
+        self.responses = [(503, {}), (503, {}), (503, {})]
+
+        response = self.transport.get("{url}/api/".format(url=self.stub_url))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.stub_requests), 3)
+
+    def test_post_is_not_retried(self):
+        self.responses = [(503, {})]
+
+        response = self.transport.post("{url}/api/".format(url=self.stub_url), {})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.stub_requests), 1)
+
+    def test_server_errors_open_circuit(self):
+        self.responses = [(503, {})] * 6
+
+        self.transport.get("{url}/api/".format(url=self.stub_url))
+        self.transport.get("{url}/api/".format(url=self.stub_url))
+
+        with self.assertRaises(CircuitOpenError):
+            self.transport.get("{url}/api/".format(url=self.stub_url))
+        self.assertEqual(len(self.stub_requests), 6)
+
+    def test_connection_errors_open_circuit(self):
+        self.stub_server.shutdown()
+        self.stub_server.server_close()
+
+        for i in range(2):
+            with self.assertRaises(ConnectionError):
+                self.transport.get("{url}/api/".format(url=self.stub_url))
+
+        with self.assertRaises(CircuitOpenError):
+            self.transport.get("{url}/api/".format(url=self.stub_url))
+
+    def test_client_errors_close_circuit(self):
+        self.responses = [(503, {})] * 3 + [(404, {})]
+
+        self.transport.get("{url}/api/".format(url=self.stub_url))
+        self.transport.get("{url}/api/".format(url=self.stub_url))
+
+        self.assertIsNone(self.redis.get(self.transport.circuit_breaker.failures_key))
+
+    def test_request_is_timed_per_endpoint(self):
+        with MetricsMock() as mm:
+            self.transport.get("{url}/api/recipe/12/".format(url=self.stub_url))
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.TIMING,
+                    "base.transport.upstream.request.timing",
+                    tags=["endpoint:GET /api/recipe/_/", "status:200"],
+                )
+            )
+
+    def test_get_endpoint_replaces_ids(self):
+        self.assertEqual(
+            get_endpoint("http://example.com/rest/user/dev@example.com?api_key=k"),
+            "/rest/user/_",
+        )
+        self.assertEqual(
+            get_endpoint("http://example.com/api/v3/recipe/12/"), "/api/v3/recipe/_/"
+        )
+
+    def test_retry_backoff_is_jittered(self):
+        retry = (
+            JitteredRetry(total=3, backoff_factor=1)
+            .increment(method="GET")
+            .increment(method="GET")
+        )
+
+        with mock.patch("experimenter.base.transport.random.uniform") as mock_uniform:
+            backoff = retry.get_backoff_time()
+
+        mock_uniform.assert_called_once_with(0, 2)
+        self.assertEqual(backoff, mock_uniform.return_value)
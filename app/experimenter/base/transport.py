@@ -0,0 +1,115 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import markus
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from experimenter.base.circuit_breaker import CircuitBreaker
+
+
+metrics = markus.get_metrics("base.transport")
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    pass
+
+
+class JitteredRetry(Retry):
+    def get_backoff_time(self):
+        # spread the retries of many workers hitting the same outage
+        return random.uniform(0, super().get_backoff_time())
+
+
+def build_session():
+    retry = JitteredRetry(
+        total=settings.HTTP_RETRIES,
+        backoff_factor=settings.HTTP_RETRY_BACKOFF,
+        status_forcelist=(502, 503, 504),
+        method_whitelist=Retry.DEFAULT_METHOD_WHITELIST,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=settings.HTTP_POOL_SIZE, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_endpoint(url):
+    # ids and emails are replaced so each endpoint is timed as one metric
+    path = urlparse(url).path
+    return "/".join(
+        "_" if segment.isdigit() or "@" in segment else segment
+        for segment in path.split("/")
+    )
+
+
+class Transport(object):
+    """
+    Sends requests to an upstream API over keep-alive sessions pooled per
+    host. Requests time out after HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT
+    seconds, idempotent requests are retried with jittered backoff, and
+    every request is timed per endpoint as {name}.request.timing.
+    Requests fail fast with CircuitOpenError while the upstream's circuit
+    breaker is open.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.circuit_breaker = CircuitBreaker(name)
+        self.sessions = {}
+        self.sessions_lock = threading.Lock()
+
+    def get_session(self, url):
+        host = urlparse(url).netloc
+        with self.sessions_lock:
+            if host not in self.sessions:
+                self.sessions[host] = build_session()
+            return self.sessions[host]
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault(
+            "timeout", (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT)
+        )
+
+        if not self.circuit_breaker.allow_request():
+            metrics.incr(f"{self.name}.circuit_open")
+            raise CircuitOpenError(f"{self.name} circuit breaker is open")
+
+        start = time.monotonic()
+        status_code = "error"
+        try:
+            response = self.get_session(url).request(method, url, **kwargs)
+            status_code = response.status_code
+        except requests.exceptions.RequestException:
+            self.circuit_breaker.record_failure()
+            raise
+        finally:
+            metrics.timing(
+                f"{self.name}.request.timing",
+                value=(time.monotonic() - start) * 1000,
+                tags=[f"endpoint:{method} {get_endpoint(url)}", f"status:{status_code}",],
+            )
+
+        if status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return response
+
+    def get(self, url, params=None, **kwargs):
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self.request("POST", url, data=data, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request("PUT", url, data=data, **kwargs)
@@ -1,35 +1,60 @@
+import hashlib
+import json
 import logging
+import markus
 import requests
 from urllib.parse import urlparse, parse_qs
 
 from django.conf import settings
+from redis.exceptions import RedisError
+
+from experimenter.base.redis_client import get_redis_client
+from experimenter.base.transport import CircuitOpenError, Transport
 
 INVALID_USER_ERROR_CODE = 51
 INVALID_PARAMETER_ERROR_CODE = 53
 
 EXPERIMENT_NAME_MAX_LEN = 150
 
+USER_EXISTS_KEY = "bugzilla.user_exists.{email}"
+BUG_EXISTS_KEY = "bugzilla.bug_exists.{bug_id}"
+
+metrics = markus.get_metrics("bugzilla.client")
+
+transport = Transport("bugzilla")
+
 
 class BugzillaError(Exception):
     pass
 
 
+class BugzillaUnavailableError(BugzillaError):
+    pass
+
+
 def format_bug_body(experiment):
+    """
+    Render the bug's user story. Load the experiment with
+    Experiment.objects.get_bugzilla_prefetched() to render it without
+    further queries.
+    """
     bug_body = ""
     countries = "all"
     locales = "all"
-    if experiment.countries.count():
+    experiment_countries = list(experiment.countries.all())
+    experiment_locales = list(experiment.locales.all())
+    if experiment_countries:
         countries = "".join(
             [
                 "{name} ({code}) ".format(name=country.name, code=country.code)
-                for country in list(experiment.countries.all())
+                for country in experiment_countries
             ]
         )
-    if experiment.locales.count():
+    if experiment_locales:
         locales = "".join(
             [
                 "{name} ({code}) ".format(name=locale.name, code=locale.code)
-                for locale in list(experiment.locales.all())
+                for locale in experiment_locales
             ]
         )
 
@@ -72,25 +97,110 @@ def format_update_body(experiment):
     return {"summary": summary, "cf_user_story": format_bug_body(experiment)}
 
 
+def get_update_hash(bug_id, body):
+    # the bug id is hashed too so moving an experiment to another bug
+    # always updates the new bug
+    update = {"bug_id": bug_id, "body": body}
+    return hashlib.sha256(json.dumps(update, sort_keys=True).encode()).hexdigest()
+
+
 def update_experiment_bug(experiment):
+    """
+    Update the experiment's bug summary and user story, skipping the call
+    when they match what was last sent. Returns whether the bug was updated.
+    """
     body = format_update_body(experiment)
+    update_hash = get_update_hash(experiment.bugzilla_id, body)
+    if update_hash == experiment.bugzilla_update_hash:
+        return False
+
     make_bugzilla_call(
         settings.BUGZILLA_UPDATE_URL.format(id=experiment.bugzilla_id),
-        requests.put,
+        transport.put,
         data=body,
     )
 
+    experiment.bugzilla_update_hash = update_hash
+    experiment.save(update_fields=["bugzilla_update_hash"])
+    return True
+
+
+def get_cached_exists(key):
+    try:
+        cached = get_redis_client().get(key)
+    except RedisError as e:
+        logging.exception("Error reading Bugzilla cache: {}".format(e))
+        return None
+
+    if cached is not None:
+        metrics.incr("cache.hit")
+        return cached == b"1"
+    metrics.incr("cache.miss")
+
+
+def set_cached_exists(key, exists):
+    ttl = settings.BUGZILLA_CACHE_TTL if exists else settings.BUGZILLA_CACHE_MISSING_TTL
+    try:
+        get_redis_client().set(key, int(exists), ex=ttl)
+    except RedisError as e:
+        logging.exception("Error writing Bugzilla cache: {}".format(e))
+
 
 def user_exists(user):
+    exists = get_cached_exists(USER_EXISTS_KEY.format(email=user))
+    if exists is None:
+        exists = fetch_user_exists(user)
+    return exists
+
+
+def fetch_user_exists(user):
     try:
         response = make_bugzilla_call(
-            settings.BUGZILLA_USER_URL.format(email=user), requests.get
+            settings.BUGZILLA_USER_URL.format(email=user), transport.get
         )
-        users = response["users"]
-        return len(users) == 1
-    except (BugzillaError, KeyError):
+    except BugzillaUnavailableError:
+        raise
+    except BugzillaError:
+        return False
+
+    if "users" in response:
+        exists = len(response["users"]) == 1
+    elif response.get("code") == INVALID_USER_ERROR_CODE:
+        exists = False
+    else:
+        # only a definite answer is cached, errors are looked up again
         return False
 
+    set_cached_exists(USER_EXISTS_KEY.format(email=user), exists)
+    return exists
+
+
+def warm_user_cache(users):
+    """
+    Look up users in batches of BUGZILLA_CACHE_WARM_BATCH_SIZE and cache
+    whether they exist. Bugzilla rejects a batch that names a missing user,
+    those batches are looked up one user at a time.
+    """
+    users = sorted(set(users))
+    batch_size = settings.BUGZILLA_CACHE_WARM_BATCH_SIZE
+    for offset in range(0, len(users), batch_size):
+        batch = users[offset:][:batch_size]
+        response = make_bugzilla_call(
+            settings.BUGZILLA_USERS_URL, transport.get, {"names": batch}
+        )
+
+        if "users" not in response:
+            for user in batch:
+                fetch_user_exists(user)
+            continue
+
+        # Bugzilla logins are case insensitive
+        found_users = {found_user["name"].lower() for found_user in response["users"]}
+        for user in batch:
+            set_cached_exists(
+                USER_EXISTS_KEY.format(email=user), user.lower() in found_users
+            )
+
 
 def format_resolution_body(experiment):
     if experiment.status == experiment.STATUS_COMPLETE:
@@ -102,14 +212,62 @@ def format_resolution_body(experiment):
 
 
 def bug_exists(bug_id):
+    key = BUG_EXISTS_KEY.format(bug_id=bug_id)
+    exists = get_cached_exists(key)
+    if exists is not None:
+        return exists
+
     try:
         response = make_bugzilla_call(
-            settings.BUGZILLA_BUG_URL.format(bug_id=bug_id), requests.get
+            settings.BUGZILLA_BUG_URL.format(bug_id=bug_id), transport.get
         )
-        bugs = response["bugs"]
-        return len(bugs) == 1
-    except (BugzillaError, KeyError):
+    except BugzillaUnavailableError:
+        raise
+    except BugzillaError:
+        return False
+
+    # missing bugs are left out of the search results, only a definite
+    # answer is cached and errors are looked up again
+    if "bugs" not in response:
         return False
+    exists = len(response["bugs"]) == 1
+
+    set_cached_exists(key, exists)
+    return exists
+
+
+def get_bugs(bug_ids):
+    """
+    Fetch the status and resolution of the given bugs, searching for
+    BUGZILLA_SEARCH_CHUNK_SIZE ids at a time. Returns a dict of bug ids to
+    their status and resolution, bugs that are not found are left out.
+    """
+    bug_ids = sorted(set(bug_ids))
+    chunk_size = settings.BUGZILLA_SEARCH_CHUNK_SIZE
+
+    bugs = {}
+    for offset in range(0, len(bug_ids), chunk_size):
+        chunk = bug_ids[offset:][:chunk_size]
+        response = make_bugzilla_call(
+            settings.BUGZILLA_SEARCH_URL,
+            transport.get,
+            {
+                "id": ",".join(map(str, chunk)),
+                "api_key": settings.BUGZILLA_API_KEY,
+                "include_fields": "id,status,resolution",
+            },
+        )
+
+        try:
+            for bug in response["bugs"]:
+                bugs[bug["id"]] = {
+                    "status": bug["status"],
+                    "resolution": bug["resolution"],
+                }
+        except (KeyError, TypeError):
+            raise BugzillaError("Invalid Bugzilla search response: {}".format(response))
+
+    return bugs
 
 
 def update_bug_resolution(experiment):
@@ -118,15 +276,54 @@ def update_bug_resolution(experiment):
         status_body = format_resolution_body(experiment)
         make_bugzilla_call(
             settings.BUGZILLA_UPDATE_URL.format(id=experiment.bugzilla_id),
-            requests.put,
+            transport.put,
             status_body,
         )
 
 
+def update_bug_resolutions(experiments):
+    """
+    Update the status and resolution of the experiments' bugs, sending one
+    call per distinct status and resolution for up to
+    BUGZILLA_BULK_UPDATE_SIZE bugs. Returns a dict of the experiments whose
+    bugs failed to update mapped to their BugzillaError.
+    """
+    groups = {}
+    for experiment in experiments:
+        if experiment.bugzilla_id:
+            status_body = format_resolution_body(experiment)
+            groups.setdefault(tuple(sorted(status_body.items())), []).append(experiment)
+
+    errors = {}
+    batch_size = settings.BUGZILLA_BULK_UPDATE_SIZE
+    for status_items, group in groups.items():
+        for offset in range(0, len(group), batch_size):
+            batch = group[offset:][:batch_size]
+            status_body = dict(status_items)
+            # every bug listed in ids is updated, not just the one in the url
+            status_body["ids"] = [experiment.bugzilla_id for experiment in batch]
+            logging.info(f"Bugzilla Resolution/Status of {len(batch)} bugs")
+            try:
+                make_bugzilla_call(
+                    settings.BUGZILLA_UPDATE_URL.format(id=batch[0].bugzilla_id),
+                    transport.put,
+                    status_body,
+                )
+            except BugzillaUnavailableError:
+                raise
+            except BugzillaError as e:
+                errors.update((experiment, e) for experiment in batch)
+
+    return errors
+
+
 def make_bugzilla_call(url, method, data=None):
     try:
         response = method(url, data)
         return response.json()
+    except CircuitOpenError as e:
+        logging.info("Bugzilla is unavailable: {}".format(e))
+        raise BugzillaUnavailableError(*e.args)
     except requests.exceptions.RequestException as e:
         logging.exception("Error calling Bugzilla API: {}".format(e))
         raise BugzillaError(*e.args)
@@ -178,7 +375,7 @@ def create_experiment_bug(experiment):
 
     bug_data = format_creation_bug_body(experiment, extra_fields)
     response_data = make_bugzilla_call(
-        settings.BUGZILLA_CREATE_URL, requests.post, data=bug_data
+        settings.BUGZILLA_CREATE_URL, transport.post, data=bug_data
     )
 
     if "id" not in response_data:
@@ -202,7 +399,7 @@ def set_bugzilla_id_value(bug_url):
 def add_experiment_comment(bugzilla_id, comment):
     comment_data = {"comment": comment}
     response_data = make_bugzilla_call(
-        settings.BUGZILLA_COMMENT_URL.format(id=bugzilla_id), requests.post, comment_data
+        settings.BUGZILLA_COMMENT_URL.format(id=bugzilla_id), transport.post, comment_data
     )
 
     return response_data["id"]
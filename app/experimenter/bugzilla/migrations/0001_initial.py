@@ -0,0 +1,36 @@
+# Generated by Django 3.0.14 on 2026-10-16 23:04
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="BugSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bugzilla_id", models.PositiveIntegerField(unique=True)),
+                ("status", models.CharField(max_length=255)),
+                ("resolution", models.CharField(blank=True, max_length=255)),
+                ("updated_on", models.DateTimeField(default=django.utils.timezone.now),),
+            ],
+            options={
+                "verbose_name": "Bug Snapshot",
+                "verbose_name_plural": "Bug Snapshots",
+            },
+        ),
+    ]
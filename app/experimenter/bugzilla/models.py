@@ -0,0 +1,44 @@
+from django.db import models
+from django.utils import timezone
+
+
+class BugSnapshotManager(models.Manager):
+    def store_snapshots(self, bugs):
+        snapshots = self.in_bulk(bugs.keys(), field_name="bugzilla_id")
+        updated_on = timezone.now()
+
+        new_snapshots = []
+        for bugzilla_id, bug_data in bugs.items():
+            snapshot = snapshots.get(bugzilla_id)
+            if snapshot is None:
+                snapshot = self.model(bugzilla_id=bugzilla_id)
+                new_snapshots.append(snapshot)
+
+            snapshot.status = bug_data["status"]
+            snapshot.resolution = bug_data["resolution"]
+            snapshot.updated_on = updated_on
+
+        self.bulk_create(new_snapshots, ignore_conflicts=True)
+        self.bulk_update(snapshots.values(), ["status", "resolution", "updated_on"])
+
+
+class BugSnapshot(models.Model):
+    RESOLVED_STATUSES = ("RESOLVED", "VERIFIED", "CLOSED")
+
+    bugzilla_id = models.PositiveIntegerField(unique=True)
+    status = models.CharField(max_length=255)
+    resolution = models.CharField(max_length=255, blank=True)
+    updated_on = models.DateTimeField(default=timezone.now)
+
+    objects = BugSnapshotManager()
+
+    class Meta:
+        verbose_name = "Bug Snapshot"
+        verbose_name_plural = "Bug Snapshots"
+
+    def __str__(self):  # pragma: no cover
+        return str(self.bugzilla_id)
+
+    @property
+    def is_resolved(self):
+        return self.status in self.RESOLVED_STATUSES
@@ -1,21 +1,22 @@
 import mock
 
 from experimenter import bugzilla
+from experimenter.base.tests.mixins import MockRedisMixin
 
 
-class MockBugzillaMixin(object):
+class MockBugzillaMixin(MockRedisMixin):
     def setUp(self):
         super().setUp()
 
         mock_bugzilla_requests_post_patcher = mock.patch(
-            "experimenter.bugzilla.client.requests.post"
+            "experimenter.bugzilla.client.transport.post"
         )
         self.mock_bugzilla_requests_post = mock_bugzilla_requests_post_patcher.start()
         self.addCleanup(mock_bugzilla_requests_post_patcher.stop)
         self.bugzilla_id = "12345"
         self.mock_bugzilla_requests_post.return_value = self.buildMockSuccessResponse()
         mock_bugzilla_requests_put_patcher = mock.patch(
-            "experimenter.bugzilla.client.requests.put"
+            "experimenter.bugzilla.client.transport.put"
         )
 
         self.mock_bugzilla_requests_put = mock_bugzilla_requests_put_patcher.start()
@@ -23,7 +24,7 @@ class MockBugzillaMixin(object):
         self.mock_bugzilla_requests_put.return_value = self.buildMockSuccessResponse()
 
         mock_bugzilla_requests_get_patcher = mock.patch(
-            "experimenter.bugzilla.client.requests.get"
+            "experimenter.bugzilla.client.transport.get"
         )
 
         self.mock_bugzilla_requests_get = mock_bugzilla_requests_get_patcher.start()
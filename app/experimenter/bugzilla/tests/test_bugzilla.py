@@ -1,19 +1,33 @@
+from urllib.parse import urljoin
+
 import mock
-import requests
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.conf import settings
+from parameterized import parameterized
+from redis.exceptions import RedisError
+from requests.exceptions import RequestException
 
+from experimenter.base.tests.mixins import MockRedisMixin, StubServerMixin
+from experimenter.base.transport import CircuitOpenError
 from experimenter.bugzilla import (
     add_experiment_comment,
     BugzillaError,
+    BugzillaUnavailableError,
+    bug_exists,
     create_experiment_bug,
     format_bug_body,
     format_summary,
+    format_update_body,
+    get_bugs,
     get_bugzilla_id,
+    get_update_hash,
     make_bugzilla_call,
     set_bugzilla_id_value,
+    transport,
     update_bug_resolution,
     update_experiment_bug,
+    user_exists,
+    warm_user_cache,
 )
 from experimenter.experiments.models import Experiment
 from experimenter.experiments.tests.factories import (
@@ -141,6 +155,15 @@ class TestCreateExperimentBug(MockBugzillaMixin, TestCase):
         self.setupMockBugzillaCreationFailure()
         self.assertRaises(BugzillaError, create_experiment_bug, experiment)
 
+    def test_create_bugzilla_ticket_while_unavailable_creates_nothing(self):
+        experiment = ExperimentFactory.create_with_status(Experiment.STATUS_DRAFT)
+        self.mock_bugzilla_requests_get.side_effect = CircuitOpenError()
+
+        with self.assertRaises(BugzillaUnavailableError):
+            create_experiment_bug(experiment)
+
+        self.mock_bugzilla_requests_post.assert_not_called()
+
     def test_format_long_summary_name(self):
         long_name = "a" * 225
         experiment = ExperimentFactory.create(name=long_name)
@@ -169,6 +192,24 @@ class TestFormatBugBody(TestCase):
         self.assertIn("Countries: Canada (CA)", body)
         self.assertIn("Locales: Danish (da)", body)
 
+    @parameterized.expand(
+        [(experiment_type,) for experiment_type, _ in Experiment.TYPE_CHOICES]
+    )
+    def test_prefetched_update_body_renders_in_fixed_queries(self, experiment_type):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_LIVE,
+            type=experiment_type,
+            countries=[CountryFactory(code="CA", name="Canada")],
+            locales=[LocaleFactory(code="da", name="Danish")],
+        )
+
+        # the experiment with its analysis owner, changes, countries, locales and variants
+        with self.assertNumQueries(5):
+            experiment = Experiment.objects.get_bugzilla_prefetched().get(
+                id=experiment.id
+            )
+            format_update_body(experiment)
+
 
 class TestUpdateExperimentBug(MockBugzillaMixin, TestCase):
     def test_update_bugzilla_pref_experiment(self):
@@ -208,6 +249,58 @@ class TestUpdateExperimentBug(MockBugzillaMixin, TestCase):
             {"summary": summary, "cf_user_story": format_bug_body(experiment)},
         )
 
+    def test_unchanged_update_is_skipped(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, bugzilla_id="123", type=Experiment.TYPE_PREF
+        )
+
+        self.assertTrue(update_experiment_bug(experiment))
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(
+            experiment.bugzilla_update_hash,
+            get_update_hash(experiment.bugzilla_id, format_update_body(experiment)),
+        )
+
+        self.assertFalse(update_experiment_bug(experiment))
+        self.mock_bugzilla_requests_put.assert_called_once()
+
+    def test_changed_update_is_sent(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, bugzilla_id="123", type=Experiment.TYPE_PREF
+        )
+        update_experiment_bug(experiment)
+
+        experiment.name = "A Renamed Experiment"
+        experiment.save()
+
+        self.assertTrue(update_experiment_bug(experiment))
+        self.assertEqual(self.mock_bugzilla_requests_put.call_count, 2)
+
+    def test_update_is_sent_to_a_changed_bug(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, bugzilla_id="123", type=Experiment.TYPE_PREF
+        )
+        update_experiment_bug(experiment)
+
+        experiment.bugzilla_id = "456"
+        experiment.save()
+
+        self.assertTrue(update_experiment_bug(experiment))
+        self.mock_bugzilla_requests_put.assert_called_with(
+            settings.BUGZILLA_UPDATE_URL.format(id="456"), format_update_body(experiment)
+        )
+
+    def test_failed_update_is_not_recorded(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, bugzilla_id="123", type=Experiment.TYPE_PREF
+        )
+        self.mock_bugzilla_requests_put.side_effect = RequestException()
+
+        with self.assertRaises(BugzillaError):
+            update_experiment_bug(experiment)
+
+        self.assertIsNone(Experiment.objects.get(id=experiment.id).bugzilla_update_hash)
+
 
 class TestUpdateBugzillaResolution(MockBugzillaMixin, TestCase):
     def test_bugzilla_resolution_with_archive_true(self):
@@ -305,14 +398,20 @@ class TestMakeBugzillaCall(MockBugzillaMixin, TestCase):
         mock_response.status_code = 400
         self.mock_bugzilla_requests_post.return_value = mock_response
 
-        response_data = make_bugzilla_call("/url/", requests.post, data={})
+        response_data = make_bugzilla_call("/url/", transport.post, data={})
         self.assertEqual(response_data, mock_response_data)
 
     def test_json_parse_error_raises_bugzilla_error(self):
         self.mock_bugzilla_requests_post.side_effect = ValueError()
 
         with self.assertRaises(BugzillaError):
-            make_bugzilla_call("/url/", requests.post, data={})
+            make_bugzilla_call("/url/", transport.post, data={})
+
+    def test_open_circuit_raises_unavailable_error(self):
+        self.mock_bugzilla_requests_post.side_effect = CircuitOpenError()
+
+        with self.assertRaises(BugzillaUnavailableError):
+            make_bugzilla_call("/url/", transport.post, data={})
 
 
 class TestMakePutBugzillaCall(MockBugzillaMixin, TestCase):
@@ -324,10 +423,201 @@ class TestMakePutBugzillaCall(MockBugzillaMixin, TestCase):
         mock_response.status_code = 400
         self.mock_bugzilla_requests_put.return_value = mock_response
 
-        response_data = make_bugzilla_call("/url/", requests.put, data={})
+        response_data = make_bugzilla_call("/url/", transport.put, data={})
         self.assertEqual(response_data, mock_response_data)
 
     def test_json_parse_error_raises_bugzilla_error(self):
         self.mock_bugzilla_requests_put.side_effect = ValueError()
         with self.assertRaises(BugzillaError):
-            make_bugzilla_call("/url/", requests.put, data={})
+            make_bugzilla_call("/url/", transport.put, data={})
+
+
+@override_settings(BUGZILLA_CACHE_TTL=600, BUGZILLA_CACHE_MISSING_TTL=60)
+class TestBugzillaLookupCache(MockBugzillaMixin, TestCase):
+    def test_user_exists_is_cached(self):
+        self.mock_bugzilla_requests_get.side_effect = None
+        self.mock_bugzilla_requests_get.return_value = self.buildMockSuccessUserResponse()
+
+        self.assertTrue(user_exists("dev@example.com"))
+        self.assertTrue(user_exists("dev@example.com"))
+
+        self.mock_bugzilla_requests_get.assert_called_once()
+        self.assertEqual(self.redis.expiries["bugzilla.user_exists.dev@example.com"], 600)
+
+    def test_missing_user_is_cached_for_shorter_time(self):
+        self.mock_bugzilla_requests_get.side_effect = None
+        self.mock_bugzilla_requests_get.return_value = self.buildMockFailureResponse()
+
+        self.assertFalse(user_exists("missing@example.com"))
+        self.assertFalse(user_exists("missing@example.com"))
+
+        self.mock_bugzilla_requests_get.assert_called_once()
+        self.assertEqual(
+            self.redis.expiries["bugzilla.user_exists.missing@example.com"], 60
+        )
+
+    def test_failed_lookup_is_not_cached(self):
+        self.mock_bugzilla_requests_get.side_effect = RequestException()
+
+        self.assertFalse(user_exists("dev@example.com"))
+        self.assertFalse(bug_exists(1234))
+
+        self.assertEqual(self.redis.data, {})
+
+    def test_error_response_is_not_cached(self):
+        self.mock_bugzilla_requests_get.side_effect = None
+        self.mock_bugzilla_requests_get.return_value = self.buildMockErrorResponse()
+
+        self.assertFalse(user_exists("dev@example.com"))
+        self.assertFalse(bug_exists(1234))
+
+        self.assertEqual(self.redis.data, {})
+
+    def test_missing_bug_is_cached_for_shorter_time(self):
+        self.mock_bugzilla_requests_get.side_effect = None
+        self.mock_bugzilla_requests_get.return_value = self.buildMockBugsResponse([])
+
+        self.assertFalse(bug_exists(1234))
+        self.assertFalse(bug_exists(1234))
+
+        self.mock_bugzilla_requests_get.assert_called_once()
+        self.assertEqual(self.redis.expiries["bugzilla.bug_exists.1234"], 60)
+
+    def test_bug_exists_is_cached(self):
+        self.mock_bugzilla_requests_get.side_effect = None
+        self.mock_bugzilla_requests_get.return_value = self.buildMockSuccessBugResponse()
+
+        self.assertTrue(bug_exists(1234))
+        self.assertTrue(bug_exists(1234))
+
+        self.mock_bugzilla_requests_get.assert_called_once()
+
+    def test_redis_errors_fall_back_to_bugzilla(self):
+        self.mock_bugzilla_requests_get.side_effect = None
+        self.mock_bugzilla_requests_get.return_value = self.buildMockSuccessUserResponse()
+
+        with mock.patch.object(self.redis, "get", side_effect=RedisError()):
+            self.assertTrue(user_exists("dev@example.com"))
+            self.assertTrue(user_exists("dev@example.com"))
+
+        self.assertEqual(self.mock_bugzilla_requests_get.call_count, 2)
+
+    def test_cached_lookups_create_bug_with_one_request(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT,
+            feature_bugzilla_url="https://bugzilla.allizom.org/show_bug.cgi?id=1234",
+        )
+        create_experiment_bug(experiment)
+        self.mock_bugzilla_requests_get.reset_mock()
+
+        create_experiment_bug(experiment)
+
+        self.mock_bugzilla_requests_get.assert_not_called()
+        self.assertEqual(self.mock_bugzilla_requests_post.call_count, 2)
+
+    @override_settings(BUGZILLA_CACHE_WARM_BATCH_SIZE=2)
+    def test_warm_user_cache_looks_up_users_in_batches(self):
+        self.mock_bugzilla_requests_get.side_effect = [
+            self.buildMockUsersResponse(["a@example.com", "B@example.com"]),
+            self.buildMockUsersResponse(["c@example.com"]),
+        ]
+
+        warm_user_cache(
+            ["c@example.com", "a@example.com", "b@example.com", "a@example.com"]
+        )
+
+        self.mock_bugzilla_requests_get.assert_has_calls(
+            [
+                mock.call(
+                    settings.BUGZILLA_USERS_URL,
+                    {"names": ["a@example.com", "b@example.com"]},
+                ),
+                mock.call(settings.BUGZILLA_USERS_URL, {"names": ["c@example.com"]}),
+            ]
+        )
+        self.mock_bugzilla_requests_get.reset_mock()
+
+        self.assertTrue(user_exists("a@example.com"))
+        self.assertTrue(user_exists("b@example.com"))
+        self.assertTrue(user_exists("c@example.com"))
+        self.mock_bugzilla_requests_get.assert_not_called()
+
+    def test_warm_user_cache_looks_up_rejected_batch_one_user_at_a_time(self):
+        self.mock_bugzilla_requests_get.side_effect = [
+            self.buildMockFailureResponse(),
+            self.buildMockSuccessUserResponse(),
+            self.buildMockFailureResponse(),
+        ]
+
+        warm_user_cache(["dev@example.com", "missing@example.com"])
+        self.mock_bugzilla_requests_get.reset_mock()
+
+        self.assertTrue(user_exists("dev@example.com"))
+        self.assertFalse(user_exists("missing@example.com"))
+        self.mock_bugzilla_requests_get.assert_not_called()
+
+    def buildMockErrorResponse(self):
+        mock_response = mock.Mock()
+        mock_response.json = mock.Mock()
+        mock_response.json.return_value = {
+            "error": True,
+            "code": 32000,
+            "message": "Internal error",
+        }
+        mock_response.status_code = 500
+        return mock_response
+
+    def buildMockBugsResponse(self, bug_ids):
+        mock_response = mock.Mock()
+        mock_response.json = mock.Mock()
+        mock_response.json.return_value = {"bugs": [{"id": i} for i in bug_ids]}
+        mock_response.status_code = 200
+        return mock_response
+
+    def buildMockUsersResponse(self, names):
+        mock_response = mock.Mock()
+        mock_response.json = mock.Mock()
+        mock_response.json.return_value = {"users": [{"name": name} for name in names]}
+        mock_response.status_code = 200
+        return mock_response
+
+
+@override_settings(BUGZILLA_API_KEY="bugzilla-api-key")
+class TestGetBugsStubServer(MockRedisMixin, StubServerMixin, TestCase):
+    MISSING_BUG_IDS = (3,)
+
+    def stubResponse(self, method, path, query, body):
+        if path != "/rest/bug" or query.get("api_key") != [settings.BUGZILLA_API_KEY]:
+            return 404, {"error": True, "message": "Not found."}
+
+        bug_ids = [int(i) for i in query["id"][0].split(",")]
+        return (
+            200,
+            {
+                "bugs": [
+                    {"id": i, "status": "RESOLVED", "resolution": "FIXED"}
+                    for i in bug_ids
+                    if i not in self.MISSING_BUG_IDS
+                ]
+            },
+        )
+
+    @override_settings(BUGZILLA_SEARCH_CHUNK_SIZE=2)
+    def test_get_bugs_searches_in_chunks(self):
+        with override_settings(
+            BUGZILLA_SEARCH_URL=urljoin(self.stub_url, settings.BUGZILLA_CREATE_PATH)
+        ):
+            bugs = get_bugs([4, 1, 3, 2, 1])
+
+        self.assertEqual(
+            bugs, {i: {"status": "RESOLVED", "resolution": "FIXED"} for i in (1, 2, 4)},
+        )
+        self.assertEqual(
+            [query["id"] for method, path, query, body in self.stub_requests],
+            [["1,2"], ["3,4"]],
+        )
+
+    def test_get_bugs_raises_for_invalid_response(self):
+        with override_settings(BUGZILLA_SEARCH_URL=urljoin(self.stub_url, "/missing")):
+            with self.assertRaises(BugzillaError):
+                get_bugs([1])
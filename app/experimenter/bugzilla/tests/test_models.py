@@ -0,0 +1,29 @@
+from django.test import TestCase
+
+from experimenter.bugzilla.models import BugSnapshot
+
+
+class TestBugSnapshot(TestCase):
+    def test_is_resolved_for_closed_statuses(self):
+        self.assertTrue(BugSnapshot(status="RESOLVED").is_resolved)
+        self.assertTrue(BugSnapshot(status="VERIFIED").is_resolved)
+        self.assertFalse(BugSnapshot(status="NEW").is_resolved)
+
+    def test_store_snapshots_creates_and_updates_snapshots(self):
+        BugSnapshot.objects.create(bugzilla_id=1, status="NEW")
+
+        BugSnapshot.objects.store_snapshots(
+            {
+                1: {"status": "RESOLVED", "resolution": "FIXED"},
+                2: {"status": "ASSIGNED", "resolution": ""},
+            }
+        )
+
+        self.assertEqual(
+            list(
+                BugSnapshot.objects.order_by("bugzilla_id").values_list(
+                    "bugzilla_id", "status", "resolution"
+                )
+            ),
+            [(1, "RESOLVED", "FIXED"), (2, "ASSIGNED", "")],
+        )
@@ -1,16 +1,33 @@
+import hashlib
+import hmac
+import json
+import logging
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Greatest
+from redis.exceptions import RedisError
 from rest_framework.generics import (
     ListAPIView,
     UpdateAPIView,
     RetrieveAPIView,
     RetrieveUpdateAPIView,
 )
+from rest_framework.permissions import BasePermission
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework import status
 
+from experimenter.base.redis_client import get_redis_client
 from experimenter.experiments.constants import ExperimentConstants
 from experimenter.experiments.models import Experiment
-from experimenter.experiments import email
-from experimenter.experiments.serializers.entities import ExperimentSerializer
+from experimenter.experiments import email, tasks
+from experimenter.experiments.serializers.entities import (
+    ExperimentSerializer,
+    ExperimentTypeaheadSerializer,
+)
 from experimenter.experiments.serializers.clone import ExperimentCloneSerializer
 from experimenter.experiments.serializers.design import (
     ExperimentDesignAddonRolloutSerializer,
@@ -40,6 +57,68 @@ class ExperimentDetailView(RetrieveAPIView):
     serializer_class = ExperimentSerializer
 
 
+class ExperimentTypeaheadView(APIView):
+    """
+    Returns the name, slug and status of the experiments best matching the
+    q parameter, by trigram similarity to their name, slug, Normandy slug or
+    bug number. Results are cached for EXPERIMENT_TYPEAHEAD_CACHE_TTL
+    seconds so the list page can search as the user types. Queries are
+    cut to EXPERIMENT_TYPEAHEAD_MAX_LENGTH characters.
+    """
+
+    CACHE_KEY = "experiments.typeahead.{query_hash}"
+
+    def get(self, request, *args, **kwargs):
+        query = " ".join(request.query_params.get("q", "").lower().split())
+        query = query[: settings.EXPERIMENT_TYPEAHEAD_MAX_LENGTH].strip()
+        if not query:
+            return Response([])
+
+        # the query is hashed so user input never ends up in the key
+        cache_key = self.CACHE_KEY.format(
+            query_hash=hashlib.sha256(query.encode()).hexdigest()
+        )
+        try:
+            cached = get_redis_client().get(cache_key)
+            if cached is not None:
+                return Response(json.loads(cached))
+        except RedisError as e:
+            logging.exception(f"Error reading typeahead cache: {e}")
+
+        data = ExperimentTypeaheadSerializer(self.search(query), many=True).data
+
+        try:
+            get_redis_client().set(
+                cache_key, json.dumps(data), ex=settings.EXPERIMENT_TYPEAHEAD_CACHE_TTL,
+            )
+        except RedisError as e:
+            logging.exception(f"Error writing typeahead cache: {e}")
+
+        return Response(data)
+
+    def search(self, query):
+        # the trigram indexes serve both the similarity matches, which catch
+        # misspelled names, and the substring matches, which catch partial
+        # names, slugs and bug numbers regardless of case
+        matches = Q()
+        for field in ExperimentConstants.TYPEAHEAD_FIELDS:
+            matches |= Q(**{f"{field}__trigram_similar": query})
+            matches |= Q(**{f"{field}__icontains": query})
+
+        return (
+            Experiment.objects.filter(matches)
+            .annotate(
+                similarity=Greatest(
+                    *[
+                        TrigramSimilarity(field, query)
+                        for field in ExperimentConstants.TYPEAHEAD_FIELDS
+                    ]
+                )
+            )
+            .order_by("-similarity", "name")[: settings.EXPERIMENT_TYPEAHEAD_LIMIT]
+        )
+
+
 class ExperimentRecipeView(RetrieveAPIView):
     lookup_field = "slug"
     queryset = Experiment.objects.filter(
@@ -53,6 +132,42 @@ class ExperimentRecipeView(RetrieveAPIView):
     serializer_class = ExperimentRecipeSerializer
 
 
+class NormandySignaturePermission(BasePermission):
+    """
+    Allow requests whose body is signed with NORMANDY_WEBHOOK_SECRET, the
+    hex HMAC-SHA256 digest of the body is sent in the X-Normandy-Signature
+    header.
+    """
+
+    def has_permission(self, request, view):
+        secret = settings.NORMANDY_WEBHOOK_SECRET
+        signature = request.META.get("HTTP_X_NORMANDY_SIGNATURE")
+        if not secret or not signature:
+            return False
+
+        expected_signature = hmac.new(
+            secret.encode(), request.body, hashlib.sha256
+        ).hexdigest()
+        return hmac.compare_digest(expected_signature, signature)
+
+
+class NormandyRecipeChangedView(APIView):
+    authentication_classes = ()
+    permission_classes = (NormandySignaturePermission,)
+
+    def post(self, request, *args, **kwargs):
+        normandy_id = request.data.get("recipe_id")
+
+        if isinstance(normandy_id, bool) or not isinstance(normandy_id, int):
+            return Response(
+                {"error": "invalid-recipe-id"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        tasks.update_recipe_experiment_info.delay(normandy_id)
+
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
 class ExperimentSendIntentToShipEmailView(UpdateAPIView):
     lookup_field = "slug"
     queryset = Experiment.objects.filter(status=Experiment.STATUS_REVIEW)
@@ -66,10 +181,11 @@ class ExperimentSendIntentToShipEmailView(UpdateAPIView):
                 {"error": "email-already-sent"}, status=status.HTTP_409_CONFLICT
             )
 
-        email.send_intent_to_ship_email(experiment.id)
+        with transaction.atomic():
+            email.send_intent_to_ship_email(experiment.id)
 
-        experiment.review_intent_to_ship = True
-        experiment.save()
+            experiment.review_intent_to_ship = True
+            experiment.save()
 
         return Response()
 
@@ -62,6 +62,33 @@ class ExperimentConstants(object):
         (ROLLOUT_PLAYBOOK_CUSTOM, "Custom Schedule"),
     )
 
+    # search stuff
+    SEARCH_VECTOR_WEIGHTS = (
+        ("A", ("name", "slug", "normandy_slug", "bugzilla_id", "public_name")),
+        (
+            "B",
+            (
+                "short_description",
+                "public_description",
+                "owner__email",
+                "analysis_owner__email",
+                "engineering_owner",
+            ),
+        ),
+        ("C", ("objectives", "analysis", "related_work")),
+        (
+            "D",
+            (
+                "addon_experiment_id",
+                "pref_name",
+                "data_science_issue_url",
+                "feature_bugzilla_url",
+            ),
+        ),
+    )
+
+    TYPEAHEAD_FIELDS = ("name", "slug", "normandy_slug", "bugzilla_id")
+
     # date range stuff
     EXPERIMENT_STARTS = "starting"
     EXPERIMENT_PAUSES = "pausing"
@@ -1092,6 +1119,8 @@ If applicable, link to any relevant test builds / staging information
         "Experimenter enrollment ending verification " "for: {name} {version} {channel}"
     )
 
+    SUBSCRIBER_DIGEST_EMAIL_SUBJECT = "Experimenter daily digest"
+
     NORMANDY_CHANGE_WINDOW = """
         https://mana.mozilla.org/wiki/display/FIREFOX/Pref-Flip+and+Add-On+Experiments#Pref-FlipandAdd-OnExperiments-NormandyChangeWindow
     """
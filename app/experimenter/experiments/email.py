@@ -1,11 +1,25 @@
+from itertools import groupby
+from operator import attrgetter
+
 from django.conf import settings
+from django.core.mail import get_connection
 from django.core.mail.message import EmailMessage
+from django.db import transaction
 from django.template.loader import render_to_string
 
-from experimenter.experiments.models import Experiment, ExperimentEmail
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentEmail,
+    ExperimentOutboxEmail,
+)
 from experimenter.experiments.constants import ExperimentConstants
 
 
+# the digest only reports changes that already happened, so the upcoming
+# end and enrollment pause warnings are still sent to subscribers
+DIGEST_EMAIL_TYPES = (ExperimentConstants.EXPERIMENT_STARTS,)
+
+
 def send_intent_to_ship_email(experiment_id):
     experiment = Experiment.objects.get(id=experiment_id)
 
@@ -14,7 +28,7 @@ def send_intent_to_ship_email(experiment_id):
     # Because that's how it's done in Experiment.population (property)
     percent_of_population = f"{float(experiment.population_percent):g}%"
 
-    format_and_send_html_email(
+    format_and_queue_html_email(
         experiment,
         "experiments/emails/intent_to_ship.html",
         {
@@ -31,7 +45,7 @@ def send_intent_to_ship_email(experiment_id):
 
 
 def send_experiment_launch_email(experiment):
-    format_and_send_html_email(
+    format_and_queue_html_email(
         experiment,
         "experiments/emails/launch_experiment_email.html",
         {
@@ -44,8 +58,7 @@ def send_experiment_launch_email(experiment):
 
 
 def send_experiment_ending_email(experiment):
-
-    format_and_send_html_email(
+    format_and_queue_html_email(
         experiment,
         "experiments/emails/experiment_ending_email.html",
         {
@@ -58,8 +71,7 @@ def send_experiment_ending_email(experiment):
 
 
 def send_enrollment_pause_email(experiment):
-
-    format_and_send_html_email(
+    format_and_queue_html_email(
         experiment,
         "experiments/emails/enrollment_pause_email.html",
         {
@@ -71,7 +83,7 @@ def send_enrollment_pause_email(experiment):
     )
 
 
-def format_and_send_html_email(
+def format_and_queue_html_email(
     experiment, file_string, template_vars, subject, email_type, cc_recipients=None
 ):
     content = render_to_string(file_string, template_vars)
@@ -79,19 +91,65 @@ def format_and_send_html_email(
     version = experiment.format_firefox_versions
     channel = experiment.firefox_channel
 
-    recipients = [experiment.owner.email] + list(
-        experiment.subscribers.values_list("email", flat=True)
+    recipients = [experiment.owner.email]
+    # subscribers hear about experiment events in their daily digest instead
+    if not settings.EMAIL_SUBSCRIBER_DIGEST or email_type not in DIGEST_EMAIL_TYPES:
+        recipients += list(experiment.subscribers.values_list("email", flat=True))
+
+    # the email is stored in the caller's transaction and only sent once
+    # that commits, so a rolled back change never sends mail
+    ExperimentOutboxEmail.objects.create(
+        experiment=experiment,
+        type=email_type,
+        subject=subject.format(name=experiment.name, version=version, channel=channel),
+        body=content,
+        recipients=recipients,
+        cc_recipients=cc_recipients or [],
     )
 
+    # imported here as the tasks module imports this one
+    from experimenter.experiments.tasks import send_outbox_emails
+
+    transaction.on_commit(send_outbox_emails.delay)
+
+
+def send_outbox_email(outbox_email, connection=None):
     email = EmailMessage(
-        subject.format(name=experiment.name, version=version, channel=channel),
-        content,
+        outbox_email.subject,
+        outbox_email.body,
         settings.EMAIL_SENDER,
-        recipients,
-        cc=cc_recipients,
+        outbox_email.recipients,
+        cc=outbox_email.cc_recipients,
+        connection=connection,
     )
     email.content_subtype = "html"
 
     email.send(fail_silently=False)
 
-    ExperimentEmail.objects.create(experiment=experiment, type=email_type)
+    ExperimentEmail.objects.create(
+        experiment_id=outbox_email.experiment_id, type=outbox_email.type
+    )
+    outbox_email.delete()
+
+
+def send_subscriber_digest_emails(changes):
+    # changes are annotated with their recipient and ordered by it
+    messages = []
+    for recipient, recipient_changes in groupby(changes, key=attrgetter("recipient")):
+        content = render_to_string(
+            "experiments/emails/subscriber_digest.html",
+            {"changes": list(recipient_changes)},
+        )
+        message = EmailMessage(
+            Experiment.SUBSCRIBER_DIGEST_EMAIL_SUBJECT,
+            content,
+            settings.EMAIL_SENDER,
+            [recipient],
+        )
+        message.content_subtype = "html"
+        messages.append(message)
+
+    if messages:
+        get_connection(fail_silently=False).send_messages(messages)
+
+    return len(messages)
@@ -2,15 +2,11 @@ import django_filters as filters
 from django import forms
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q, F, IntegerField
-from django.db.models.functions import Cast
-from django.db.models.expressions import Func, Value
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import Q, F
+from django.contrib.postgres.search import SearchQuery, SearchRank
 import django_filters.widgets as widgets
 
-from experimenter.experiments.constants import ExperimentConstants
-
-from experimenter.experiments.models import Experiment
+from experimenter.experiments.models import Experiment, get_version_number
 from experimenter.projects.models import Project
 
 # the default widget has a dash character between the two date fields,
@@ -147,31 +143,11 @@ class ExperimentFilterset(filters.FilterSet):
         )
 
     def filter_search(self, queryset, name, value):
-        vector = SearchVector(
-            "name",
-            "short_description",
-            "owner__email",
-            "analysis_owner__email",
-            "slug",
-            "related_work",
-            "addon_experiment_id",
-            "pref_name",
-            "public_name",
-            "public_description",
-            "objectives",
-            "analysis",
-            "engineering_owner",
-            "bugzilla_id",
-            "normandy_slug",
-            "data_science_issue_url",
-            "feature_bugzilla_url",
-        )
-
         query = SearchQuery(value)
 
         return (
-            queryset.annotate(rank=SearchRank(vector, query), search=vector)
-            .filter(search=value)
+            queryset.annotate(rank=SearchRank(F("search_vector"), query))
+            .filter(search_vector=query)
             .order_by("-rank")
         )
 
@@ -187,35 +163,38 @@ class ExperimentFilterset(filters.FilterSet):
         return queryset
 
     def version_filter(self, queryset, name, value):
+        version_number = get_version_number(value)
         return queryset.filter(
-            Q(firefox_min_version__lte=value, firefox_max_version__gte=value)
-            | Q(firefox_min_version=value)
+            Q(
+                firefox_min_version_number__lte=version_number,
+                firefox_max_version_number__gte=version_number,
+            )
+            | Q(firefox_min_version_number=version_number)
         )
 
     def date_range_filter(self, queryset, name, value):
         date_type = self.form.cleaned_data["experiment_date_field"]
 
         experiment_date_field = {
-            Experiment.EXPERIMENT_STARTS: "start_date",
-            Experiment.EXPERIMENT_PAUSES: "enrollment_end_date",
-            Experiment.EXPERIMENT_ENDS: "end_date",
+            Experiment.EXPERIMENT_STARTS: "actual_start_date",
+            Experiment.EXPERIMENT_PAUSES: "actual_enrollment_end_date",
+            Experiment.EXPERIMENT_ENDS: "actual_end_date",
         }[date_type]
 
-        results = []
+        # enrollment end dates are optional, so there won't always
+        # be a pause date for an experiment
+        queryset = queryset.exclude(**{experiment_date_field: None})
 
-        for experiment in queryset.all():
-            date = getattr(experiment, experiment_date_field)
-
-            # enrollment end dates are optional, so there won't always
-            # be a pause date for an experiment
-            if date:
-                if value.start and date < value.start.date():
-                    continue
-                if value.stop and date > value.stop.date():
-                    continue
-                results.append(experiment.id)
+        if value.start:
+            queryset = queryset.filter(
+                **{f"{experiment_date_field}__gte": value.start.date()}
+            )
+        if value.stop:
+            queryset = queryset.filter(
+                **{f"{experiment_date_field}__lte": value.stop.date()}
+            )
 
-        return queryset.filter(pk__in=results)
+        return queryset
 
     def in_qa_filter(self, queryset, name, value):
         if value:
@@ -237,28 +216,8 @@ class ExperimentFilterset(filters.FilterSet):
 
     def longrunning_filter(self, queryset, name, value):
         if value:
-            return (
-                queryset.exclude(firefox_max_version__exact="")
-                .annotate(
-                    firefox_min_int=Cast(
-                        Func(
-                            F("firefox_min_version"),
-                            Value(ExperimentConstants.VERSION_REGEX.pattern),
-                            function="substring",
-                        ),
-                        IntegerField(),
-                    ),
-                    firefox_max_int=Cast(
-                        Func(
-                            F("firefox_max_version"),
-                            Value(ExperimentConstants.VERSION_REGEX.pattern),
-                            function="substring",
-                        ),
-                        IntegerField(),
-                    ),
-                    version_count=F("firefox_max_int") - F("firefox_min_int"),
-                )
-                .filter(version_count__gte=3)
+            return queryset.filter(
+                firefox_max_version_number__gte=F("firefox_min_version_number") + 3
             )
 
         return queryset
@@ -905,7 +905,7 @@ class ExperimentStatusForm(ExperimentConstants, ChangeLogMixin, forms.ModelForm)
             experiment.normandy_slug = experiment.generate_normandy_slug()
             experiment.save()
 
-            tasks.update_experiment_bug_task.delay(self.request.user.id, experiment.id)
+            tasks.schedule_experiment_bug_update(self.request.user.id, experiment.id)
 
         return experiment
 
@@ -0,0 +1,18 @@
+# Generated by Django 3.0.14 on 2026-10-16 21:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0096_add_telemetry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="next_normandy_sync_on",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 3.0.14 on 2026-10-16 22:41
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0097_experiment_next_normandy_sync_on"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExperimentOutboxEmail",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("starting", "starting"),
+                            ("pausing", "pausing"),
+                            ("ending", "ending"),
+                            ("intent to ship", "intent to ship"),
+                        ],
+                        max_length=255,
+                    ),
+                ),
+                ("subject", models.TextField()),
+                ("body", models.TextField()),
+                (
+                    "recipients",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.EmailField(max_length=255), size=None
+                    ),
+                ),
+                (
+                    "cc_recipients",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.EmailField(max_length=255),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "experiment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="outbox_emails",
+                        to="experiments.Experiment",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Experiment Outbox Email",
+                "verbose_name_plural": "Experiment Outbox Emails",
+                "ordering": ("attempts", "id"),
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.0.14 on 2026-10-16 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0098_experimentoutboxemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="bugzilla_update_hash",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
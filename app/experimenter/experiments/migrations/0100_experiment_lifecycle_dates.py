@@ -0,0 +1,92 @@
+# Generated by Django 3.0.14 on 2026-10-16 23:41
+
+from django.db import migrations, models
+from django.db.models import (
+    Case,
+    DateField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    When,
+)
+from django.db.models.functions import Coalesce, TruncDate
+
+from experimenter.experiments.constants import ExperimentConstants
+
+
+def populate_lifecycle_dates(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentChangeLog = apps.get_model("experiments", "ExperimentChangeLog")
+
+    def transition_date(old_status, new_status):
+        return Subquery(
+            ExperimentChangeLog.objects.filter(
+                experiment=OuterRef("pk"), old_status=old_status, new_status=new_status
+            )
+            .order_by("changed_on")
+            .annotate(changed_on_date=TruncDate("changed_on"))
+            .values("changed_on_date")[:1],
+            output_field=DateField(),
+        )
+
+    def computed_end_date(duration_field):
+        return Case(
+            When(
+                **{
+                    f"{duration_field}__gt": 0,
+                    f"{duration_field}__lte": ExperimentConstants.MAX_DURATION,
+                },
+                then=ExpressionWrapper(
+                    F("actual_start_date") + F(duration_field), output_field=DateField()
+                ),
+            ),
+            default=None,
+            output_field=DateField(),
+        )
+
+    Experiment.objects.update(
+        actual_start_date=Coalesce(
+            transition_date(
+                ExperimentConstants.STATUS_ACCEPTED, ExperimentConstants.STATUS_LIVE
+            ),
+            "proposed_start_date",
+        )
+    )
+    Experiment.objects.update(
+        actual_end_date=Coalesce(
+            transition_date(
+                ExperimentConstants.STATUS_LIVE, ExperimentConstants.STATUS_COMPLETE
+            ),
+            computed_end_date("proposed_duration"),
+        ),
+        actual_enrollment_end_date=computed_end_date("proposed_enrollment"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0099_experiment_bugzilla_update_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="actual_end_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="actual_enrollment_end_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="actual_start_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(
+            populate_lifecycle_dates, reverse_code=migrations.RunPython.noop
+        ),
+    ]
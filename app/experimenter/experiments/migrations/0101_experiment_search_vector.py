@@ -0,0 +1,56 @@
+# Generated by Django 3.0.14 on 2026-10-16 23:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+from experimenter.experiments.constants import ExperimentConstants
+
+
+def populate_search_vectors(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+
+    search_vector = None
+    for weight, fields in ExperimentConstants.SEARCH_VECTOR_WEIGHTS:
+        weighted_vector = SearchVector(*fields, weight=weight)
+        if search_vector is None:
+            search_vector = weighted_vector
+        else:
+            search_vector += weighted_vector
+
+    vectors = (
+        Experiment.objects.filter(pk=OuterRef("pk"))
+        .annotate(vector=search_vector)
+        .values("vector")
+    )
+    Experiment.objects.update(
+        search_vector=Subquery(vectors, output_field=SearchVectorField())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0100_experiment_lifecycle_dates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="experiment_search_vector_gin"
+            ),
+        ),
+        migrations.RunPython(
+            populate_search_vectors, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.0.14 on 2026-10-17 00:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0101_experiment_search_vector"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="experiment_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["slug"], name="experiment_slug_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["normandy_slug"],
+                name="experiment_normandy_slug_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["bugzilla_id"],
+                name="experiment_bugzilla_id_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 3.0.14 on 2026-10-17 00:31
+
+from django.db import migrations, models
+from django.db.models import F, Func, IntegerField, Value
+from django.db.models.functions import Cast
+
+from experimenter.experiments.constants import ExperimentConstants
+
+
+def populate_version_numbers(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+
+    def version_number(field):
+        return Cast(
+            Func(
+                F(field),
+                Value(ExperimentConstants.VERSION_REGEX.pattern),
+                function="substring",
+            ),
+            IntegerField(),
+        )
+
+    Experiment.objects.update(
+        firefox_min_version_number=version_number("firefox_min_version"),
+        firefox_max_version_number=version_number("firefox_max_version"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0102_experiment_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="firefox_max_version_number",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="firefox_min_version_number",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["firefox_min_version_number", "firefox_max_version_number"],
+                name="experiment_firefox_versions",
+            ),
+        ),
+        migrations.RunPython(
+            populate_version_numbers, reverse_code=migrations.RunPython.noop
+        ),
+    ]
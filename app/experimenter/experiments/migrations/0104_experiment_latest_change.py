@@ -0,0 +1,36 @@
+# Generated by Django 3.0.14 on 2026-10-17 00:52
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_latest_changes(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentChangeLog = apps.get_model("experiments", "ExperimentChangeLog")
+
+    latest_changes = (
+        ExperimentChangeLog.objects.filter(experiment=OuterRef("pk"))
+        .order_by("-changed_on")
+        .values("changed_on")[:1]
+    )
+    Experiment.objects.update(latest_change=Subquery(latest_changes))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("experiments", "0103_experiment_firefox_version_numbers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="latest_change",
+            field=models.DateTimeField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(
+            populate_latest_changes, reverse_code=migrations.RunPython.noop
+        ),
+    ]
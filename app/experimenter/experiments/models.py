@@ -9,10 +9,19 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator
 from django.db import models
-from django.db.models import Case, Max, Value, When
+from django.db.models import (
+    Case,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+    prefetch_related_objects,
+)
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -27,9 +36,43 @@ def default_all_platforms():
     return ExperimentConstants.PLATFORMS_LIST
 
 
+def get_version_number(version):
+    if version:
+        return int(ExperimentConstants.VERSION_REGEX.match(version).group(0))
+
+
+def get_search_vector():
+    # names and ids rank above descriptions, which rank above links
+    search_vector = None
+    for weight, fields in ExperimentConstants.SEARCH_VECTOR_WEIGHTS:
+        weighted_vector = SearchVector(*fields, weight=weight)
+        if search_vector is None:
+            search_vector = weighted_vector
+        else:
+            search_vector += weighted_vector
+    return search_vector
+
+
 class ExperimentManager(models.Manager):
-    def get_queryset(self):
-        return super().get_queryset().annotate(latest_change=Max("changes__changed_on"))
+    def update_search_vectors(self, **filters):
+        # the vector reads the owners' emails, which an UPDATE can't join to,
+        # so each row's vector is computed in a correlated subquery
+        vectors = (
+            self.filter(pk=OuterRef("pk"))
+            .annotate(vector=get_search_vector())
+            .values("vector")
+        )
+        return self.filter(**filters).update(
+            search_vector=Subquery(vectors, output_field=SearchVectorField())
+        )
+
+    def update_latest_changes(self, **filters):
+        latest_changes = (
+            ExperimentChangeLog.objects.filter(experiment=OuterRef("pk"))
+            .order_by("-changed_on")
+            .values("changed_on")[:1]
+        )
+        return self.filter(**filters).update(latest_change=Subquery(latest_changes))
 
     def get_prefetched(self):
         return self.get_queryset().prefetch_related(
@@ -42,6 +85,14 @@ class ExperimentManager(models.Manager):
             "countries",
         )
 
+    def get_bugzilla_prefetched(self):
+        # everything the Bugzilla bug templates read, see format_bug_body
+        return (
+            self.get_queryset()
+            .select_related("analysis_owner")
+            .prefetch_related("changes", "countries", "locales", "variants")
+        )
+
 
 class Experiment(ExperimentConstants, models.Model):
     type = models.CharField(
@@ -94,6 +145,11 @@ class Experiment(ExperimentConstants, models.Model):
         null=True,
         validators=[MaxValueValidator(ExperimentConstants.MAX_DURATION)],
     )
+    # start_date, end_date and enrollment_end_date as of the last save or
+    # status transition, stored so lists can filter by them in SQL
+    actual_start_date = models.DateField(blank=True, null=True, db_index=True)
+    actual_end_date = models.DateField(blank=True, null=True, db_index=True)
+    actual_enrollment_end_date = models.DateField(blank=True, null=True, db_index=True)
 
     message_type = models.CharField(
         max_length=255,
@@ -161,6 +217,14 @@ class Experiment(ExperimentConstants, models.Model):
         blank=True,
         null=True,
     )
+    # the major versions of firefox_min_version and firefox_max_version, so
+    # lists can compare versions numerically
+    firefox_min_version_number = models.PositiveIntegerField(
+        blank=True, null=True, editable=False
+    )
+    firefox_max_version_number = models.PositiveIntegerField(
+        blank=True, null=True, editable=False
+    )
     firefox_channel = models.CharField(
         max_length=255,
         choices=ExperimentConstants.CHANNEL_CHOICES,
@@ -206,9 +270,12 @@ class Experiment(ExperimentConstants, models.Model):
     engineering_owner = models.CharField(max_length=255, blank=True, null=True)
 
     bugzilla_id = models.CharField(max_length=255, blank=True, null=True)
+    # hash of the summary and user story last sent to the Bugzilla bug
+    bugzilla_update_hash = models.CharField(max_length=64, blank=True, null=True)
     normandy_slug = models.CharField(max_length=255, blank=True, null=True)
     normandy_id = models.PositiveIntegerField(blank=True, null=True)
     other_normandy_ids = ArrayField(models.IntegerField(), blank=True, null=True)
+    next_normandy_sync_on = models.DateTimeField(blank=True, null=True, db_index=True)
 
     data_science_issue_url = models.URLField(blank=True, null=True)
     feature_bugzilla_url = models.URLField(blank=True, null=True)
@@ -288,11 +355,57 @@ class Experiment(ExperimentConstants, models.Model):
     results_measure_impact = models.NullBooleanField(default=None, blank=True, null=True)
     results_impact_notes = models.TextField(blank=True, null=True)
 
+    # weighted text of the fields the list page searches, see get_search_vector
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+    # changed_on of the newest changelog, kept current as changelogs are written
+    latest_change = models.DateTimeField(
+        blank=True, null=True, db_index=True, editable=False
+    )
+
     objects = ExperimentManager()
 
+    LIFECYCLE_DATE_FIELDS = (
+        "actual_start_date",
+        "actual_end_date",
+        "actual_enrollment_end_date",
+    )
+
     class Meta:
         verbose_name = "Experiment"
         verbose_name_plural = "Experiments"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="experiment_search_vector_gin"),
+            GinIndex(
+                fields=["name"], name="experiment_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+            GinIndex(
+                fields=["slug"], name="experiment_slug_trgm", opclasses=["gin_trgm_ops"]
+            ),
+            GinIndex(
+                fields=["normandy_slug"],
+                name="experiment_normandy_slug_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["bugzilla_id"],
+                name="experiment_bugzilla_id_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            models.Index(
+                fields=["firefox_min_version_number", "firefox_max_version_number"],
+                name="experiment_firefox_versions",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        full_save = kwargs.get("update_fields") is None
+        if full_save:
+            self.update_lifecycle_dates()
+            self.firefox_min_version_number = self.firefox_min_version_integer
+            self.firefox_max_version_number = self.firefox_max_version_integer
+        super().save(*args, **kwargs)
+        if full_save:
+            Experiment.objects.update_search_vectors(id=self.id)
 
     def get_absolute_url(self):
         return reverse("experiments-detail", kwargs={"slug": self.slug})
@@ -470,6 +583,23 @@ class Experiment(ExperimentConstants, models.Model):
     def enrollment_end_date(self):
         return self._compute_end_date(self.proposed_enrollment)
 
+    def update_lifecycle_dates(self):
+        # the dates are read through a copy with a freshly fetched changelog,
+        # so a stale prefetch isn't used and a fresh one isn't left behind
+        experiment = copy.copy(self)
+        experiment._prefetched_objects_cache = {}
+        if experiment.id:
+            prefetch_related_objects([experiment], "changes")
+
+        self.actual_start_date = experiment.start_date
+        self.actual_end_date = experiment.end_date
+        self.actual_enrollment_end_date = experiment.enrollment_end_date
+        # a full save writes every column, so latest_change is refreshed
+        # too rather than writing back a stale value
+        self.latest_change = max(
+            (change.changed_on for change in experiment.changes.all()), default=None
+        )
+
     @property
     def observation_duration(self):
         if self.proposed_enrollment:
@@ -858,16 +988,11 @@ class Experiment(ExperimentConstants, models.Model):
 
     @property
     def firefox_max_version_integer(self):
-        if self.firefox_max_version:
-            return int(
-                ExperimentConstants.VERSION_REGEX.match(self.firefox_max_version).group(0)
-            )
+        return get_version_number(self.firefox_max_version)
 
     @property
     def firefox_min_version_integer(self):
-        return int(
-            ExperimentConstants.VERSION_REGEX.match(self.firefox_min_version).group(0)
-        )
+        return get_version_number(self.firefox_min_version)
 
     @property
     def use_branched_addon_serializer(self):
@@ -957,6 +1082,9 @@ class Experiment(ExperimentConstants, models.Model):
             "normandy_id",
             "other_normandy_ids",
             "bugzilla_id",
+            "bugzilla_update_hash",
+            "latest_change",
+            "next_normandy_sync_on",
             "review_science",
             "review_engineering",
             "review_qa_requested",
@@ -1118,6 +1246,13 @@ class ExperimentChangeLogManager(models.Manager):
     def latest(self):
         return self.all().order_by("-changed_on").first()
 
+    def bulk_create(self, changelogs, *args, **kwargs):
+        changelogs = super().bulk_create(changelogs, *args, **kwargs)
+        Experiment.objects.update_latest_changes(
+            id__in={changelog.experiment_id for changelog in changelogs}
+        )
+        return changelogs
+
 
 class ExperimentChangeLog(models.Model):
     STATUS_NONE_DRAFT = "Created Delivery"
@@ -1190,6 +1325,17 @@ class ExperimentChangeLog(models.Model):
         else:
             return self.pretty_status
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        Experiment.objects.update_latest_changes(id=self.experiment_id)
+        self.experiment.refresh_from_db(fields=["latest_change"])
+
+        # status transitions move the experiment's start and end dates
+        if self.old_status != self.new_status:
+            self.experiment.update_lifecycle_dates()
+            self.experiment.save(update_fields=Experiment.LIFECYCLE_DATE_FIELDS)
+
     @property
     def pretty_status(self):
         return self.PRETTY_STATUS_LABELS.get(self.old_status, {}).get(self.new_status, "")
@@ -1216,6 +1362,26 @@ class ExperimentEmail(ExperimentConstants, models.Model):
     sent_on = models.DateTimeField(auto_now_add=True)
 
 
+class ExperimentOutboxEmail(ExperimentConstants, models.Model):
+    experiment = models.ForeignKey(
+        Experiment, related_name="outbox_emails", on_delete=models.CASCADE
+    )
+    type = models.CharField(
+        max_length=255, blank=False, null=False, choices=Experiment.EMAIL_CHOICES
+    )
+    subject = models.TextField()
+    body = models.TextField()
+    recipients = ArrayField(models.EmailField(max_length=255))
+    cc_recipients = ArrayField(models.EmailField(max_length=255), default=list)
+    attempts = models.PositiveIntegerField(default=0)
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Experiment Outbox Email"
+        verbose_name_plural = "Experiment Outbox Emails"
+        ordering = ("attempts", "id")
+
+
 class ExperimentComment(ExperimentConstants, models.Model):
     experiment = models.ForeignKey(
         Experiment, related_name="comments", on_delete=models.CASCADE
@@ -12,10 +12,16 @@ from experimenter.experiments.api_views import (
     ExperimentDesignPrefView,
     ExperimentSendIntentToShipEmailView,
     ExperimentTimelinePopulationView,
+    ExperimentTypeaheadView,
 )
 
 
 urlpatterns = [
+    url(
+        r"^typeahead$",
+        ExperimentTypeaheadView.as_view(),
+        name="experiments-api-typeahead",
+    ),
     url(
         r"^(?P<slug>[\w-]+)/intent-to-ship-email$",
         ExperimentSendIntentToShipEmailView.as_view(),
@@ -4,10 +4,16 @@ from experimenter.experiments.api_views import (
     ExperimentDetailView,
     ExperimentListView,
     ExperimentRecipeView,
+    NormandyRecipeChangedView,
 )
 
 
 urlpatterns = [
+    url(
+        r"^normandy/recipe-changed/$",
+        NormandyRecipeChangedView.as_view(),
+        name="experiments-api-normandy-recipe-changed",
+    ),
     url(
         r"^(?P<slug>[\w-]+)/recipe/$",
         ExperimentRecipeView.as_view(),
@@ -33,6 +33,12 @@ class PrefTypeField(serializers.Field):
             return obj
 
 
+class ExperimentTypeaheadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Experiment
+        fields = ("name", "slug", "status")
+
+
 class ExperimentPreferenceSerializer(serializers.ModelSerializer):
     class Meta:
         model = VariantPreferences
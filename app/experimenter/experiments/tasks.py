@@ -1,17 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+import datetime
 import decimal
+import smtplib
+import time
+import uuid
 
 import markus
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError, transaction
+from django.core.mail import get_connection
+from django.db.models import (
+    BooleanField,
+    Case,
+    DateField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, TruncDate
 from django.conf import settings
+from django.utils import timezone
+from celery import chord
 from celery.utils.log import get_task_logger
+from redis.exceptions import LockError, RedisError
 
 from experimenter import bugzilla
 from experimenter import normandy
+from experimenter.base.redis_client import get_redis_client
+from experimenter.bugzilla.models import BugSnapshot
 from experimenter.celery import app
 from experimenter.experiments import email
 from experimenter.experiments.constants import ExperimentConstants
-from experimenter.experiments.models import Experiment, ExperimentEmail
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentChangeLog,
+    ExperimentEmail,
+    ExperimentOutboxEmail,
+)
+from experimenter.normandy.models import RecipeCache
 from experimenter.notifications.models import Notification
 
 
@@ -39,6 +70,16 @@ NOTIFICATION_MESSAGE_UPDATE_BUG_FAILED = (
     "Administrator on #ask-experimenter on Slack."
 )
 
+UPDATE_EXPERIMENT_BUG_PENDING = (
+    "experiments.tasks.update_experiment_bug.pending.{experiment_id}"
+)
+UPDATE_EXPERIMENT_INFO_LOCK = "experiments.tasks.update_experiment_info.lock"
+UPDATE_EXPERIMENT_INFO_PENDING = "experiments.tasks.update_experiment_info.pending"
+SUBSCRIBER_DIGEST_SENT_ON = "experiments.tasks.send_subscriber_digest.sent_on"
+
+# the number of decimal places population_percent is stored with
+POPULATION_PERCENT_PRECISION = decimal.Decimal("0.0001")
+
 STATUS_UPDATE_MAPPING = {
     Experiment.STATUS_ACCEPTED: Experiment.STATUS_LIVE,
     Experiment.STATUS_LIVE: Experiment.STATUS_COMPLETE,
@@ -54,9 +95,9 @@ NOTIFICATION_MESSAGE_ARCHIVE_ERROR_MESSAGE = (
 )
 
 
-@app.task
+@app.task(bind=True)
 @metrics.timer_decorator("create_experiment_bug.timing")
-def create_experiment_bug_task(user_id, experiment_id):
+def create_experiment_bug_task(self, user_id, experiment_id):
     metrics.incr("create_experiment_bug.started")
 
     experiment = Experiment.objects.get(id=experiment_id)
@@ -76,6 +117,8 @@ def create_experiment_bug_task(user_id, experiment_id):
         )
         metrics.incr("create_experiment_bug.completed")
         logger.info("Bugzilla ticket notification sent")
+    except bugzilla.BugzillaUnavailableError as e:
+        reschedule_bugzilla_task(self, "create_experiment_bug", e)
     except bugzilla.BugzillaError as e:
         metrics.incr("create_experiment_bug.failed")
         logger.info("Bugzilla ticket creation failed")
@@ -87,12 +130,46 @@ def create_experiment_bug_task(user_id, experiment_id):
         raise e
 
 
-@app.task
+def schedule_experiment_bug_update(user_id, experiment_id):
+    """
+    Update the experiment's Bugzilla bug in BUGZILLA_UPDATE_DEBOUNCE seconds.
+    Updates requested while one is pending are coalesced into it, it reads
+    the experiment's latest state when it runs.
+    """
+    try:
+        scheduled = get_redis_client().set(
+            UPDATE_EXPERIMENT_BUG_PENDING.format(experiment_id=experiment_id),
+            user_id,
+            nx=True,
+            ex=settings.BUGZILLA_UPDATE_DEBOUNCE * 2,
+        )
+    except RedisError as e:
+        logger.info(f"Error coalescing Bugzilla update: {e}")
+        scheduled = True
+
+    if not scheduled:
+        metrics.incr("update_experiment_bug.coalesced")
+        return
+
+    update_experiment_bug_task.apply_async(
+        (user_id, experiment_id), countdown=settings.BUGZILLA_UPDATE_DEBOUNCE
+    )
+
+
+@app.task(bind=True)
 @metrics.timer_decorator("update_experiment_bug.timing")
-def update_experiment_bug_task(user_id, experiment_id):
+def update_experiment_bug_task(self, user_id, experiment_id):
     metrics.incr("update_experiment_bug.started")
 
-    experiment = Experiment.objects.get(id=experiment_id)
+    # edits saved from now on need an update of their own
+    try:
+        get_redis_client().delete(
+            UPDATE_EXPERIMENT_BUG_PENDING.format(experiment_id=experiment_id)
+        )
+    except RedisError as e:
+        logger.info(f"Error clearing pending Bugzilla update: {e}")
+
+    experiment = Experiment.objects.get_bugzilla_prefetched().get(id=experiment_id)
 
     if experiment.risk_confidential:
         logger.info("Skipping Bugzilla update for internal only experiment")
@@ -101,7 +178,11 @@ def update_experiment_bug_task(user_id, experiment_id):
     logger.info("Updating Bugzilla Ticket")
 
     try:
-        bugzilla.update_experiment_bug(experiment)
+        if not bugzilla.update_experiment_bug(experiment):
+            metrics.incr("update_experiment_bug.skipped")
+            logger.info("Bugzilla Ticket unchanged, skipped update")
+            return
+
         logger.info("Bugzilla Ticket updated")
         Notification.objects.create(
             user_id=user_id,
@@ -111,6 +192,8 @@ def update_experiment_bug_task(user_id, experiment_id):
         )
         metrics.incr("update_experiment_bug.completed")
         logger.info("Bugzilla Update notification sent")
+    except bugzilla.BugzillaUnavailableError as e:
+        reschedule_bugzilla_task(self, "update_experiment_bug", e)
     except bugzilla.BugzillaError as e:
         Notification.objects.create(
             user_id=user_id, message=NOTIFICATION_MESSAGE_UPDATE_BUG_FAILED
@@ -120,21 +203,333 @@ def update_experiment_bug_task(user_id, experiment_id):
         raise e
 
 
+@app.task
+def warm_bugzilla_user_cache():
+    metrics.incr("warm_bugzilla_user_cache.started")
+
+    owners = (
+        Experiment.objects.exclude(archived=True)
+        .exclude(status=Experiment.STATUS_COMPLETE)
+        .values_list("owner__email", flat=True)
+        .distinct()
+    )
+
+    try:
+        bugzilla.warm_user_cache(owners)
+    except bugzilla.BugzillaError as e:
+        metrics.incr("warm_bugzilla_user_cache.failed")
+        logger.info(f"Failed to warm Bugzilla user cache: {e}")
+        return
+
+    metrics.incr("warm_bugzilla_user_cache.completed")
+
+
+@app.task
+@metrics.timer_decorator("reconcile_bugzilla_bugs.timing")
+def reconcile_bugzilla_bugs():
+    """
+    Snapshot the status and resolution of every tracked Bugzilla bug and
+    report the experiments whose bug was closed or reopened in Bugzilla
+    without the experiment being completed, archived or unarchived.
+    """
+    metrics.incr("reconcile_bugzilla_bugs.started")
+
+    tracked_experiments = {}
+    for experiment_id, bugzilla_id, status, archived in (
+        Experiment.objects.exclude(bugzilla_id=None)
+        .values_list("id", "bugzilla_id", "status", "archived")
+        .order_by()
+    ):
+        if bugzilla_id.isdigit():
+            tracked_experiments.setdefault(int(bugzilla_id), []).append(
+                (experiment_id, status, archived)
+            )
+
+    try:
+        bugs = bugzilla.get_bugs(tracked_experiments.keys())
+    except bugzilla.BugzillaError as e:
+        metrics.incr("reconcile_bugzilla_bugs.failed")
+        logger.info(f"Failed to fetch Bugzilla bugs: {e}")
+        return
+
+    BugSnapshot.objects.store_snapshots(bugs)
+
+    mismatched = 0
+    for bugzilla_id, bug_data in bugs.items():
+        bug_resolved = bug_data["status"] in BugSnapshot.RESOLVED_STATUSES
+        for experiment_id, status, archived in tracked_experiments[bugzilla_id]:
+            experiment_resolved = status == Experiment.STATUS_COMPLETE or archived
+            if bug_resolved != experiment_resolved:
+                mismatched += 1
+                logger.warning(
+                    f"Bug {bugzilla_id} is {bug_data['status']} "
+                    f"{bug_data['resolution']} but Experiment {experiment_id} is "
+                    f"{status}{' and archived' if archived else ''}"
+                )
+
+    logger.info(
+        f"Reconciled {len(bugs)} of {len(tracked_experiments)} Bugzilla bugs, "
+        f"{mismatched} mismatched"
+    )
+    metrics.gauge(
+        "reconcile_bugzilla_bugs.missing", value=len(tracked_experiments) - len(bugs)
+    )
+    metrics.gauge("reconcile_bugzilla_bugs.mismatched", value=mismatched)
+    metrics.incr("reconcile_bugzilla_bugs.completed")
+
+
+def reschedule_bugzilla_task(task, name, error):
+    # Bugzilla's circuit breaker is open, try again once it lets a probe through
+    metrics.incr(f"{name}.rescheduled")
+    logger.info(f"Bugzilla unavailable, rescheduling {name}")
+    raise task.retry(
+        exc=error, countdown=settings.CIRCUIT_BREAKER_RESET_TIMEOUT, max_retries=None
+    )
+
+
 @app.task
 @metrics.timer_decorator("update_experiment_info.timing")
 def update_experiment_info():
     metrics.incr("update_experiment_info.started")
+
+    lock_token = acquire_update_experiment_info_lock()
+    if lock_token is None:
+        return
+
     logger.info("Updating experiment info")
+    launched_experiments = get_due_experiments()
+
+    if not settings.NORMANDY_SYNC_FAN_OUT:
+        try:
+            results = sync_experiments(list(launched_experiments))
+        finally:
+            release_update_experiment_info_lock(lock_token)
+        update_experiment_info_completed([results])
+        return
 
+    # experiments sharing a recipe are kept in the same chunk so the
+    # revision cache is only updated once all of them were synced
+    normandy_ids = sorted(
+        set(
+            launched_experiments.exclude(normandy_id=None).values_list(
+                "normandy_id", flat=True
+            )
+        )
+    )
+    chunk_size = settings.NORMANDY_SYNC_CHUNK_SIZE
+    chunks = [
+        normandy_ids[offset:][:chunk_size]
+        for offset in range(0, len(normandy_ids), chunk_size)
+    ]
+    if not chunks:
+        update_experiment_info_completed([], lock_token=lock_token)
+        return
+
+    logger.info(f"Dispatching {len(normandy_ids)} recipes in {len(chunks)} chunks")
+    queue = settings.NORMANDY_SYNC_QUEUE
+    header = [update_experiment_info_chunk.s(chunk).set(queue=queue) for chunk in chunks]
+    callback = update_experiment_info_completed.s(lock_token=lock_token).set(queue=queue)
+    # a failed chunk means the callback never runs, so the lock is released
+    # by the error callback instead of waiting out its timeout
+    callback.link_error(update_experiment_info_failed.si(lock_token).set(queue=queue))
+    chord(header)(callback)
+
+
+@app.task(ignore_result=False)
+@metrics.timer_decorator("update_experiment_info_chunk.timing")
+def update_experiment_info_chunk(normandy_ids):
+    logger.info(f"Updating experiment info for recipes {normandy_ids}")
+    launched_experiments = Experiment.objects.filter(
+        status__in=[Experiment.STATUS_ACCEPTED, Experiment.STATUS_LIVE],
+        normandy_id__in=normandy_ids,
+    )
+    return sync_experiments(list(launched_experiments))
+
+
+@app.task
+def update_experiment_info_completed(results, lock_token=None):
+    totals = {"updated": 0, "unchanged": 0, "failed": 0, "written": 0}
+    for result in results:
+        for key in totals:
+            totals[key] += result[key]
+
+    for key, value in totals.items():
+        metrics.gauge(f"update_experiment_info.{key}", value=value)
+    logger.info(
+        "Updated experiment info: {updated} updated, {unchanged} unchanged, "
+        "{failed} failed, {written} written".format(**totals)
+    )
+    metrics.incr("update_experiment_info.completed")
+
+    if lock_token:
+        release_update_experiment_info_lock(lock_token)
+
+
+@app.task
+def update_experiment_info_failed(lock_token):
+    logger.info("Experiment info update failed")
+    metrics.incr("update_experiment_info.failed")
+    release_update_experiment_info_lock(lock_token)
+
+
+@app.task
+@metrics.timer_decorator("update_recipe_experiment_info.timing")
+def update_recipe_experiment_info(normandy_id):
+    metrics.incr("update_recipe_experiment_info.started")
+
+    recipe_experiments = Experiment.objects.filter(
+        status__in=[Experiment.STATUS_ACCEPTED, Experiment.STATUS_LIVE],
+        normandy_id=normandy_id,
+    )
+    # if a sync is already in flight the coalesced follow-up picks these up
+    recipe_experiments.update(next_normandy_sync_on=None)
+
+    lock_token = acquire_update_experiment_info_lock()
+    if lock_token is None:
+        return
+
+    logger.info(f"Updating experiment info for recipe {normandy_id}")
+    try:
+        results = sync_experiments(list(recipe_experiments))
+    finally:
+        release_update_experiment_info_lock(lock_token)
+
+    logger.info(
+        "Updated experiment info for recipe {normandy_id}: {updated} updated, "
+        "{unchanged} unchanged, {failed} failed, {written} written".format(
+            normandy_id=normandy_id, **results
+        )
+    )
+    metrics.incr("update_recipe_experiment_info.completed")
+
+
+def acquire_update_experiment_info_lock():
+    # only one sync may be in flight at a time, every tick that arrives
+    # while it runs is coalesced into a single follow-up run
+    redis_client = get_redis_client()
+    lock_token = uuid.uuid4().hex
+    lock = redis_client.lock(
+        UPDATE_EXPERIMENT_INFO_LOCK, timeout=settings.NORMANDY_SYNC_LOCK_TIMEOUT
+    )
+    if lock.acquire(blocking=False, token=lock_token):
+        # this run covers any follow-up requested before it started
+        redis_client.delete(UPDATE_EXPERIMENT_INFO_PENDING)
+        return lock_token
+
+    if redis_client.set(
+        UPDATE_EXPERIMENT_INFO_PENDING,
+        lock_token,
+        nx=True,
+        ex=settings.NORMANDY_SYNC_LOCK_TIMEOUT,
+    ):
+        metrics.incr("update_experiment_info.coalesced")
+        logger.info("Experiment info update in progress, scheduling a follow-up")
+    else:
+        metrics.incr("update_experiment_info.skipped")
+        logger.info("Experiment info update in progress, skipping")
+
+
+def release_update_experiment_info_lock(lock_token):
+    redis_client = get_redis_client()
+    lock = redis_client.lock(UPDATE_EXPERIMENT_INFO_LOCK, thread_local=False)
+    lock.local.token = lock_token
+    try:
+        lock.release()
+    except LockError:
+        logger.info("Experiment info update lock expired before it was released")
+
+    if redis_client.delete(UPDATE_EXPERIMENT_INFO_PENDING):
+        update_experiment_info.delay()
+
+
+def get_due_experiments():
+    """
+    Return the launched experiments that are due to be synced, along with
+    every other launched experiment that shares a recipe with them so that
+    a recipe is always synced for all of its experiments at once.
+    """
     launched_experiments = Experiment.objects.filter(
         status__in=[Experiment.STATUS_ACCEPTED, Experiment.STATUS_LIVE]
     )
+
+    # experiments due before the next beat are synced on this one
+    due_on = timezone.now() + datetime.timedelta(
+        seconds=settings.CELERY_SCHEDULE_INTERVAL / 2
+    )
+    due = Q(next_normandy_sync_on=None) | Q(next_normandy_sync_on__lte=due_on)
+    due_normandy_ids = (
+        launched_experiments.filter(due).exclude(normandy_id=None).values("normandy_id")
+    )
+    return launched_experiments.filter(due | Q(normandy_id__in=due_normandy_ids))
+
+
+def get_sync_interval(experiment):
+    intervals = settings.NORMANDY_SYNC_INTERVALS
+    today = datetime.date.today()
+    # the stored lifecycle dates are used so the changelog of every synced
+    # experiment isn't queried
+    ending_soon_on = today + datetime.timedelta(days=5)
+
+    if experiment.status == Experiment.STATUS_ACCEPTED:
+        return intervals["accepted"]
+
+    if experiment.proposed_start_date and (
+        experiment.proposed_start_date >= today - datetime.timedelta(days=1)
+    ):
+        return intervals["launching"]
+
+    if experiment.actual_end_date and experiment.actual_end_date <= ending_soon_on:
+        return intervals["ending"]
+
+    if experiment.is_paused:
+        return intervals["paused"]
+
+    if (
+        experiment.actual_enrollment_end_date
+        and experiment.actual_enrollment_end_date <= ending_soon_on
+    ):
+        return intervals["ending"]
+
+    return intervals["live"]
+
+
+def sync_experiments(launched_experiments):
+    """
+    Update the status, population and pause state of the given launched
+    experiments from their Normandy recipes. Returns the number of updated,
+    unchanged and failed experiments.
+    """
+    recipes = fetch_recipes(
+        [experiment.normandy_id for experiment in launched_experiments]
+    )
+    recipe_cache = RecipeCache.objects.in_bulk(recipes.keys(), field_name="normandy_id")
+
+    results = {"updated": 0, "unchanged": 0, "failed": 0}
+    processed_recipes = {}
+    failed_normandy_ids = set()
+    synced_experiments = []
+    changed_fields = {}
+    paused_experiments = []
+    completed_experiment_ids = []
     for experiment in launched_experiments:
         try:
             logger.info("Updating Experiment: {}".format(experiment))
             if experiment.normandy_id:
-                recipe_data = normandy.get_recipe(experiment.normandy_id)
+                recipe_data = recipes[experiment.normandy_id]
+                if isinstance(recipe_data, Exception):
+                    raise recipe_data
+
+                cached_recipe = recipe_cache.get(experiment.normandy_id)
+                if cached_recipe and cached_recipe.is_current(recipe_data):
+                    metrics.incr("update_experiment_info.cache.hit")
+                    results["unchanged"] += 1
+                    logger.info(
+                        "Skipping Experiment: {}. Recipe unchanged".format(experiment)
+                    )
+                    synced_experiments.append(experiment)
+                    continue
 
+                metrics.incr("update_experiment_info.cache.miss")
                 if needs_to_be_updated(recipe_data, experiment.status):
                     experiment = update_status_task(experiment, recipe_data)
 
@@ -143,40 +538,197 @@ def update_experiment_info():
                         email.send_experiment_launch_email(experiment)
 
                     elif experiment.status == Experiment.STATUS_COMPLETE:
-                        comp_experiment_update_res_task.delay(experiment.id)
+                        completed_experiment_ids.append(experiment.id)
 
                 if experiment.status == Experiment.STATUS_LIVE:
-                    update_population_percent(experiment, recipe_data)
-                    set_is_paused_value_task.delay(experiment.id, recipe_data)
-                    send_period_ending_emails_task(experiment)
+                    if update_population_percent(experiment, recipe_data):
+                        changed_fields.setdefault(experiment, set()).add(
+                            "population_percent"
+                        )
+                    if update_is_paused(experiment, recipe_data):
+                        changed_fields.setdefault(experiment, set()).add("is_paused")
+                        paused_experiments.append(experiment)
+
+                processed_recipes[experiment.normandy_id] = recipe_data
+                results["updated"] += 1
             else:
                 logger.info(
                     "Skipping Experiment: {}. No Normandy id found".format(experiment)
                 )
+            synced_experiments.append(experiment)
         except (IntegrityError, KeyError, normandy.NormandyError) as e:
+            failed_normandy_ids.add(experiment.normandy_id)
+            results["failed"] += 1
             logger.info(f"Failed to update Experiment {experiment}: {e}")
-    metrics.incr("update_experiment_info.completed")
 
+    # only remember revisions every experiment using the recipe was updated for
+    RecipeCache.objects.store_revisions(
+        {
+            normandy_id: recipe_data
+            for normandy_id, recipe_data in processed_recipes.items()
+            if normandy_id not in failed_normandy_ids
+        }
+    )
+
+    with transaction.atomic():
+        results["written"] = write_changed_fields(changed_fields)
+        create_pause_changelogs(paused_experiments)
+
+    # the bugs of experiments completed together are resolved in bulk
+    if completed_experiment_ids:
+        update_bug_resolutions_task.delay(completed_experiment_ids)
+
+    # failed experiments stay due and are retried on the next beat
+    synced_on = timezone.now()
+    for experiment in synced_experiments:
+        experiment.next_normandy_sync_on = synced_on + datetime.timedelta(
+            seconds=get_sync_interval(experiment)
+        )
+    Experiment.objects.bulk_update(synced_experiments, ["next_normandy_sync_on"])
+
+    return results
+
+
+def write_changed_fields(changed_fields):
+    """
+    Write the changed fields of each experiment with one bulk_update per
+    distinct set of changed fields, so only the touched columns of the
+    changed rows are written. Returns the number of rows written.
+    """
+    experiments_by_fields = {}
+    for experiment, fields in changed_fields.items():
+        experiments_by_fields.setdefault(frozenset(fields), []).append(experiment)
+
+    for fields, experiments in experiments_by_fields.items():
+        Experiment.objects.bulk_update(experiments, sorted(fields))
+
+    return len(changed_fields)
+
+
+def fetch_recipes(normandy_ids):
+    """
+    Fetch the approved revision of every recipe from the Normandy recipe list
+    endpoint in batches of NORMANDY_RECIPE_BATCH_SIZE, with up to
+    NORMANDY_FETCH_CONCURRENCY batches in flight at once. Batches are
+    requested conditionally with the validators stored in the RecipeCache,
+    and the cached recipes are used when Normandy reports them unchanged.
+    Returns a dict of normandy_id to either the recipe data or the error
+    raised while fetching it, so one failed batch does not stop the others
+    from being processed.
+    """
+    normandy_ids = sorted(set(filter(None, normandy_ids)))
+    if not normandy_ids:
+        return {}
+
+    recipe_cache = RecipeCache.objects.in_bulk(normandy_ids, field_name="normandy_id")
+
+    batch_size = settings.NORMANDY_RECIPE_BATCH_SIZE
+    batches = [
+        normandy_ids[offset:][:batch_size]
+        for offset in range(0, len(normandy_ids), batch_size)
+    ]
+
+    def fetch_batch(batch):
+        start = time.monotonic()
+        etag, last_modified = get_batch_validators(recipe_cache, batch)
+        modified = False
+        try:
+            batch_recipes, etag, last_modified = normandy.get_modified_recipes(
+                batch, etag, last_modified
+            )
+            modified = batch_recipes is not None
+        except (KeyError, normandy.NormandyError) as e:
+            batch_recipes = {normandy_id: e for normandy_id in batch}
+
+        if batch_recipes is None:
+            metrics.incr("update_experiment_info.fetch.not_modified")
+            batch_recipes = {
+                normandy_id: recipe_cache[normandy_id].recipe_data
+                for normandy_id in batch
+            }
+
+        for normandy_id in batch:
+            if normandy_id not in batch_recipes:
+                batch_recipes[normandy_id] = normandy.NonsuccessfulNormandyCall(
+                    f"Recipe {normandy_id} not found"
+                )
+
+        validators = (etag, last_modified) if modified else None
+        return batch_recipes, validators, time.monotonic() - start
+
+    start = time.monotonic()
+    max_workers = min(settings.NORMANDY_FETCH_CONCURRENCY, len(batches))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(fetch_batch, batches))
+    elapsed = time.monotonic() - start
+
+    requests_elapsed = sum(batch_elapsed for _, _, batch_elapsed in results)
+    speedup = requests_elapsed / elapsed if elapsed else 1
+    metrics.timing("update_experiment_info.fetch.timing", value=elapsed * 1000)
+    metrics.gauge("update_experiment_info.fetch.speedup", value=speedup)
+    logger.info(
+        f"Fetched {len(normandy_ids)} recipes in {len(batches)} batches in "
+        f"{elapsed:.2f}s ({requests_elapsed:.2f}s of requests, {speedup:.1f}x speedup)"
+    )
+
+    recipes = {}
+    for batch_recipes, validators, _ in results:
+        recipes.update(batch_recipes)
+
+        if validators is None:
+            continue
+
+        etag, last_modified = validators
+        RecipeCache.objects.store_recipes(
+            {
+                normandy_id: recipe_data
+                for normandy_id, recipe_data in batch_recipes.items()
+                if not isinstance(recipe_data, Exception)
+            },
+            etag=etag,
+            last_modified=last_modified,
+        )
+    return recipes
+
+
+def get_batch_validators(recipe_cache, batch):
+    # a batch can only be requested conditionally if every recipe in it was
+    # cached from the same response
+    cached_recipes = [recipe_cache.get(normandy_id) for normandy_id in batch]
+    validators = {
+        (cached_recipe.etag, cached_recipe.last_modified)
+        for cached_recipe in cached_recipes
+        if cached_recipe
+    }
+    if all(cached_recipes) and len(validators) == 1:
+        return validators.pop()
+    return "", ""
+
+
+@app.task(bind=True)
+@metrics.timer_decorator("update_bug_resolutions.timing")
+def update_bug_resolutions_task(self, experiment_ids):
+    metrics.incr("update_bug_resolutions.started")
+    experiments = list(
+        Experiment.objects.filter(id__in=experiment_ids).exclude(bugzilla_id=None)
+    )
+    logger.info(f"Updating Bugzilla Resolution of {len(experiments)} experiments")
 
-@app.task
-@metrics.timer_decorator("comp_experiment_update_res_task.timing")
-def comp_experiment_update_res_task(experiment_id):
-    experiment = Experiment.objects.get(id=experiment_id)
-    metrics.incr("comp_experiment_update_res_task.started")
-    logger.info("Updating Bugzilla Resolution")
     try:
-        bugzilla.update_bug_resolution(experiment)
-        logger.info("Bugzilla Resolution Updated")
-        metrics.incr("comp_experiment_update_res_task.completed")
-    except bugzilla.BugzillaError as e:
-        metrics.incr("comp_experiment_update_res_task.failed")
-        logger.info("update bug resolution failed")
-        raise e
+        errors = bugzilla.update_bug_resolutions(experiments)
+    except bugzilla.BugzillaUnavailableError as e:
+        reschedule_bugzilla_task(self, "update_bug_resolutions", e)
 
+    for experiment, error in errors.items():
+        logger.info(f"Failed to update Bugzilla Resolution of {experiment}: {error}")
+    metrics.gauge("update_bug_resolutions.failed", value=len(errors))
 
-@app.task
+    metrics.incr("update_bug_resolutions.completed")
+
+
+@app.task(bind=True)
 @metrics.timer_decorator("add_start_date_comment.timing")
-def add_start_date_comment_task(experiment_id):
+def add_start_date_comment_task(self, experiment_id):
     experiment = Experiment.objects.get(id=experiment_id)
     metrics.incr("add_start_data_comment.started")
     logger.info("Adding Bugzilla Start Date Comment")
@@ -188,6 +740,8 @@ def add_start_date_comment_task(experiment_id):
         bugzilla.add_experiment_comment(bugzilla_id, comment)
         logger.info("Bugzilla Comment Added")
         metrics.incr("add_start_date_comment.completed")
+    except bugzilla.BugzillaUnavailableError as e:
+        reschedule_bugzilla_task(self, "add_start_date_comment", e)
     except bugzilla.BugzillaError as e:
         logger.info("Comment start date failed to be added")
         metrics.incr("add_start_date_comment.failed")
@@ -211,58 +765,254 @@ def update_status_task(experiment, recipe_data):
     return experiment
 
 
-@app.task
-@metrics.timer_decorator("set_is_paused_value")
-def set_is_paused_value_task(experiment_id, recipe_data):
-    experiment = Experiment.objects.get(id=experiment_id)
+def update_is_paused(experiment, recipe_data):
+    # sets is_paused from the recipe's enrollment state and returns whether
+    # it changed, the caller is responsible for saving it
     if recipe_data:
         paused_val = is_paused(recipe_data)
         if paused_val is not None and paused_val != experiment.is_paused:
-            with transaction.atomic():
-                experiment.is_paused = paused_val
-                experiment.save()
-
-            message = (
-                "Enrollment Completed"
-                if experiment.is_paused
-                else "Enrollment Re-enabled"
-            )
-            normandy_user = settings.NORMANDY_DEFAULT_CHANGELOG_USER
-            default_user, _ = get_user_model().objects.get_or_create(
-                email=normandy_user, username=normandy_user
+            experiment.is_paused = paused_val
+            return True
+    return False
+
+
+def create_pause_changelogs(experiments):
+    if not experiments:
+        return
+
+    normandy_user = settings.NORMANDY_DEFAULT_CHANGELOG_USER
+    default_user, _ = get_user_model().objects.get_or_create(
+        email=normandy_user, username=normandy_user
+    )
+    ExperimentChangeLog.objects.bulk_create(
+        [
+            ExperimentChangeLog(
+                experiment=experiment,
+                changed_by=default_user,
+                message=(
+                    "Enrollment Completed"
+                    if experiment.is_paused
+                    else "Enrollment Re-enabled"
+                ),
             )
-            experiment.changes.create(message=message, changed_by=default_user)
+            for experiment in experiments
+        ]
+    )
 
 
 def update_population_percent(experiment, recipe_data):
+    # sets the population percent from the recipe's bucket sample and
+    # returns whether it changed, the caller is responsible for saving it
     if recipe_data and "filter_object" in recipe_data:
         filter_objects = {f["type"]: f for f in recipe_data["filter_object"]}
         if "bucketSample" in filter_objects:
             bucket_sample = filter_objects["bucketSample"]
-            experiment.population_percent = decimal.Decimal(
+            population_percent = decimal.Decimal(
                 bucket_sample["count"] / bucket_sample["total"] * 100
-            )
-            experiment.save()
+            ).quantize(POPULATION_PERCENT_PRECISION)
+            if population_percent != experiment.population_percent:
+                experiment.population_percent = population_percent
+                return True
+    return False
+
 
+@app.task
+@metrics.timer_decorator("send_period_ending_emails.timing")
+def send_period_ending_emails():
+    metrics.incr("send_period_ending_emails.started")
 
-def send_period_ending_emails_task(experiment):
-    # send experiment ending soon emails if end date is 5 days out
-    if experiment.ending_soon:
-        if not ExperimentEmail.objects.filter(
-            experiment=experiment, type=ExperimentConstants.EXPERIMENT_ENDS
-        ).exists():
+    queued = 0
+    for experiment in get_period_ending_experiments():
+        if experiment.ending_email_due:
             email.send_experiment_ending_email(experiment)
-            logger.info("Sent ending email for Experiment: {}".format(experiment))
-    # send enrollment ending emails if enrollment end
-    # date is 5 days out
-    if experiment.enrollment_end_date and experiment.enrollment_ending_soon:
-        if not ExperimentEmail.objects.filter(
-            experiment=experiment, type=ExperimentConstants.EXPERIMENT_PAUSES
-        ).exists():
+            logger.info("Queued ending email for Experiment: {}".format(experiment))
+            queued += 1
+        if experiment.pause_email_due:
             email.send_enrollment_pause_email(experiment)
             logger.info(
-                "Sent enrollment pause email for Experiment: {}".format(experiment)
+                "Queued enrollment pause email for Experiment: {}".format(experiment)
             )
+            queued += 1
+
+    metrics.gauge("send_period_ending_emails.queued", value=queued)
+    metrics.incr("send_period_ending_emails.completed")
+
+
+@app.task(bind=True)
+def send_outbox_emails(self):
+    """
+    Send a batch of queued emails over one SMTP connection. Each email is
+    claimed with a row lock so concurrent runs never send it twice, and is
+    only removed from the outbox once it was delivered. A full batch
+    queues another run, an SMTP failure retries the task later.
+    """
+    metrics.incr("send_outbox_emails.started")
+
+    sent = 0
+    # don't open an SMTP connection for an empty outbox
+    if not ExperimentOutboxEmail.objects.exists():
+        metrics.gauge("send_outbox_emails.sent", value=sent)
+        metrics.incr("send_outbox_emails.completed")
+        return
+
+    with get_connection() as connection:
+        while sent < settings.EMAIL_OUTBOX_BATCH_SIZE:
+            outbox_email_id = None
+            try:
+                with transaction.atomic():
+                    outbox_email = (
+                        ExperimentOutboxEmail.objects.select_for_update(skip_locked=True)
+                        .order_by("attempts", "id")
+                        .first()
+                    )
+                    if outbox_email is None:
+                        break
+
+                    outbox_email_id = outbox_email.id
+                    email.send_outbox_email(outbox_email, connection=connection)
+                    sent += 1
+            except (smtplib.SMTPException, OSError) as e:
+                logger.info(f"Error sending email {outbox_email_id}: {e}")
+                metrics.incr("send_outbox_emails.failed")
+                ExperimentOutboxEmail.objects.filter(id=outbox_email_id).update(
+                    attempts=F("attempts") + 1
+                )
+                metrics.gauge("send_outbox_emails.sent", value=sent)
+                raise self.retry(exc=e, countdown=settings.EMAIL_OUTBOX_RETRY_DELAY)
+
+    metrics.gauge("send_outbox_emails.sent", value=sent)
+    metrics.incr("send_outbox_emails.completed")
+
+    if sent == settings.EMAIL_OUTBOX_BATCH_SIZE:
+        send_outbox_emails.delay()
+
+
+@app.task
+def send_subscriber_digest():
+    if not settings.EMAIL_SUBSCRIBER_DIGEST:
+        return
+
+    metrics.incr("send_subscriber_digest.started")
+
+    redis_client = get_redis_client()
+    digest_until = timezone.now()
+    last_digest_on = redis_client.get(SUBSCRIBER_DIGEST_SENT_ON)
+    if last_digest_on:
+        digest_since = datetime.datetime.fromtimestamp(
+            float(last_digest_on), tz=datetime.timezone.utc
+        )
+    else:
+        digest_since = digest_until - datetime.timedelta(
+            seconds=settings.EMAIL_SUBSCRIBER_DIGEST_INTERVAL
+        )
+
+    sent = email.send_subscriber_digest_emails(
+        get_subscriber_digest_changes(digest_since, digest_until)
+    )
+    redis_client.set(SUBSCRIBER_DIGEST_SENT_ON, digest_until.timestamp())
+
+    logger.info(f"Sent subscriber digest to {sent} subscribers")
+    metrics.gauge("send_subscriber_digest.sent", value=sent)
+    metrics.incr("send_subscriber_digest.completed")
+
+
+def get_subscriber_digest_changes(digest_since, digest_until):
+    """
+    Return the launches, pauses, ends and other status changes made between
+    digest_since and digest_until, once for every subscriber of the changed
+    experiment, annotated with the subscriber's email as recipient and
+    ordered by it.
+    """
+    return (
+        ExperimentChangeLog.objects.filter(
+            changed_on__gt=digest_since, changed_on__lte=digest_until
+        )
+        .exclude(old_status=F("new_status"))
+        .annotate(recipient=F("experiment__subscribers__email"))
+        .filter(recipient__isnull=False)
+        .select_related("experiment")
+        .order_by("recipient", "experiment_id", "changed_on")
+    )
+
+
+def get_period_ending_experiments():
+    """
+    Return the live experiments whose duration or enrollment ends within
+    five days and that were not sent or queued the matching email yet, annotated
+    with ending_email_due and pause_email_due.
+    """
+    ending_on = datetime.date.today() + datetime.timedelta(days=5)
+
+    launched_on = (
+        ExperimentChangeLog.objects.filter(
+            experiment=OuterRef("pk"),
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+        .order_by("changed_on")
+        .annotate(changed_on_date=TruncDate("changed_on"))
+        .values("changed_on_date")[:1]
+    )
+    experiment_emails = ExperimentEmail.objects.filter(experiment=OuterRef("pk"))
+    outbox_emails = ExperimentOutboxEmail.objects.filter(experiment=OuterRef("pk"))
+
+    return (
+        Experiment.objects.filter(status=Experiment.STATUS_LIVE)
+        .annotate(
+            start_on=Coalesce(
+                Subquery(launched_on, output_field=DateField()), "proposed_start_date"
+            ),
+            ending_email_sent=Exists(
+                experiment_emails.filter(type=ExperimentConstants.EXPERIMENT_ENDS)
+            ),
+            pause_email_sent=Exists(
+                experiment_emails.filter(type=ExperimentConstants.EXPERIMENT_PAUSES)
+            ),
+            ending_email_queued=Exists(
+                outbox_emails.filter(type=ExperimentConstants.EXPERIMENT_ENDS)
+            ),
+            pause_email_queued=Exists(
+                outbox_emails.filter(type=ExperimentConstants.EXPERIMENT_PAUSES)
+            ),
+        )
+        .annotate(
+            end_on=ExpressionWrapper(
+                F("start_on") + F("proposed_duration"), output_field=DateField()
+            ),
+            enrollment_end_on=ExpressionWrapper(
+                F("start_on") + F("proposed_enrollment"), output_field=DateField()
+            ),
+        )
+        .annotate(
+            ending_email_due=Case(
+                When(
+                    proposed_duration__gt=0,
+                    proposed_duration__lte=Experiment.MAX_DURATION,
+                    end_on__lte=ending_on,
+                    ending_email_sent=False,
+                    ending_email_queued=False,
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            pause_email_due=Case(
+                When(
+                    proposed_enrollment__gt=0,
+                    proposed_enrollment__lte=Experiment.MAX_DURATION,
+                    enrollment_end_on__lte=ending_on,
+                    pause_email_sent=False,
+                    pause_email_queued=False,
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+        )
+        .filter(Q(ending_email_due=True) | Q(pause_email_due=True))
+        .select_related("owner")
+        .prefetch_related("changes")
+    )
 
 
 def needs_to_be_updated(recipe_data, status):
@@ -280,9 +1030,9 @@ def is_paused(recipe_data):
     return arguments.get("isEnrollmentPaused")
 
 
-@app.task
+@app.task(bind=True)
 @metrics.timer_decorator("update_bug_resolution.timing")
-def update_bug_resolution_task(user_id, experiment_id):
+def update_bug_resolution_task(self, user_id, experiment_id):
     metrics.incr("update_bug_resolution.started")
     experiment = Experiment.objects.get(id=experiment_id)
 
@@ -303,6 +1053,8 @@ def update_bug_resolution_task(user_id, experiment_id):
         )
         metrics.incr("update_bug_resolution.completed")
         logger.info("Bugzilla resolution update sent")
+    except bugzilla.BugzillaUnavailableError as e:
+        reschedule_bugzilla_task(self, "update_bug_resolution", e)
     except bugzilla.BugzillaError as e:
         metrics.incr("update_bug_resolution.failed")
         logger.info("Failed to update resolution of bugzilla ticket")
@@ -47,19 +47,11 @@ class MockTasksMixin(object):
 
         self.addCleanup(mock_tasks_add_start_date_comment_patcher.stop)
 
-        mock_tasks_comp_experiment_update_res_patcher = mock.patch(
-            "experimenter.experiments.tasks.comp_experiment_update_res_task"
+        mock_tasks_update_bug_resolutions_patcher = mock.patch(
+            "experimenter.experiments.tasks.update_bug_resolutions_task"
         )
-        self.mock_tasks_comp_experiment_update_res = (
-            mock_tasks_comp_experiment_update_res_patcher.start()
+        self.mock_tasks_update_bug_resolutions = (
+            mock_tasks_update_bug_resolutions_patcher.start()
         )
 
-        self.addCleanup(mock_tasks_comp_experiment_update_res_patcher.stop)
-
-        mock_tasks_set_is_paused_value_patcher = mock.patch(
-            "experimenter.experiments.tasks.set_is_paused_value_task"
-        )
-        self.mock_tasks_set_is_paused_value = (
-            mock_tasks_set_is_paused_value_patcher.start()
-        )
-        self.addCleanup(mock_tasks_set_is_paused_value_patcher.stop)
+        self.addCleanup(mock_tasks_update_bug_resolutions_patcher.stop)
@@ -1,11 +1,15 @@
+import hashlib
+import hmac
 import json
 
 from django.conf import settings
 from django.core import mail
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from parameterized import parameterized
+import mock
 
+from experimenter.base.tests.mixins import MockRedisMixin
 from experimenter.experiments.constants import ExperimentConstants
 from experimenter.experiments.models import Experiment
 from experimenter.experiments.serializers.entities import ExperimentSerializer
@@ -90,6 +94,95 @@ class TestExperimentDetailView(TestCase):
         self.assertEqual(serialized_experiment, json_data)
 
 
+class TestExperimentTypeaheadView(MockRedisMixin, TestCase):
+    def get_typeahead(self, query):
+        response = self.client.get(
+            reverse("experiments-api-typeahead"),
+            {"q": query},
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_matches_misspelled_names(self):
+        experiment = ExperimentFactory.create(name="Fluffy Kitten Delivery")
+        ExperimentFactory.create(name="Purple Monkey Dishwasher")
+
+        self.assertEqual(
+            self.get_typeahead("fluffy kiten delivery"),
+            [
+                {
+                    "name": experiment.name,
+                    "slug": experiment.slug,
+                    "status": experiment.status,
+                }
+            ],
+        )
+
+    def test_matches_partial_slugs_and_bug_numbers(self):
+        experiment_1 = ExperimentFactory.create(slug="fluffy-kitten-delivery")
+        experiment_2 = ExperimentFactory.create(bugzilla_id="1234567")
+
+        self.assertEqual(
+            [result["slug"] for result in self.get_typeahead("kitten-deliv")],
+            [experiment_1.slug],
+        )
+        self.assertEqual(
+            [result["slug"] for result in self.get_typeahead("34567")],
+            [experiment_2.slug],
+        )
+
+    def test_matches_partial_names_regardless_of_case(self):
+        experiment = ExperimentFactory.create(name="Pocket Recommendations in Germany")
+        ExperimentFactory.create(name="Purple Monkey Dishwasher")
+
+        self.assertEqual(
+            [result["slug"] for result in self.get_typeahead("Recommendations in")],
+            [experiment.slug],
+        )
+
+    @override_settings(EXPERIMENT_TYPEAHEAD_LIMIT=2)
+    def test_returns_limited_results(self):
+        for i in range(3):
+            ExperimentFactory.create(name=f"Fluffy Kitten {i}")
+
+        self.assertEqual(len(self.get_typeahead("fluffy kitten")), 2)
+
+    def test_results_are_cached(self):
+        experiment = ExperimentFactory.create(name="Fluffy Kitten Delivery")
+
+        results = self.get_typeahead("Fluffy Kitten")
+        experiment.delete()
+
+        self.assertEqual(self.get_typeahead(" fluffy  kitten "), results)
+        self.assertEqual(
+            self.redis.expiries[
+                "experiments.typeahead.{query_hash}".format(
+                    query_hash=hashlib.sha256(b"fluffy kitten").hexdigest()
+                )
+            ],
+            settings.EXPERIMENT_TYPEAHEAD_CACHE_TTL,
+        )
+
+    @override_settings(EXPERIMENT_TYPEAHEAD_MAX_LENGTH=13)
+    def test_long_queries_are_cut(self):
+        experiment = ExperimentFactory.create(name="Fluffy Kitten Delivery")
+
+        self.assertEqual(
+            [
+                result["slug"]
+                for result in self.get_typeahead("fluffy kitten" + "x" * 1000)
+            ],
+            [experiment.slug],
+        )
+        self.assertEqual(len(self.redis.data), 1)
+
+    def test_empty_query_returns_nothing(self):
+        ExperimentFactory.create()
+
+        self.assertEqual(self.get_typeahead(""), [])
+
+
 class TestExperimentRecipeView(TestCase):
     @parameterized.expand(
         [
@@ -129,8 +222,65 @@ class TestExperimentRecipeView(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+@override_settings(NORMANDY_WEBHOOK_SECRET="secret")
+class TestNormandyRecipeChangedView(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        mock_delay_patcher = mock.patch(
+            "experimenter.experiments.api_views.tasks."
+            "update_recipe_experiment_info.delay"
+        )
+        self.mock_update_recipe_delay = mock_delay_patcher.start()
+        self.addCleanup(mock_delay_patcher.stop)
+
+    def post_notification(self, data, secret="secret", signature=None):
+        body = json.dumps(data).encode()
+        if signature is None:
+            signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+        return self.client.post(
+            reverse("experiments-api-normandy-recipe-changed"),
+            body,
+            content_type="application/json",
+            HTTP_X_NORMANDY_SIGNATURE=signature,
+        )
+
+    def test_signed_notification_schedules_recipe_sync(self):
+        response = self.post_notification({"recipe_id": 1234})
+
+        self.assertEqual(response.status_code, 202)
+        self.mock_update_recipe_delay.assert_called_once_with(1234)
+
+    def test_notification_with_bad_signature_is_rejected(self):
+        response = self.post_notification({"recipe_id": 1234}, secret="wrong")
+
+        self.assertEqual(response.status_code, 403)
+        self.mock_update_recipe_delay.assert_not_called()
+
+    def test_notification_without_signature_is_rejected(self):
+        response = self.post_notification({"recipe_id": 1234}, signature="")
+
+        self.assertEqual(response.status_code, 403)
+        self.mock_update_recipe_delay.assert_not_called()
+
+    @override_settings(NORMANDY_WEBHOOK_SECRET="")
+    def test_notification_is_rejected_without_secret(self):
+        response = self.post_notification({"recipe_id": 1234}, secret="")
+
+        self.assertEqual(response.status_code, 403)
+        self.mock_update_recipe_delay.assert_not_called()
+
+    @parameterized.expand([({},), ({"recipe_id": "1234"},), ({"recipe_id": True},)])
+    def test_notification_without_recipe_id_returns_400(self, data):
+        response = self.post_notification(data)
+
+        self.assertEqual(response.status_code, 400)
+        self.mock_update_recipe_delay.assert_not_called()
+
+
 class TestExperimentSendIntentToShipEmailView(TestCase):
-    def test_put_to_view_sends_email(self):
+    def test_put_to_view_queues_email(self):
         user_email = "user@example.com"
 
         experiment = ExperimentFactory.create_with_variants(
@@ -150,7 +300,10 @@ class TestExperimentSendIntentToShipEmailView(TestCase):
 
         experiment = Experiment.objects.get(pk=experiment.pk)
         self.assertEqual(experiment.review_intent_to_ship, True)
-        self.assertEqual(len(mail.outbox), old_outbox_len + 1)
+        self.assertEqual(len(mail.outbox), old_outbox_len)
+        self.assertEqual(
+            experiment.outbox_emails.get().type, Experiment.INTENT_TO_SHIP_EMAIL_LABEL,
+        )
 
     def test_put_raises_409_if_email_already_sent(self):
         experiment = ExperimentFactory.create_with_variants(
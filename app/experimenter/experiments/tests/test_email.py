@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.conf import settings
 from django.core import mail
 from datetime import date
@@ -9,6 +9,7 @@ from experimenter.experiments.email import (
     send_experiment_ending_email,
     send_enrollment_pause_email,
 )
+from experimenter.experiments.tasks import send_outbox_emails
 from experimenter.experiments.tests.factories import ExperimentFactory, UserFactory
 from experimenter.experiments.constants import ExperimentConstants
 
@@ -34,6 +35,7 @@ class TestIntentToShipEmail(TestCase):
 
         with self.settings(EMAIL_SENDER=sender, EMAIL_RELEASE_DRIVERS=release_drivers):
             send_intent_to_ship_email(experiment.id)
+            send_outbox_emails()
 
         bug_url = settings.BUGZILLA_DETAIL_URL.format(id=experiment.bugzilla_id)
         expected_locales = self.format_locales(experiment)
@@ -82,6 +84,7 @@ class TestIntentToShipEmail(TestCase):
 
         with self.settings(EMAIL_SENDER=sender, EMAIL_RELEASE_DRIVERS=release_drivers):
             send_intent_to_ship_email(experiment.id)
+            send_outbox_emails()
 
         bug_url = settings.BUGZILLA_DETAIL_URL.format(id=experiment.bugzilla_id)
         expected_locales = self.format_locales(experiment)
@@ -138,6 +141,7 @@ class TestStatusUpdateEmail(TestCase):
 
     def test_send_experiment_launch_email(self):
         send_experiment_launch_email(self.experiment)
+        send_outbox_emails()
 
         sent_email = mail.outbox[-1]
 
@@ -159,6 +163,7 @@ class TestStatusUpdateEmail(TestCase):
 
     def test_send_experiment_ending_email(self):
         send_experiment_ending_email(self.experiment)
+        send_outbox_emails()
 
         sent_email = mail.outbox[-1]
 
@@ -180,6 +185,7 @@ class TestStatusUpdateEmail(TestCase):
 
     def test_send_experiment_pausing_email(self):
         send_enrollment_pause_email(self.experiment)
+        send_outbox_emails()
 
         sent_email = mail.outbox[-1]
 
@@ -201,3 +207,63 @@ class TestStatusUpdateEmail(TestCase):
             [self.experiment.owner.email, self.subscribing_user.email],
         )
         self.assertIn("May 6, 2019", sent_email.body)
+
+
+class TestQueuedEmail(TestCase):
+    def setUp(self):
+        self.experiment = ExperimentFactory.create_with_variants(
+            name="Greatest Experiment", firefox_channel="Nightly"
+        )
+
+    def test_email_is_queued_until_the_outbox_is_sent(self):
+        send_experiment_launch_email(self.experiment)
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertFalse(self.experiment.emails.exists())
+        outbox_email = self.experiment.outbox_emails.get()
+        self.assertEqual(outbox_email.type, ExperimentConstants.EXPERIMENT_STARTS)
+        self.assertEqual(outbox_email.recipients, [self.experiment.owner.email])
+
+        send_outbox_emails()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(self.experiment.outbox_emails.exists())
+        self.assertEqual(
+            list(self.experiment.emails.values_list("type", flat=True)),
+            [ExperimentConstants.EXPERIMENT_STARTS],
+        )
+
+    @override_settings(EMAIL_SUBSCRIBER_DIGEST=True)
+    def test_subscribers_are_left_to_the_digest(self):
+        subscriber = UserFactory.create()
+        self.experiment.subscribers.add(subscriber)
+
+        send_experiment_launch_email(self.experiment)
+        send_intent_to_ship_email(self.experiment.id)
+        send_experiment_ending_email(self.experiment)
+        send_enrollment_pause_email(self.experiment)
+
+        self.assertEqual(
+            self.experiment.outbox_emails.get(
+                type=ExperimentConstants.EXPERIMENT_STARTS
+            ).recipients,
+            [self.experiment.owner.email],
+        )
+        self.assertEqual(
+            self.experiment.outbox_emails.get(
+                type=ExperimentConstants.INTENT_TO_SHIP_EMAIL_LABEL
+            ).recipients,
+            [self.experiment.owner.email, subscriber.email],
+        )
+        self.assertEqual(
+            self.experiment.outbox_emails.get(
+                type=ExperimentConstants.EXPERIMENT_ENDS
+            ).recipients,
+            [self.experiment.owner.email, subscriber.email],
+        )
+        self.assertEqual(
+            self.experiment.outbox_emails.get(
+                type=ExperimentConstants.EXPERIMENT_PAUSES
+            ).recipients,
+            [self.experiment.owner.email, subscriber.email],
+        )
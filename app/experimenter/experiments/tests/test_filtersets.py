@@ -121,6 +121,19 @@ class TestExperimentFilterset(MockRequestMixin, TestCase):
         )
         self.assertEqual(set(filter.qs), set([exp_1, exp_2, exp_3]))
 
+    def test_filters_by_firefox_version_past_99(self):
+        exp_1 = ExperimentFactory.create_with_variants(
+            firefox_min_version="98.0", firefox_max_version="100.0"
+        )
+        ExperimentFactory.create_with_variants(
+            firefox_min_version="100.0", firefox_max_version=""
+        )
+
+        filter = ExperimentFilterset(
+            {"firefox_version": "99.0"}, queryset=Experiment.objects.all()
+        )
+        self.assertEqual(set(filter.qs), set([exp_1]))
+
     def test_filters_by_firefox_channel(self):
         include_channel = Experiment.CHANNEL_CHOICES[1][0]
         exclude_channel = Experiment.CHANNEL_CHOICES[2][0]
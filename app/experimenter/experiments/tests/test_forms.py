@@ -35,6 +35,7 @@ from experimenter.experiments.tests.factories import (
     ProjectFactory,
     UserFactory,
 )
+from experimenter.base.tests.mixins import MockRedisMixin
 from experimenter.bugzilla.tests.mixins import MockBugzillaMixin
 from experimenter.experiments.tests.mixins import MockTasksMixin, MockRequestMixin
 
@@ -875,7 +876,7 @@ class TestExperimentReviewForm(
 
 
 class TestExperimentStatusForm(
-    MockBugzillaMixin, MockRequestMixin, MockTasksMixin, TestCase
+    MockBugzillaMixin, MockRequestMixin, MockTasksMixin, MockRedisMixin, TestCase
 ):
     def test_form_allows_valid_state_transition_and_creates_changelog(self):
         experiment = ExperimentFactory.create_with_status(Experiment.STATUS_DRAFT)
@@ -938,8 +939,8 @@ class TestExperimentStatusForm(
         self.assertEqual(
             experiment.normandy_slug, "bug-12345-pref-experiment-name-nightly-57"
         )
-        self.mock_tasks_update_experiment_bug.delay.assert_called_with(
-            self.user.id, experiment.id
+        self.mock_tasks_update_experiment_bug.apply_async.assert_called_with(
+            (self.user.id, experiment.id), countdown=settings.BUGZILLA_UPDATE_DEBOUNCE
         )
 
 
@@ -2,6 +2,7 @@ import datetime
 import json
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchQuery
 from django.test import TestCase, override_settings
 from django.utils import timezone
 from django.db.utils import IntegrityError
@@ -25,7 +26,7 @@ from experimenter.experiments.tests.factories import (
 
 
 class TestExperimentManager(TestCase):
-    def test_queryset_annotated_with_latest_change(self):
+    def test_latest_change_follows_changelog(self):
         now = timezone.now()
         experiment1 = ExperimentFactory.create_with_variants()
         experiment2 = ExperimentFactory.create_with_variants()
@@ -60,6 +61,88 @@ class TestExperimentManager(TestCase):
             [experiment1, experiment2],
         )
 
+    def test_bulk_created_changelogs_update_latest_change(self):
+        now = timezone.now()
+        experiment1 = ExperimentFactory.create_with_variants()
+        experiment2 = ExperimentFactory.create_with_variants()
+        user = UserFactory.create()
+
+        ExperimentChangeLog.objects.bulk_create(
+            [
+                ExperimentChangeLog(
+                    experiment=experiment,
+                    changed_by=user,
+                    new_status=experiment.status,
+                    changed_on=now - datetime.timedelta(days=days),
+                )
+                for experiment, days in (
+                    (experiment1, 2),
+                    (experiment1, 1),
+                    (experiment2, 3),
+                )
+            ]
+        )
+
+        self.assertEqual(
+            dict(Experiment.objects.values_list("id", "latest_change")),
+            {
+                experiment1.id: now - datetime.timedelta(days=1),
+                experiment2.id: now - datetime.timedelta(days=3),
+            },
+        )
+
+    def test_full_save_keeps_latest_change(self):
+        experiment = ExperimentFactory.create_with_variants()
+        stale_experiment = Experiment.objects.get(id=experiment.id)
+
+        change = ExperimentChangeLogFactory.create(
+            experiment=experiment, old_status=None, new_status=Experiment.STATUS_DRAFT,
+        )
+
+        stale_experiment.name = "A Renamed Experiment"
+        stale_experiment.save()
+
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).latest_change, change.changed_on
+        )
+
+    def test_save_updates_search_vector(self):
+        experiment = ExperimentFactory.create(
+            name="Fluffy Cat",
+            slug="fluffy-pet",
+            public_name="Fluffy Pet",
+            short_description="A fluffy pet.",
+            public_description="A fluffy pet.",
+        )
+
+        self.assertEqual(
+            list(Experiment.objects.filter(search_vector=SearchQuery("cat"))),
+            [experiment],
+        )
+
+        experiment.name = "Fluffy Dog"
+        experiment.save()
+
+        self.assertFalse(
+            Experiment.objects.filter(search_vector=SearchQuery("cat")).exists()
+        )
+        self.assertEqual(
+            list(Experiment.objects.filter(search_vector=SearchQuery("dog"))),
+            [experiment],
+        )
+
+    def test_search_vector_includes_owner_email(self):
+        experiment = ExperimentFactory.create()
+
+        self.assertEqual(
+            list(
+                Experiment.objects.filter(
+                    search_vector=SearchQuery(experiment.owner.email)
+                )
+            ),
+            [experiment],
+        )
+
 
 class TestExperimentModel(TestCase):
     def test_get_absolute_url(self):
@@ -507,6 +590,42 @@ class TestExperimentModel(TestCase):
         )
         self.assertEqual(experiment.end_date, datetime.date(2019, 1, 21))
 
+    def test_save_stores_lifecycle_dates(self):
+        experiment = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+
+        experiment.proposed_start_date = datetime.date(2019, 2, 1)
+        experiment.save()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.actual_start_date, datetime.date(2019, 2, 1))
+        self.assertEqual(experiment.actual_end_date, datetime.date(2019, 2, 21))
+        self.assertEqual(
+            experiment.actual_enrollment_end_date, datetime.date(2019, 2, 11)
+        )
+
+    def test_status_transitions_store_lifecycle_dates(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_COMPLETE,
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+        launched, completed = experiment.changes.filter(
+            new_status__in=[Experiment.STATUS_LIVE, Experiment.STATUS_COMPLETE]
+        )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.actual_start_date, launched.changed_on.date())
+        self.assertEqual(experiment.actual_end_date, completed.changed_on.date())
+        self.assertEqual(
+            experiment.actual_enrollment_end_date,
+            launched.changed_on.date() + datetime.timedelta(days=10),
+        )
+
     def test_enrollment_ending_soon(self):
         experiment_1 = ExperimentFactory.create_with_variants(
             proposed_start_date=datetime.date.today(),
@@ -1310,6 +1429,18 @@ class TestExperimentModel(TestCase):
 
         self.assertEqual(experiment.firefox_min_version_integer, 57)
 
+    def test_save_stores_firefox_version_numbers(self):
+        experiment = ExperimentFactory(
+            firefox_min_version="99.0", firefox_max_version="100.0"
+        )
+
+        experiment.firefox_max_version = ""
+        experiment.save()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.firefox_min_version_number, 99)
+        self.assertIsNone(experiment.firefox_max_version_number)
+
     def test_use_branched_addon_serializer_returns_true_for_addon_and_greater_version(
         self,
     ):
@@ -1454,6 +1585,7 @@ class TestExperimentModel(TestCase):
             results_url="http://www.example.com",
             results_recipe_errors=True,
             results_restarts=True,
+            next_normandy_sync_on=timezone.now(),
         )
 
         experiment.clone("best experiment", user_2)
@@ -1482,6 +1614,7 @@ class TestExperimentModel(TestCase):
         )
         self.assertCountEqual(cloned_experiment.locales.all(), experiment.locales.all())
         self.assertFalse(cloned_experiment.bugzilla_id)
+        self.assertIsNone(cloned_experiment.next_normandy_sync_on)
         self.assertFalse(cloned_experiment.archived)
         self.assertFalse(cloned_experiment.review_science)
         self.assertFalse(cloned_experiment.review_ux)
@@ -1,10 +1,15 @@
-from datetime import date
+from datetime import date, timedelta
 import decimal
+import smtplib
 
 from django.conf import settings
 from django.core import mail
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from celery.exceptions import Retry
 from markus.testing import MetricsMock
+from parameterized import parameterized
+from redis.exceptions import RedisError
 from requests.exceptions import RequestException
 import markus
 import mock
@@ -13,10 +18,23 @@ from experimenter import bugzilla
 from experimenter import normandy
 from experimenter.experiments import tasks
 from experimenter.experiments.constants import ExperimentConstants
-from experimenter.experiments.models import Experiment, ExperimentEmail
-from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentChangeLog,
+    ExperimentEmail,
+    ExperimentOutboxEmail,
+)
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+    UserFactory,
+)
+from experimenter.base.tests.mixins import MockRedisMixin
+from experimenter.base.transport import CircuitOpenError
+from experimenter.bugzilla.models import BugSnapshot
 from experimenter.bugzilla.tests.mixins import MockBugzillaMixin
 from experimenter.experiments.tests.mixins import MockRequestMixin, MockTasksMixin
+from experimenter.normandy.models import RecipeCache
 from experimenter.normandy.tests.mixins import MockNormandyMixin
 from experimenter.notifications.models import Notification
 
@@ -121,6 +139,36 @@ class TestCreateBugTask(MockRequestMixin, MockBugzillaMixin, TestCase):
             notification.message, tasks.NOTIFICATION_MESSAGE_CREATE_BUG_FAILED
         )
 
+    def test_bugzilla_unavailable_reschedules_task(self):
+        self.mock_bugzilla_requests_get.side_effect = CircuitOpenError()
+
+        with mock.patch.object(
+            tasks.create_experiment_bug_task, "retry", return_value=Retry()
+        ) as mock_retry:
+            with self.assertRaises(Retry):
+                with MetricsMock() as mm:
+                    tasks.create_experiment_bug_task(self.user.id, self.experiment.id)
+
+                    self.assertTrue(
+                        mm.has_record(
+                            markus.INCR,
+                            "experiments.tasks.create_experiment_bug.rescheduled",
+                        )
+                    )
+                    self.assertFalse(
+                        mm.has_record(
+                            markus.INCR, "experiments.tasks.create_experiment_bug.failed"
+                        )
+                    )
+
+        mock_retry.assert_called_once_with(
+            exc=mock.ANY,
+            countdown=settings.CIRCUIT_BREAKER_RESET_TIMEOUT,
+            max_retries=None,
+        )
+        self.mock_bugzilla_requests_post.assert_not_called()
+        self.assertEqual(Notification.objects.count(), 0)
+
 
 class TestUpdateTask(MockRequestMixin, MockBugzillaMixin, TestCase):
     def setUp(self):
@@ -130,6 +178,35 @@ class TestUpdateTask(MockRequestMixin, MockBugzillaMixin, TestCase):
         self.experiment.bugzilla_id = self.bugzilla_id
         self.experiment.save()
 
+    def test_unchanged_experiment_bug_update_is_skipped(self):
+        tasks.update_experiment_bug_task(self.user.id, self.experiment.id)
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_bug_task(self.user.id, self.experiment.id)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.update_experiment_bug.skipped"
+                )
+            )
+
+        self.mock_bugzilla_requests_put.assert_called_once()
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_update_clears_pending_update(self):
+        tasks.schedule_experiment_bug_update(self.user.id, self.experiment.id)
+
+        with mock.patch.object(
+            tasks.update_experiment_bug_task, "apply_async"
+        ) as mock_apply_async:
+            tasks.update_experiment_bug_task(self.user.id, self.experiment.id)
+            tasks.schedule_experiment_bug_update(self.user.id, self.experiment.id)
+
+        mock_apply_async.assert_called_once_with(
+            (self.user.id, self.experiment.id),
+            countdown=settings.BUGZILLA_UPDATE_DEBOUNCE,
+        )
+
     def test_experiment_bug_successfully_updated(self):
         self.assertEqual(Notification.objects.count(), 0)
 
@@ -248,7 +325,134 @@ class TestUpdateTask(MockRequestMixin, MockBugzillaMixin, TestCase):
         self.assertEqual(Notification.objects.count(), 0)
 
 
-class TestUpdateExperimentTask(MockTasksMixin, MockNormandyMixin, TestCase):
+class TestWarmBugzillaUserCache(TestCase):
+    def test_warms_cache_for_current_owners(self):
+        experiment = ExperimentFactory.create(status=Experiment.STATUS_LIVE)
+        ExperimentFactory.create(status=Experiment.STATUS_DRAFT, owner=experiment.owner)
+        ExperimentFactory.create(status=Experiment.STATUS_DRAFT, archived=True)
+        ExperimentFactory.create(status=Experiment.STATUS_COMPLETE)
+
+        with mock.patch("experimenter.bugzilla.warm_user_cache") as mock_warm:
+            tasks.warm_bugzilla_user_cache()
+
+        owners = mock_warm.call_args[0][0]
+        self.assertEqual(list(owners), [experiment.owner.email])
+
+    def test_bugzilla_error_is_counted(self):
+        ExperimentFactory.create(status=Experiment.STATUS_LIVE)
+
+        with mock.patch(
+            "experimenter.bugzilla.warm_user_cache", side_effect=bugzilla.BugzillaError(),
+        ), MetricsMock() as mm:
+            tasks.warm_bugzilla_user_cache()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.warm_bugzilla_user_cache.failed"
+                )
+            )
+
+
+class TestReconcileBugzillaBugs(TestCase):
+    def test_stores_snapshots_and_reports_mismatches(self):
+        ExperimentFactory.create(status=Experiment.STATUS_LIVE, bugzilla_id="1")
+        ExperimentFactory.create(status=Experiment.STATUS_COMPLETE, bugzilla_id="2")
+        ExperimentFactory.create(status=Experiment.STATUS_LIVE, bugzilla_id="3")
+        ExperimentFactory.create(status=Experiment.STATUS_DRAFT, bugzilla_id="4")
+        ExperimentFactory.create(status=Experiment.STATUS_DRAFT, bugzilla_id=None)
+
+        bugs = {
+            1: {"status": "ASSIGNED", "resolution": ""},
+            2: {"status": "RESOLVED", "resolution": "FIXED"},
+            3: {"status": "RESOLVED", "resolution": "WONTFIX"},
+        }
+        with mock.patch(
+            "experimenter.bugzilla.get_bugs", return_value=bugs
+        ) as mock_get_bugs, MetricsMock() as mm:
+            tasks.reconcile_bugzilla_bugs()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE,
+                    "experiments.tasks.reconcile_bugzilla_bugs.mismatched",
+                    value=1,
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE,
+                    "experiments.tasks.reconcile_bugzilla_bugs.missing",
+                    value=1,
+                )
+            )
+
+        self.assertEqual(sorted(mock_get_bugs.call_args[0][0]), [1, 2, 3, 4])
+        self.assertEqual(
+            dict(BugSnapshot.objects.values_list("bugzilla_id", "status")),
+            {1: "ASSIGNED", 2: "RESOLVED", 3: "RESOLVED"},
+        )
+
+    def test_bugzilla_error_is_counted(self):
+        ExperimentFactory.create(status=Experiment.STATUS_LIVE, bugzilla_id="1")
+
+        with mock.patch(
+            "experimenter.bugzilla.get_bugs", side_effect=bugzilla.BugzillaError()
+        ), MetricsMock() as mm:
+            tasks.reconcile_bugzilla_bugs()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.reconcile_bugzilla_bugs.failed"
+                )
+            )
+
+        self.assertFalse(BugSnapshot.objects.exists())
+
+
+class TestScheduleExperimentBugUpdate(MockTasksMixin, MockRedisMixin, TestCase):
+    @override_settings(BUGZILLA_UPDATE_DEBOUNCE=30)
+    def test_updates_within_window_are_coalesced(self):
+        experiment = ExperimentFactory.create()
+
+        with MetricsMock() as mm:
+            for i in range(3):
+                tasks.schedule_experiment_bug_update(1, experiment.id)
+
+            self.assertEqual(
+                len(
+                    mm.filter_records(
+                        markus.INCR, "experiments.tasks.update_experiment_bug.coalesced"
+                    )
+                ),
+                2,
+            )
+
+        self.mock_tasks_update_experiment_bug.apply_async.assert_called_once_with(
+            (1, experiment.id), countdown=30
+        )
+
+    def test_updates_of_other_experiments_are_not_coalesced(self):
+        experiment_1 = ExperimentFactory.create()
+        experiment_2 = ExperimentFactory.create()
+
+        tasks.schedule_experiment_bug_update(1, experiment_1.id)
+        tasks.schedule_experiment_bug_update(1, experiment_2.id)
+
+        self.assertEqual(self.mock_tasks_update_experiment_bug.apply_async.call_count, 2)
+
+    def test_redis_errors_schedule_update(self):
+        experiment = ExperimentFactory.create()
+
+        with mock.patch.object(self.redis, "set", side_effect=RedisError()):
+            tasks.schedule_experiment_bug_update(1, experiment.id)
+            tasks.schedule_experiment_bug_update(1, experiment.id)
+
+        self.assertEqual(self.mock_tasks_update_experiment_bug.apply_async.call_count, 2)
+
+
+class TestUpdateExperimentTask(
+    MockTasksMixin, MockNormandyMixin, MockRedisMixin, TestCase
+):
     def test_update_accepted_experiment_task(self):
         experiment = ExperimentFactory.create(
             status=Experiment.STATUS_ACCEPTED,
@@ -259,17 +463,17 @@ class TestUpdateExperimentTask(MockTasksMixin, MockNormandyMixin, TestCase):
 
         tasks.update_experiment_info()
 
-        recipe = self.buildMockSuccessEnabledResponse().json()["approved_revision"]
-
         self.mock_tasks_add_start_date_comment.delay.assert_called_with(experiment.id)
-        self.mock_tasks_set_is_paused_value.delay.assert_called_with(
-            experiment.id, recipe
-        )
 
-        self.mock_tasks_comp_experiment_update_res.delay.assert_not_called()
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertTrue(experiment.is_paused)
+        self.assertEqual(experiment.changes.latest().message, "Enrollment Completed")
 
-        self.assertEqual(len(mail.outbox), 1)
-        self.assertEqual(mail.outbox[0].recipients(), [experiment.owner.email])
+        self.mock_tasks_update_bug_resolutions.delay.assert_not_called()
+
+        outbox_email = experiment.outbox_emails.get()
+        self.assertEqual(outbox_email.type, ExperimentConstants.EXPERIMENT_STARTS)
+        self.assertEqual(outbox_email.recipients, [experiment.owner.email])
 
     def test_update_live_experiment_task(self):
 
@@ -282,24 +486,80 @@ class TestUpdateExperimentTask(MockTasksMixin, MockNormandyMixin, TestCase):
         )
         tasks.update_experiment_info()
 
-        self.mock_tasks_comp_experiment_update_res.delay.assert_called_with(experiment.id)
+        self.mock_tasks_update_bug_resolutions.delay.assert_called_with([experiment.id])
 
-        self.mock_tasks_set_is_paused_value.delay.assert_not_called()
         self.mock_tasks_add_start_date_comment.delay.assert_not_called()
+        self.assertFalse(Experiment.objects.get(id=experiment.id).is_paused)
 
-        # No email was sent
-        self.assertEqual(len(mail.outbox), 0)
+        # No email was queued
+        self.assertFalse(experiment.outbox_emails.exists())
 
     def test_update_live_experiment_not_updated(self):
-        ExperimentFactory.create_with_status(
+        experiment = ExperimentFactory.create_with_status(
             target_status=Experiment.STATUS_LIVE, normandy_id=1234
         )
 
         tasks.update_experiment_info()
 
         self.mock_tasks_add_start_date_comment.delay.assert_not_called()
-        self.mock_tasks_comp_experiment_update_res.delay.assert_not_called()
-        self.mock_tasks_set_is_paused_value.delay.assert_called()
+        self.mock_tasks_update_bug_resolutions.delay.assert_not_called()
+        self.assertTrue(Experiment.objects.get(id=experiment.id).is_paused)
+
+    def test_update_live_experiments_pause_state(self):
+        paused_experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234, is_paused=False
+        )
+        enabled_experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1235, is_paused=True
+        )
+        unchanged_experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1236, is_paused=True
+        )
+        self.mock_normandy_requests_get.return_value = self.buildMockRecipesResponse(
+            {
+                normandy_id: {
+                    "id": revision_id,
+                    "enabled": True,
+                    "arguments": {"isEnrollmentPaused": paused},
+                }
+                for normandy_id, revision_id, paused in (
+                    (1234, 10, True),
+                    (1235, 11, False),
+                    (1236, 12, True),
+                )
+            }
+        )
+        changes_count = ExperimentChangeLog.objects.count()
+
+        with mock.patch.object(
+            ExperimentChangeLog.objects,
+            "bulk_create",
+            wraps=ExperimentChangeLog.objects.bulk_create,
+        ) as mock_bulk_create:
+            tasks.update_experiment_info()
+
+        mock_bulk_create.assert_called_once()
+        self.assertEqual(ExperimentChangeLog.objects.count(), changes_count + 2)
+
+        paused_experiment = Experiment.objects.get(id=paused_experiment.id)
+        self.assertTrue(paused_experiment.is_paused)
+        paused_change = paused_experiment.changes.latest()
+        self.assertEqual(paused_change.message, "Enrollment Completed")
+        self.assertEqual(
+            paused_change.changed_by.email, settings.NORMANDY_DEFAULT_CHANGELOG_USER
+        )
+
+        enabled_experiment = Experiment.objects.get(id=enabled_experiment.id)
+        self.assertFalse(enabled_experiment.is_paused)
+        self.assertEqual(
+            enabled_experiment.changes.latest().message, "Enrollment Re-enabled"
+        )
+
+        self.assertFalse(
+            unchanged_experiment.changes.filter(
+                changed_by__email=settings.NORMANDY_DEFAULT_CHANGELOG_USER
+            ).exists()
+        )
 
     def test_experiment_with_no_recipe_data(self):
         ExperimentFactory.create_with_status(
@@ -397,37 +657,6 @@ class TestUpdateExperimentTask(MockTasksMixin, MockNormandyMixin, TestCase):
         tasks.update_experiment_info()
         self.mock_normandy_requests_get.assert_not_called()
 
-    def test_send_experiment_ending_email(self):
-        ExperimentFactory.create(
-            status=Experiment.STATUS_LIVE,
-            normandy_id=1234,
-            proposed_start_date=date.today(),
-            proposed_enrollment=0,
-            proposed_duration=5,
-        )
-        ExperimentFactory.create(
-            status=Experiment.STATUS_LIVE,
-            normandy_id=1234,
-            proposed_start_date=date.today(),
-            proposed_duration=30,
-            proposed_enrollment=0,
-        )
-        exp_3 = ExperimentFactory.create(
-            status=Experiment.STATUS_LIVE,
-            normandy_id=1234,
-            proposed_start_date=date.today(),
-            proposed_duration=4,
-            proposed_enrollment=0,
-        )
-
-        ExperimentEmail.objects.create(
-            experiment=exp_3, type=ExperimentConstants.EXPERIMENT_ENDS
-        )
-
-        tasks.update_experiment_info()
-
-        self.assertEqual(len(mail.outbox), 1)
-
     def test_accepted_experiment_becomes_live_if_normandy_enabled(self):
 
         experiment = ExperimentFactory.create(
@@ -443,8 +672,14 @@ class TestUpdateExperimentTask(MockTasksMixin, MockNormandyMixin, TestCase):
         tasks.update_experiment_info()
         experiment = Experiment.objects.get(normandy_id=1234)
 
-        self.assertEqual(len(mail.outbox), 1)
-        self.assertEqual(mail.outbox[0].recipients(), [experiment.owner.email])
+        # the sync leaves the enrollment ending email to the periodic task
+        self.assertFalse(experiment.outbox_emails.exists())
+
+        tasks.send_period_ending_emails()
+
+        outbox_email = experiment.outbox_emails.get()
+        self.assertEqual(outbox_email.type, ExperimentConstants.EXPERIMENT_PAUSES)
+        self.assertEqual(outbox_email.recipients, [experiment.owner.email])
 
     def test_live_rollout_updates_population_percent(self):
         experiment = ExperimentFactory.create(
@@ -475,121 +710,1140 @@ class TestUpdateExperimentTask(MockTasksMixin, MockNormandyMixin, TestCase):
         experiment = Experiment.objects.get(normandy_id=1234)
         self.assertEqual(experiment.population_percent, decimal.Decimal("50.000"))
 
-
-class TestUpdateExperimentSubTask(MockNormandyMixin, MockBugzillaMixin, TestCase):
-    def test_update_status_task(self):
-        experiment = ExperimentFactory.create_with_status(
-            target_status=Experiment.STATUS_ACCEPTED
-        )
-        recipe_data = normandy.get_recipe(experiment.normandy_id)
-        tasks.update_status_task(experiment, recipe_data)
-        experiment = Experiment.objects.get(id=experiment.id)
-        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
-
-        self.assertTrue(
-            experiment.changes.filter(
-                changed_by__email="dev@example.com",
-                old_status=Experiment.STATUS_ACCEPTED,
-                new_status=Experiment.STATUS_LIVE,
-            ).exists()
+    def test_update_experiment_info_writes_only_changed_population_percent(self):
+        changed_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            normandy_id=1234,
+            population_percent=decimal.Decimal("25.000"),
         )
-
-    def test_add_start_date_comment_task(self):
-        experiment = ExperimentFactory.create(normandy_id=12345)
-        comment = "Start Date: {} End Date: {}".format(
-            experiment.start_date, experiment.end_date
+        unchanged_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            normandy_id=1235,
+            population_percent=decimal.Decimal("50.000"),
         )
-        expected_call_data = {"comment": comment}
-
-        tasks.add_start_date_comment_task(experiment.id)
-
-        self.mock_bugzilla_requests_post.assert_called_with(
-            settings.BUGZILLA_COMMENT_URL.format(id=12345), expected_call_data
+        self.mock_normandy_requests_get.return_value = self.buildMockRecipesResponse(
+            {
+                recipe_id: {
+                    "id": 10,
+                    "enabled": True,
+                    "filter_object": [
+                        {"type": "bucketSample", "count": 5000, "total": 10000}
+                    ],
+                }
+                for recipe_id in (1234, 1235)
+            }
         )
 
-    def test_add_start_date_comment_task_failure(self):
-        experiment = ExperimentFactory.create(normandy_id=12345)
+        with mock.patch.object(
+            Experiment.objects, "bulk_update", wraps=Experiment.objects.bulk_update
+        ) as mock_bulk_update:
+            with MetricsMock() as mm:
+                tasks.update_experiment_info()
 
-        self.mock_bugzilla_requests_post.side_effect = RequestException
-        with self.assertRaises(bugzilla.BugzillaError):
-            tasks.add_start_date_comment_task(experiment.id)
+                self.assertTrue(
+                    mm.has_record(
+                        markus.GAUGE,
+                        "experiments.tasks.update_experiment_info.written",
+                        value=1,
+                    )
+                )
 
-    def test_comp_experiment_update_res_task(self):
-        experiment = ExperimentFactory.create_with_status(
-            target_status=Experiment.STATUS_COMPLETE, normandy_id=12345
+        mock_bulk_update.assert_any_call([changed_experiment], ["population_percent"])
+        changed_experiment = Experiment.objects.get(id=changed_experiment.id)
+        unchanged_experiment = Experiment.objects.get(id=unchanged_experiment.id)
+        self.assertEqual(changed_experiment.population_percent, decimal.Decimal("50.000"))
+        self.assertEqual(
+            unchanged_experiment.population_percent, decimal.Decimal("50.000")
         )
 
-        expected_call_data = {"status": "RESOLVED", "resolution": "FIXED"}
-
-        tasks.comp_experiment_update_res_task(experiment.id)
-
-        self.mock_bugzilla_requests_put.assert_called_with(
-            settings.BUGZILLA_UPDATE_URL.format(id=experiment.bugzilla_id),
-            expected_call_data,
+    def test_update_experiment_info_fetches_each_recipe_once(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
         )
-
-    def test_comp_experiment_update_res_task_with_bug_error(self):
-        self.mock_bugzilla_requests_put.side_effect = RequestException()
-        experiment = ExperimentFactory.create_with_status(
-            target_status=Experiment.STATUS_COMPLETE, normandy_id=12345
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1235
         )
 
-        with self.assertRaises(bugzilla.BugzillaError):
-            tasks.comp_experiment_update_res_task(experiment.id)
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
 
-    def test_set_is_paused_value_task(self):
+            self.assertTrue(
+                mm.has_record(
+                    markus.TIMING, "experiments.tasks.update_experiment_info.fetch.timing"
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE, "experiments.tasks.update_experiment_info.fetch.speedup"
+                )
+            )
 
-        experiment = ExperimentFactory.create_with_status(
-            target_status=Experiment.STATUS_ACCEPTED, normandy_id=12345
+        self.mock_normandy_requests_get.assert_called_once_with(
+            settings.NORMANDY_API_RECIPES_URL,
+            params={"id_in": "1234,1235", "page_size": 2},
+            headers={},
+            verify=(not settings.DEBUG),
         )
-        recipe_data = normandy.get_recipe(experiment.normandy_id)
 
-        tasks.set_is_paused_value_task(experiment.id, recipe_data)
+    def test_update_experiment_info_skips_unchanged_recipe(self):
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            normandy_id=1234,
+            proposed_start_date=date.today(),
+            proposed_enrollment=0,
+            proposed_duration=5,
+        )
+        self.mock_normandy_requests_get.return_value = self.buildMockRecipesResponse(
+            {1234: {"id": 10, "enabled": True, "arguments": {}}}
+        )
+        RecipeCache.objects.create(normandy_id=1234, revision_id=10, enabled=True)
 
-        experiment = Experiment.objects.get(id=experiment.id)
+        with MetricsMock() as mm:
+            with mock.patch.object(tasks, "update_is_paused") as mock_update_is_paused:
+                tasks.update_experiment_info()
 
-        self.assertTrue(experiment.is_paused)
-        self.assertTrue(
-            experiment.changes.filter(
-                changed_by__email=settings.NORMANDY_DEFAULT_CHANGELOG_USER,
-                message="Enrollment Completed",
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.update_experiment_info.cache.hit"
+                )
+            )
+            self.assertFalse(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.update_experiment_info.cache.miss"
+                )
             )
+
+        mock_update_is_paused.assert_not_called()
+        self.assertIsNotNone(
+            Experiment.objects.get(id=experiment.id).next_normandy_sync_on
         )
 
-    def test_experiment_with_re_enabled_enrollment(self):
-        experiment = ExperimentFactory.create_with_status(
-            target_status=Experiment.STATUS_LIVE, normandy_id=1234, is_paused=True
+    def test_update_experiment_info_stores_processed_revision(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
         )
-        self.mock_normandy_requests_get.return_value = (
-            self.buildMockSucessWithNoPauseEnrollment()
+        self.mock_normandy_requests_get.return_value = self.buildMockRecipesResponse(
+            {1234: {"id": 10, "enabled": True, "arguments": {}}}
         )
-        recipe_data = normandy.get_recipe(experiment.normandy_id)
-        tasks.set_is_paused_value_task(experiment.id, recipe_data)
-        experiment = Experiment.objects.get(normandy_id=1234)
 
-        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
-        self.assertFalse(experiment.is_paused)
+        mock_update_is_paused_patcher = mock.patch.object(
+            tasks, "update_is_paused", wraps=tasks.update_is_paused
+        )
+        mock_update_is_paused = mock_update_is_paused_patcher.start()
+        self.addCleanup(mock_update_is_paused_patcher.stop)
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
 
-        self.assertEquals(experiment.changes.latest().message, "Enrollment Re-enabled")
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.update_experiment_info.cache.miss"
+                )
+            )
 
-    def test_set_is_paused_value_with_bad_recipe(self):
+        mock_update_is_paused.assert_called_once()
+        recipe_cache = RecipeCache.objects.get(normandy_id=1234)
+        self.assertEqual(recipe_cache.revision_id, 10)
+        self.assertTrue(recipe_cache.enabled)
 
-        experiment = ExperimentFactory.create_with_status(
-            target_status=Experiment.STATUS_ACCEPTED, normandy_id=12345
+        mock_update_is_paused.reset_mock()
+        Experiment.objects.update(next_normandy_sync_on=None)
+        tasks.update_experiment_info()
+        mock_update_is_paused.assert_not_called()
+
+    def test_update_experiment_info_does_not_store_failed_revision(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
+        )
+        self.mock_normandy_requests_get.return_value = self.buildMockRecipesResponse(
+            {1234: {"id": 10, "enabled": True}}
         )
-        recipe_data = {}
 
-        tasks.set_is_paused_value_task(experiment.id, recipe_data)
+        with mock.patch(
+            "experimenter.experiments.tasks.update_population_percent"
+        ) as mock_update_population_percent:
+            mock_update_population_percent.side_effect = [None, KeyError()]
+            tasks.update_experiment_info()
 
-        experiment = Experiment.objects.get(id=experiment.id)
+        recipe_cache = RecipeCache.objects.get(normandy_id=1234)
+        self.assertIsNone(recipe_cache.revision_id)
+        self.assertIsNone(recipe_cache.enabled)
 
-        self.assertFalse(experiment.is_paused)
-        self.assertFalse(
+
+class TestSendPeriodEndingEmails(TestCase):
+    def test_send_experiment_ending_email(self):
+        ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            proposed_start_date=date.today(),
+            proposed_enrollment=0,
+            proposed_duration=5,
+        )
+        ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            proposed_start_date=date.today(),
+            proposed_duration=30,
+            proposed_enrollment=0,
+        )
+        exp_3 = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            proposed_start_date=date.today(),
+            proposed_duration=4,
+            proposed_enrollment=0,
+        )
+        ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED,
+            proposed_start_date=date.today(),
+            proposed_duration=4,
+            proposed_enrollment=0,
+        )
+
+        ExperimentEmail.objects.create(
+            experiment=exp_3, type=ExperimentConstants.EXPERIMENT_ENDS
+        )
+
+        tasks.send_period_ending_emails()
+
+        self.assertEqual(ExperimentOutboxEmail.objects.count(), 1)
+
+    def test_send_enrollment_pause_email(self):
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            proposed_start_date=date.today() - timedelta(days=10),
+            proposed_enrollment=12,
+            proposed_duration=60,
+        )
+
+        tasks.send_period_ending_emails()
+
+        self.assertEqual(
+            list(experiment.outbox_emails.values_list("type", flat=True)),
+            [ExperimentConstants.EXPERIMENT_PAUSES],
+        )
+
+        tasks.send_period_ending_emails()
+        self.assertEqual(experiment.outbox_emails.count(), 1)
+
+        tasks.send_outbox_emails()
+        tasks.send_period_ending_emails()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(experiment.outbox_emails.exists())
+
+    def test_period_ending_uses_launch_date(self):
+        # launched over 100 days ago, long before its proposed start date
+        experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE,
+            proposed_start_date=date.today(),
+            proposed_enrollment=None,
+            proposed_duration=30,
+        )
+        self.assertTrue(experiment.ending_soon)
+
+        period_ending_experiment = tasks.get_period_ending_experiments().get()
+
+        self.assertEqual(period_ending_experiment, experiment)
+        self.assertEqual(period_ending_experiment.end_on, experiment.end_date)
+        self.assertTrue(period_ending_experiment.ending_email_due)
+
+    def test_period_ending_experiments_are_annotated(self):
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            proposed_start_date=date.today(),
+            proposed_enrollment=2,
+            proposed_duration=5,
+        )
+        ExperimentEmail.objects.create(
+            experiment=experiment, type=ExperimentConstants.EXPERIMENT_PAUSES
+        )
+
+        period_ending_experiment = tasks.get_period_ending_experiments().get()
+
+        self.assertTrue(period_ending_experiment.ending_email_due)
+        self.assertFalse(period_ending_experiment.pause_email_due)
+
+    def test_period_ending_emails_are_queued(self):
+        for i in range(3):
+            ExperimentFactory.create(
+                status=Experiment.STATUS_LIVE,
+                proposed_start_date=date.today(),
+                proposed_enrollment=2,
+                proposed_duration=5,
+            )
+
+        with MetricsMock() as mm:
+            tasks.send_period_ending_emails()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE,
+                    "experiments.tasks.send_period_ending_emails.queued",
+                    value=6,
+                )
+            )
+
+        self.assertEqual(ExperimentOutboxEmail.objects.count(), 6)
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class TestSendOutboxEmails(TestCase):
+    def setUp(self):
+        for i in range(3):
+            ExperimentOutboxEmail.objects.create(
+                experiment=ExperimentFactory.create(),
+                type=ExperimentConstants.EXPERIMENT_STARTS,
+                subject=f"Subject {i}",
+                body="Body",
+                recipients=["owner@example.com"],
+            )
+
+    def test_emails_are_sent_over_one_connection(self):
+        with mock.patch(
+            "experimenter.experiments.tasks.get_connection", wraps=tasks.get_connection,
+        ) as mock_get_connection:
+            with MetricsMock() as mm:
+                tasks.send_outbox_emails()
+
+                self.assertTrue(
+                    mm.has_record(
+                        markus.GAUGE, "experiments.tasks.send_outbox_emails.sent", value=3
+                    )
+                )
+
+        mock_get_connection.assert_called_once_with()
+        self.assertEqual(
+            [sent_email.subject for sent_email in mail.outbox],
+            ["Subject 0", "Subject 1", "Subject 2"],
+        )
+        self.assertEqual(
+            ExperimentEmail.objects.filter(
+                type=ExperimentConstants.EXPERIMENT_STARTS
+            ).count(),
+            3,
+        )
+        self.assertFalse(ExperimentOutboxEmail.objects.exists())
+
+    def test_empty_outbox_opens_no_connection(self):
+        ExperimentOutboxEmail.objects.all().delete()
+
+        with mock.patch(
+            "experimenter.experiments.tasks.get_connection"
+        ) as mock_get_connection:
+            tasks.send_outbox_emails()
+
+        mock_get_connection.assert_not_called()
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(EMAIL_OUTBOX_BATCH_SIZE=2)
+    def test_full_batch_queues_another_run(self):
+        with mock.patch.object(tasks.send_outbox_emails, "delay") as mock_delay:
+            tasks.send_outbox_emails()
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(ExperimentOutboxEmail.objects.count(), 1)
+        mock_delay.assert_called_once_with()
+
+    def test_failed_email_stays_queued_and_task_retries(self):
+        with mock.patch(
+            "experimenter.experiments.email.EmailMessage.send",
+            side_effect=[1, smtplib.SMTPServerDisconnected()],
+        ), mock.patch.object(
+            tasks.send_outbox_emails, "retry", return_value=Retry()
+        ) as mock_retry:
+            with self.assertRaises(Retry):
+                tasks.send_outbox_emails()
+
+        mock_retry.assert_called_once()
+
+        self.assertEqual(ExperimentEmail.objects.count(), 1)
+        self.assertEqual(
+            list(ExperimentOutboxEmail.objects.values_list("subject", "attempts")),
+            [("Subject 2", 0), ("Subject 1", 1)],
+        )
+
+
+@override_settings(EMAIL_SUBSCRIBER_DIGEST=True, EMAIL_SUBSCRIBER_DIGEST_INTERVAL=86400)
+class TestSendSubscriberDigest(MockRedisMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.subscriber = UserFactory.create(email="subscriber@example.com")
+        self.experiment = ExperimentFactory.create(name="Followed Experiment")
+        self.experiment.subscribers.add(self.subscriber)
+
+    def test_subscribers_get_one_digest_of_their_experiment_changes(self):
+        other_experiment = ExperimentFactory.create(name="Other Experiment")
+        other_experiment.subscribers.add(self.subscriber)
+        other_subscriber = UserFactory.create(email="other@example.com")
+        other_experiment.subscribers.add(other_subscriber)
+
+        ExperimentChangeLogFactory.create(
+            experiment=self.experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=self.experiment,
+            old_status=None,
+            new_status="",
+            message="Enrollment Completed",
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=other_experiment,
+            old_status=Experiment.STATUS_LIVE,
+            new_status=Experiment.STATUS_COMPLETE,
+        )
+
+        with MetricsMock() as mm:
+            tasks.send_subscriber_digest()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE, "experiments.tasks.send_subscriber_digest.sent", value=2
+                )
+            )
+
+        digests = {sent_email.to[0]: sent_email for sent_email in mail.outbox}
+        self.assertEqual(set(digests), {"subscriber@example.com", "other@example.com"})
+
+        digest = digests["subscriber@example.com"]
+        self.assertEqual(digest.subject, Experiment.SUBSCRIBER_DIGEST_EMAIL_SUBJECT)
+        self.assertEqual(digest.content_subtype, "html")
+        self.assertIn("Followed Experiment", digest.body)
+        self.assertIn("Launched Delivery", digest.body)
+        self.assertIn("Enrollment Completed", digest.body)
+        self.assertIn("Completed Delivery", digest.body)
+
+        other_digest = digests["other@example.com"]
+        self.assertNotIn("Followed Experiment", other_digest.body)
+        self.assertIn("Completed Delivery", other_digest.body)
+
+    def test_edits_are_not_included(self):
+        ExperimentChangeLogFactory.create(
+            experiment=self.experiment,
+            old_status=Experiment.STATUS_DRAFT,
+            new_status=Experiment.STATUS_DRAFT,
+        )
+
+        tasks.send_subscriber_digest()
+
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_digest_covers_changes_since_last_digest(self):
+        ExperimentChangeLogFactory.create(
+            experiment=self.experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=timezone.now() - timedelta(hours=2),
+        )
+        self.redis.set(
+            tasks.SUBSCRIBER_DIGEST_SENT_ON,
+            (timezone.now() - timedelta(hours=1)).timestamp(),
+        )
+
+        tasks.send_subscriber_digest()
+        self.assertEqual(len(mail.outbox), 0)
+
+        ExperimentChangeLogFactory.create(
+            experiment=self.experiment,
+            old_status=Experiment.STATUS_LIVE,
+            new_status=Experiment.STATUS_COMPLETE,
+        )
+
+        tasks.send_subscriber_digest()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertNotIn("Launched Delivery", mail.outbox[0].body)
+        self.assertIn("Completed Delivery", mail.outbox[0].body)
+
+    @override_settings(EMAIL_SUBSCRIBER_DIGEST=False)
+    def test_digest_is_not_sent_when_disabled(self):
+        ExperimentChangeLogFactory.create(
+            experiment=self.experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+
+        tasks.send_subscriber_digest()
+
+        self.assertEqual(len(mail.outbox), 0)
+
+
+@override_settings(
+    NORMANDY_SYNC_FAN_OUT=True, NORMANDY_SYNC_CHUNK_SIZE=2, NORMANDY_SYNC_QUEUE="sync"
+)
+class TestUpdateExperimentInfoFanOut(
+    MockTasksMixin, MockNormandyMixin, MockRedisMixin, TestCase
+):
+    def setUp(self):
+        super().setUp()
+
+        mock_chord_patcher = mock.patch("experimenter.experiments.tasks.chord")
+        self.mock_chord = mock_chord_patcher.start()
+        self.addCleanup(mock_chord_patcher.stop)
+
+    def test_update_experiment_info_dispatches_recipe_chunks(self):
+        for status, normandy_id in (
+            (Experiment.STATUS_LIVE, 1234),
+            (Experiment.STATUS_ACCEPTED, 1235),
+            (Experiment.STATUS_LIVE, 1234),
+            (Experiment.STATUS_ACCEPTED, 1236),
+            (Experiment.STATUS_LIVE, None),
+            (Experiment.STATUS_DRAFT, 1237),
+        ):
+            ExperimentFactory.create_with_status(
+                target_status=status, normandy_id=normandy_id
+            )
+
+        tasks.update_experiment_info()
+
+        header = self.mock_chord.call_args[0][0]
+        self.assertEqual(
+            [(signature.task, signature.args) for signature in header],
+            [
+                (tasks.update_experiment_info_chunk.name, ([1234, 1235],)),
+                (tasks.update_experiment_info_chunk.name, ([1236],)),
+            ],
+        )
+        self.assertEqual(
+            [signature.options["queue"] for signature in header], ["sync", "sync"]
+        )
+
+        callback = self.mock_chord.return_value.call_args[0][0]
+        self.assertEqual(callback.task, tasks.update_experiment_info_completed.name)
+        self.assertEqual(callback.options["queue"], "sync")
+        errback = callback.options["link_error"][0]
+        self.assertEqual(errback.task, tasks.update_experiment_info_failed.name)
+        self.assertTrue(errback.immutable)
+
+        self.mock_normandy_requests_get.assert_not_called()
+
+    def test_update_experiment_info_without_recipes_completes(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=None
+        )
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.update_experiment_info.completed"
+                )
+            )
+
+        self.mock_chord.assert_not_called()
+
+    def test_update_experiment_info_chunk_syncs_recipe_experiments(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1235
+        )
+
+        results = tasks.update_experiment_info_chunk([1234])
+
+        # the recipe pauses enrollment, which is written with the chunk
+        self.assertEqual(
+            results, {"updated": 1, "unchanged": 0, "failed": 0, "written": 1}
+        )
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
+        self.assertTrue(experiment.is_paused)
+        self.assertEqual(
+            Experiment.objects.get(normandy_id=1235).status, Experiment.STATUS_ACCEPTED
+        )
+
+    def test_update_experiment_info_completed_aggregates_results(self):
+        with MetricsMock() as mm:
+            tasks.update_experiment_info_completed(
+                [
+                    {"updated": 1, "unchanged": 2, "failed": 0, "written": 1},
+                    {"updated": 2, "unchanged": 0, "failed": 1, "written": 0},
+                ]
+            )
+
+            for key, value in (
+                ("updated", 3),
+                ("unchanged", 2),
+                ("failed", 1),
+                ("written", 1),
+            ):
+                self.assertTrue(
+                    mm.has_record(
+                        markus.GAUGE,
+                        f"experiments.tasks.update_experiment_info.{key}",
+                        value=value,
+                    )
+                )
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.update_experiment_info.completed"
+                )
+            )
+
+
+class TestUpdateExperimentInfoLock(
+    MockTasksMixin, MockNormandyMixin, MockRedisMixin, TestCase
+):
+    def setUp(self):
+        super().setUp()
+
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+
+        mock_delay_patcher = mock.patch.object(tasks.update_experiment_info, "delay")
+        self.mock_update_experiment_info_delay = mock_delay_patcher.start()
+        self.addCleanup(mock_delay_patcher.stop)
+
+    def test_update_experiment_info_releases_lock(self):
+        tasks.update_experiment_info()
+
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK))
+        self.assertEqual(
+            self.redis.expiries[tasks.UPDATE_EXPERIMENT_INFO_LOCK],
+            settings.NORMANDY_SYNC_LOCK_TIMEOUT,
+        )
+        self.mock_normandy_requests_get.assert_called_once()
+        self.mock_update_experiment_info_delay.assert_not_called()
+
+    def test_update_experiment_info_coalesces_ticks_while_locked(self):
+        self.redis.set(tasks.UPDATE_EXPERIMENT_INFO_LOCK, "other")
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+            tasks.update_experiment_info()
+            tasks.update_experiment_info()
+
+            self.assertEqual(
+                len(
+                    mm.filter_records(
+                        markus.INCR, "experiments.tasks.update_experiment_info.coalesced",
+                    )
+                ),
+                1,
+            )
+            self.assertEqual(
+                len(
+                    mm.filter_records(
+                        markus.INCR, "experiments.tasks.update_experiment_info.skipped"
+                    )
+                ),
+                2,
+            )
+            self.assertFalse(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.update_experiment_info.completed"
+                )
+            )
+
+        self.mock_normandy_requests_get.assert_not_called()
+        self.assertIsNotNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_PENDING))
+
+    def test_update_experiment_info_schedules_one_follow_up(self):
+        def tick_during_sync(*args, **kwargs):
+            tasks.update_experiment_info()
+            tasks.update_experiment_info()
+            return self.buildMockSuccessEnabledResponse()
+
+        self.mock_normandy_requests_get.side_effect = tick_during_sync
+
+        tasks.update_experiment_info()
+
+        self.mock_normandy_requests_get.assert_called_once()
+        self.mock_update_experiment_info_delay.assert_called_once_with()
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK))
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_PENDING))
+
+    def test_update_experiment_info_clears_follow_up_when_it_starts(self):
+        self.redis.set(tasks.UPDATE_EXPERIMENT_INFO_PENDING, "other")
+
+        tasks.update_experiment_info()
+
+        self.mock_normandy_requests_get.assert_called_once()
+        self.mock_update_experiment_info_delay.assert_not_called()
+
+    def test_update_experiment_info_releases_lock_on_error(self):
+        with mock.patch(
+            "experimenter.experiments.tasks.sync_experiments", side_effect=Exception
+        ):
+            with self.assertRaises(Exception):
+                tasks.update_experiment_info()
+
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK))
+
+    @override_settings(NORMANDY_SYNC_FAN_OUT=True)
+    def test_update_experiment_info_fan_out_releases_lock_on_failure(self):
+        with mock.patch("experimenter.experiments.tasks.chord") as mock_chord:
+            tasks.update_experiment_info()
+
+        callback = mock_chord.return_value.call_args[0][0]
+        errback = callback.options["link_error"][0]
+
+        tasks.update_experiment_info_failed(*errback.args)
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK))
+
+    def test_release_expired_lock(self):
+        tasks.release_update_experiment_info_lock("expired")
+
+        self.mock_update_experiment_info_delay.assert_not_called()
+
+    @override_settings(NORMANDY_SYNC_FAN_OUT=True)
+    def test_update_experiment_info_fan_out_releases_lock_on_completion(self):
+        with mock.patch("experimenter.experiments.tasks.chord") as mock_chord:
+            tasks.update_experiment_info()
+
+        lock_token = self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK)
+        self.assertIsNotNone(lock_token)
+
+        callback = mock_chord.return_value.call_args[0][0]
+        self.assertEqual(callback.kwargs, {"lock_token": lock_token.decode()})
+
+        tasks.update_experiment_info_completed([], **callback.kwargs)
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK))
+
+
+class TestUpdateRecipeExperimentInfo(
+    MockTasksMixin, MockNormandyMixin, MockRedisMixin, TestCase
+):
+    def setUp(self):
+        super().setUp()
+
+        mock_delay_patcher = mock.patch.object(tasks.update_experiment_info, "delay")
+        self.mock_update_experiment_info_delay = mock_delay_patcher.start()
+        self.addCleanup(mock_delay_patcher.stop)
+
+    def test_update_recipe_experiment_info_syncs_recipe_experiments(self):
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED,
+            normandy_id=1234,
+            next_normandy_sync_on=timezone.now() + timedelta(hours=1),
+        )
+        other_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED, normandy_id=1235
+        )
+
+        with MetricsMock() as mm:
+            tasks.update_recipe_experiment_info(1234)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_recipe_experiment_info.completed",
+                )
+            )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        other_experiment = Experiment.objects.get(id=other_experiment.id)
+        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
+        self.assertEqual(other_experiment.status, Experiment.STATUS_ACCEPTED)
+        self.mock_normandy_requests_get.assert_called_once()
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK))
+        self.mock_update_experiment_info_delay.assert_not_called()
+
+    def test_update_recipe_experiment_info_defers_to_running_sync(self):
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED,
+            normandy_id=1234,
+            next_normandy_sync_on=timezone.now() + timedelta(hours=1),
+        )
+        self.redis.set(tasks.UPDATE_EXPERIMENT_INFO_LOCK, "other")
+
+        tasks.update_recipe_experiment_info(1234)
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.status, Experiment.STATUS_ACCEPTED)
+        self.assertIsNone(experiment.next_normandy_sync_on)
+        self.assertIn(experiment, tasks.get_due_experiments())
+        self.mock_normandy_requests_get.assert_not_called()
+        self.assertIsNotNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_PENDING))
+
+    def test_update_recipe_experiment_info_releases_lock_on_error(self):
+        ExperimentFactory.create(status=Experiment.STATUS_ACCEPTED, normandy_id=1234)
+
+        with mock.patch(
+            "experimenter.experiments.tasks.sync_experiments", side_effect=Exception
+        ):
+            with self.assertRaises(Exception):
+                tasks.update_recipe_experiment_info(1234)
+
+        self.assertIsNone(self.redis.get(tasks.UPDATE_EXPERIMENT_INFO_LOCK))
+
+
+class TestUpdateExperimentInfoSchedule(
+    MockTasksMixin, MockNormandyMixin, MockRedisMixin, TestCase
+):
+    def test_get_due_experiments_includes_experiments_sharing_a_recipe(self):
+        now = timezone.now()
+        due_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE, normandy_id=1234, next_normandy_sync_on=None
+        )
+        shared_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            normandy_id=1234,
+            next_normandy_sync_on=now + timedelta(hours=1),
+        )
+        ExperimentFactory.create(
+            status=Experiment.STATUS_LIVE,
+            normandy_id=1235,
+            next_normandy_sync_on=now + timedelta(hours=1),
+        )
+        almost_due_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED,
+            normandy_id=1236,
+            next_normandy_sync_on=now + timedelta(seconds=10),
+        )
+        no_recipe_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED,
+            normandy_id=None,
+            next_normandy_sync_on=now - timedelta(hours=1),
+        )
+        ExperimentFactory.create(
+            status=Experiment.STATUS_DRAFT, normandy_id=1234, next_normandy_sync_on=None
+        )
+
+        self.assertEqual(
+            set(tasks.get_due_experiments()),
+            set(
+                [
+                    due_experiment,
+                    shared_experiment,
+                    almost_due_experiment,
+                    no_recipe_experiment,
+                ]
+            ),
+        )
+
+    @parameterized.expand(
+        [
+            ("accepted", {"status": Experiment.STATUS_ACCEPTED}, 1),
+            ("launching", {"proposed_start_date": date.today()}, 2),
+            ("ending", {"proposed_duration": 33}, 3),
+            ("paused", {"is_paused": True}, 5),
+            ("enrollment_ending", {"proposed_enrollment": 32}, 3),
+            ("enrolling", {"proposed_enrollment": 45}, 4),
+            ("live", {}, 4),
+        ]
+    )
+    @override_settings(
+        NORMANDY_SYNC_INTERVALS={
+            "accepted": 1,
+            "launching": 2,
+            "ending": 3,
+            "live": 4,
+            "paused": 5,
+        }
+    )
+    def test_get_sync_interval(self, name, fields, expected_interval):
+        experiment_fields = {
+            "status": Experiment.STATUS_LIVE,
+            "proposed_start_date": date.today() - timedelta(days=30),
+            "proposed_duration": 60,
+            "proposed_enrollment": None,
+            "is_paused": False,
+        }
+        experiment_fields.update(fields)
+        experiment = ExperimentFactory.create(**experiment_fields)
+
+        experiment = Experiment.objects.get(id=experiment.id)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(tasks.get_sync_interval(experiment), expected_interval)
+
+    def test_update_experiment_info_schedules_next_sync(self):
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED,
+            normandy_id=1234,
+            proposed_start_date=date.today() - timedelta(days=30),
+            proposed_duration=60,
+            proposed_enrollment=None,
+        )
+        self.mock_normandy_requests_get.return_value = (
+            self.buildMockSucessWithNoPauseEnrollment()
+        )
+        started_on = timezone.now()
+
+        tasks.update_experiment_info()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
+        live_interval = timedelta(seconds=settings.NORMANDY_SYNC_INTERVALS["live"])
+        self.assertGreaterEqual(
+            experiment.next_normandy_sync_on, started_on + live_interval
+        )
+        self.assertLessEqual(
+            experiment.next_normandy_sync_on, timezone.now() + live_interval
+        )
+
+        self.mock_normandy_requests_get.reset_mock()
+        tasks.update_experiment_info()
+        self.mock_normandy_requests_get.assert_not_called()
+
+    def test_update_experiment_info_keeps_failed_experiment_due(self):
+        self.setUpMockNormandyFailWithSpecifiedID("1234")
+        failed_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        synced_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_ACCEPTED, normandy_id=1235
+        )
+
+        tasks.update_experiment_info()
+
+        failed_experiment = Experiment.objects.get(id=failed_experiment.id)
+        synced_experiment = Experiment.objects.get(id=synced_experiment.id)
+        self.assertIsNone(failed_experiment.next_normandy_sync_on)
+        self.assertIsNotNone(synced_experiment.next_normandy_sync_on)
+
+
+class TestFetchRecipes(MockNormandyMixin, TestCase):
+    def test_fetch_recipes_returns_recipe_data_by_normandy_id(self):
+        with override_settings(NORMANDY_RECIPE_BATCH_SIZE=1):
+            recipes = tasks.fetch_recipes([1234, None, 1235, 1234])
+
+        recipe = self.buildMockSuccessEnabledResponse().json()["approved_revision"]
+        self.assertEqual(recipes, {1234: recipe, 1235: recipe})
+        self.assertEqual(self.mock_normandy_requests_get.call_count, 2)
+
+    def test_fetch_recipes_returns_errors_by_normandy_id(self):
+        self.mock_normandy_requests_get.side_effect = [
+            self.buildMockFailedResponse(),
+            RequestException(),
+        ]
+
+        with override_settings(
+            NORMANDY_FETCH_CONCURRENCY=1, NORMANDY_RECIPE_BATCH_SIZE=1
+        ):
+            recipes = tasks.fetch_recipes([1234, 1235])
+
+        self.assertIsInstance(recipes[1234], KeyError)
+        self.assertIsInstance(recipes[1235], normandy.APINormandyError)
+
+    def test_fetch_recipes_returns_error_for_missing_recipe(self):
+        self.setUpMockNormandyFailWithSpecifiedID("1234")
+
+        recipes = tasks.fetch_recipes([1234, 1235])
+
+        self.assertIsInstance(recipes[1234], normandy.NonsuccessfulNormandyCall)
+        self.assertTrue(recipes[1235]["enabled"])
+
+    def test_fetch_recipes_without_normandy_ids(self):
+        self.assertEqual(tasks.fetch_recipes([None]), {})
+        self.mock_normandy_requests_get.assert_not_called()
+
+    def test_fetch_recipes_stores_recipes_with_validators(self):
+        recipe = {"id": 10, "enabled": True}
+        self.mock_normandy_requests_get.side_effect = [
+            self.buildMockRecipesResponse(
+                {1234: recipe},
+                headers={"ETag": '"abc"', "Last-Modified": "Tue, 01 Sep 2020"},
+            ),
+            self.buildMockNotModifiedResponse(),
+        ]
+
+        self.assertEqual(tasks.fetch_recipes([1234]), {1234: recipe})
+
+        recipe_cache = RecipeCache.objects.get(normandy_id=1234)
+        self.assertEqual(recipe_cache.etag, '"abc"')
+        self.assertEqual(recipe_cache.last_modified, "Tue, 01 Sep 2020")
+        self.assertEqual(recipe_cache.recipe_data, recipe)
+
+        with MetricsMock() as mm:
+            self.assertEqual(tasks.fetch_recipes([1234]), {1234: recipe})
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_info.fetch.not_modified",
+                )
+            )
+
+        self.assertEqual(
+            self.mock_normandy_requests_get.call_args[1]["headers"],
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Tue, 01 Sep 2020"},
+        )
+
+    def test_fetch_recipes_updates_stored_recipes(self):
+        RecipeCache.objects.create(
+            normandy_id=1234, etag='"abc"', recipe_data={"id": 9}, revision_id=9
+        )
+        self.mock_normandy_requests_get.side_effect = [
+            self.buildMockRecipesResponse(
+                {1234: {"id": 10}, 1235: {"id": 20}}, headers={"ETag": '"def"'}
+            )
+        ]
+
+        tasks.fetch_recipes([1234, 1235])
+
+        # the batch was not requested conditionally since 1235 was not cached
+        self.assertEqual(self.mock_normandy_requests_get.call_args[1]["headers"], {})
+        self.assertEqual(
+            list(
+                RecipeCache.objects.order_by("normandy_id").values_list(
+                    "normandy_id", "etag", "recipe_data", "revision_id"
+                )
+            ),
+            [(1234, '"def"', {"id": 10}, 9), (1235, '"def"', {"id": 20}, None)],
+        )
+
+    def test_get_batch_validators_requires_matching_validators(self):
+        RecipeCache.objects.create(normandy_id=1234, etag='"abc"')
+        RecipeCache.objects.create(normandy_id=1235, etag='"def"')
+        recipe_cache = RecipeCache.objects.in_bulk(field_name="normandy_id")
+
+        self.assertEqual(tasks.get_batch_validators(recipe_cache, [1234]), ('"abc"', ""))
+        self.assertEqual(tasks.get_batch_validators(recipe_cache, [1234, 1235]), ("", ""))
+
+
+class TestUpdateExperimentSubTask(MockNormandyMixin, MockBugzillaMixin, TestCase):
+    def test_update_status_task(self):
+        experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED
+        )
+        recipe_data = normandy.get_recipe(experiment.normandy_id)
+        tasks.update_status_task(experiment, recipe_data)
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
+
+        self.assertTrue(
             experiment.changes.filter(
+                changed_by__email="dev@example.com",
+                old_status=Experiment.STATUS_ACCEPTED,
+                new_status=Experiment.STATUS_LIVE,
+            ).exists()
+        )
+
+    def test_add_start_date_comment_task(self):
+        experiment = ExperimentFactory.create(normandy_id=12345)
+        comment = "Start Date: {} End Date: {}".format(
+            experiment.start_date, experiment.end_date
+        )
+        expected_call_data = {"comment": comment}
+
+        tasks.add_start_date_comment_task(experiment.id)
+
+        self.mock_bugzilla_requests_post.assert_called_with(
+            settings.BUGZILLA_COMMENT_URL.format(id=12345), expected_call_data
+        )
+
+    def test_add_start_date_comment_task_failure(self):
+        experiment = ExperimentFactory.create(normandy_id=12345)
+
+        self.mock_bugzilla_requests_post.side_effect = RequestException
+        with self.assertRaises(bugzilla.BugzillaError):
+            tasks.add_start_date_comment_task(experiment.id)
+
+    def test_update_bug_resolutions_task_sends_one_call_per_resolution(self):
+        completed_experiments = [
+            ExperimentFactory.create(
+                status=Experiment.STATUS_COMPLETE, bugzilla_id=bugzilla_id
+            )
+            for bugzilla_id in ("1", "2")
+        ]
+        archived_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_DRAFT, archived=True, bugzilla_id="3"
+        )
+        no_bug_experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_COMPLETE, bugzilla_id=None
+        )
+
+        tasks.update_bug_resolutions_task(
+            [
+                completed_experiments[0].id,
+                completed_experiments[1].id,
+                archived_experiment.id,
+                no_bug_experiment.id,
+            ]
+        )
+
+        self.assertEqual(self.mock_bugzilla_requests_put.call_count, 2)
+        self.mock_bugzilla_requests_put.assert_has_calls(
+            [
+                mock.call(
+                    settings.BUGZILLA_UPDATE_URL.format(id="1"),
+                    {"resolution": "FIXED", "status": "RESOLVED", "ids": ["1", "2"]},
+                ),
+                mock.call(
+                    settings.BUGZILLA_UPDATE_URL.format(id="3"),
+                    {"resolution": "WONTFIX", "status": "RESOLVED", "ids": ["3"]},
+                ),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(Notification.objects.count(), 0)
+
+    @override_settings(BUGZILLA_BULK_UPDATE_SIZE=2)
+    def test_update_bug_resolutions_task_batches_large_groups(self):
+        experiment_ids = [
+            ExperimentFactory.create(
+                status=Experiment.STATUS_COMPLETE, bugzilla_id=str(bugzilla_id)
+            ).id
+            for bugzilla_id in range(5)
+        ]
+
+        tasks.update_bug_resolutions_task(experiment_ids)
+
+        self.assertEqual(self.mock_bugzilla_requests_put.call_count, 3)
+
+    def test_update_bug_resolutions_task_with_bug_error(self):
+        self.mock_bugzilla_requests_put.side_effect = RequestException()
+        experiment = ExperimentFactory.create(
+            status=Experiment.STATUS_COMPLETE, bugzilla_id="1"
+        )
+
+        with MetricsMock() as mm:
+            tasks.update_bug_resolutions_task([experiment.id])
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.GAUGE,
+                    "experiments.tasks.update_bug_resolutions.failed",
+                    value=1,
+                )
+            )
+
+    def test_update_is_paused(self):
+        experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=12345
+        )
+        recipe_data = normandy.get_recipe(experiment.normandy_id)
+
+        self.assertTrue(tasks.update_is_paused(experiment, recipe_data))
+        self.assertTrue(experiment.is_paused)
+        self.assertFalse(tasks.update_is_paused(experiment, recipe_data))
+
+    def test_update_is_paused_with_bad_recipe(self):
+        experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=12345
+        )
+
+        self.assertFalse(tasks.update_is_paused(experiment, {}))
+        self.assertFalse(experiment.is_paused)
+
+    def test_create_pause_changelogs(self):
+        paused_experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, is_paused=True
+        )
+        enabled_experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, is_paused=False
+        )
+
+        tasks.create_pause_changelogs([paused_experiment, enabled_experiment])
+
+        self.assertTrue(
+            paused_experiment.changes.filter(
                 changed_by__email=settings.NORMANDY_DEFAULT_CHANGELOG_USER,
                 message="Enrollment Completed",
             ).exists()
         )
+        self.assertEqual(
+            enabled_experiment.changes.latest().message, "Enrollment Re-enabled"
+        )
 
 
 class TestUpdateResolutionTask(MockRequestMixin, MockBugzillaMixin, TestCase):
@@ -3,6 +3,11 @@ import logging
 from django.conf import settings
 from django.contrib.auth import get_user_model
 
+from experimenter.base.transport import Transport
+
+
+transport = Transport("normandy")
+
 
 class NormandyError(Exception):
     pass
@@ -20,11 +25,28 @@ class NormandyDecodeError(NormandyError):
     message = "Error parsing JSON Normandy Response"
 
 
-def make_normandy_call(url):
+def make_normandy_call(url, params=None):
+    data, _ = make_conditional_normandy_call(url, params)
+    return data
+
+
+def make_conditional_normandy_call(url, params=None, etag="", last_modified=""):
+    # returns the decoded data and the response, or no data if Normandy
+    # answers 304 Not Modified to the given validators
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
     try:
-        response = requests.get(url, verify=(not settings.DEBUG))
+        response = transport.get(
+            url, params=params, headers=headers, verify=(not settings.DEBUG)
+        )
         response.raise_for_status()
-        return response.json()
+        if response.status_code == 304:
+            return None, response
+        return response.json(), response
     except requests.exceptions.HTTPError as e:
         logging.exception(
             "Normandy API returned Nonsuccessful Response Code: {}".format(e)
@@ -44,6 +66,49 @@ def get_recipe(recipe_id):
     return recipe_data["approved_revision"]
 
 
+def get_recipes(recipe_ids):
+    recipes, _, _ = get_modified_recipes(recipe_ids)
+    return recipes
+
+
+def get_modified_recipes(recipe_ids, etag="", last_modified=""):
+    # fetch many recipes from the paginated recipe list endpoint and
+    # return a dict of recipe id to approved revision along with the
+    # validators of the response, or no recipes if nothing changed since
+    # the response the given validators came from
+    recipe_ids = set(recipe_ids)
+    recipes = {}
+
+    page_data, response = make_conditional_normandy_call(
+        settings.NORMANDY_API_RECIPES_URL,
+        params={
+            "id_in": ",".join(str(recipe_id) for recipe_id in sorted(recipe_ids)),
+            "page_size": len(recipe_ids),
+        },
+        etag=etag,
+        last_modified=last_modified,
+    )
+    if page_data is None:
+        return None, etag, last_modified
+
+    # the validators only describe the first page
+    etag = last_modified = ""
+    if not page_data.get("next"):
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+
+    while page_data:
+        for recipe in page_data["results"]:
+            if recipe["id"] in recipe_ids:
+                recipes[recipe["id"]] = recipe["approved_revision"]
+
+        # the next page url already carries the query parameters
+        next_url = page_data.get("next")
+        page_data = make_normandy_call(next_url) if next_url else None
+
+    return recipes, etag, last_modified
+
+
 def get_recipe_state_enabler(recipe_data):
     # set email default if no email/creator is found in normandy
     enabler_email = settings.NORMANDY_DEFAULT_CHANGELOG_USER
@@ -0,0 +1,43 @@
+# Generated by Django 3.0.14 on 2026-10-16 20:51
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="RecipeCache",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("normandy_id", models.PositiveIntegerField(unique=True)),
+                ("etag", models.CharField(blank=True, max_length=255)),
+                ("last_modified", models.CharField(blank=True, max_length=255)),
+                (
+                    "recipe_data",
+                    django.contrib.postgres.fields.jsonb.JSONField(blank=True, null=True),
+                ),
+                ("revision_id", models.PositiveIntegerField(blank=True, null=True)),
+                ("enabled", models.NullBooleanField(default=None)),
+                ("updated_on", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "verbose_name": "Recipe Cache",
+                "verbose_name_plural": "Recipe Caches",
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+from django.utils import timezone
+
+
+class RecipeCacheManager(models.Manager):
+    def store_recipes(self, recipes, etag="", last_modified=""):
+        cached_recipes = self.in_bulk(recipes.keys(), field_name="normandy_id")
+        updated_on = timezone.now()
+
+        new_recipes = []
+        for normandy_id, recipe_data in recipes.items():
+            recipe_cache = cached_recipes.get(normandy_id)
+            if recipe_cache is None:
+                recipe_cache = self.model(normandy_id=normandy_id)
+                new_recipes.append(recipe_cache)
+
+            recipe_cache.etag = etag
+            recipe_cache.last_modified = last_modified
+            recipe_cache.recipe_data = recipe_data
+            recipe_cache.updated_on = updated_on
+
+        self.bulk_create(new_recipes, ignore_conflicts=True)
+        self.bulk_update(
+            cached_recipes.values(),
+            ["etag", "last_modified", "recipe_data", "updated_on"],
+        )
+
+    def store_revisions(self, recipes):
+        cached_recipes = self.in_bulk(recipes.keys(), field_name="normandy_id")
+        updated_on = timezone.now()
+
+        for normandy_id, recipe_cache in cached_recipes.items():
+            recipe_data = recipes[normandy_id] or {}
+            recipe_cache.revision_id = recipe_data.get("id")
+            recipe_cache.enabled = recipe_data.get("enabled")
+            recipe_cache.updated_on = updated_on
+
+        self.bulk_update(
+            cached_recipes.values(), ["revision_id", "enabled", "updated_on"]
+        )
+
+
+class RecipeCache(models.Model):
+    normandy_id = models.PositiveIntegerField(unique=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=255, blank=True)
+    recipe_data = JSONField(blank=True, null=True)
+    revision_id = models.PositiveIntegerField(blank=True, null=True)
+    enabled = models.NullBooleanField(default=None, blank=True, null=True)
+    updated_on = models.DateTimeField(default=timezone.now)
+
+    objects = RecipeCacheManager()
+
+    class Meta:
+        verbose_name = "Recipe Cache"
+        verbose_name_plural = "Recipe Caches"
+
+    def __str__(self):  # pragma: no cover
+        return str(self.normandy_id)
+
+    def is_current(self, recipe_data):
+        # the last processed revision still matches if neither the
+        # approved revision nor its enabled state have changed
+        return (
+            bool(recipe_data)
+            and self.revision_id is not None
+            and self.revision_id == recipe_data.get("id")
+            and self.enabled == recipe_data.get("enabled")
+        )
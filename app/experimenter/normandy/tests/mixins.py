@@ -6,13 +6,49 @@ class MockNormandyMixin(object):
         super().setUp()
 
         mock_normandy_requests_get_patcher = mock.patch(
-            "experimenter.normandy.client.requests.get"
+            "experimenter.normandy.client.transport.get"
         )
         self.mock_normandy_requests_get = mock_normandy_requests_get_patcher.start()
         self.addCleanup(mock_normandy_requests_get_patcher.stop)
         self.mock_normandy_requests_get.return_value = (
             self.buildMockSuccessEnabledResponse()
         )
+        self.mock_normandy_requests_get.side_effect = self.determineRecipesResponse
+
+    def determineRecipesResponse(self, url, params=None, headers=None, verify=None):
+        # Recipe list requests get every requested recipe back with the
+        # approved revision of the configured single recipe response
+        response = self.mock_normandy_requests_get.return_value
+        if not params or "id_in" not in params:
+            return response
+
+        response_data = response.json()
+        if "approved_revision" not in response_data:
+            return response
+
+        recipe_ids = [int(i) for i in params["id_in"].split(",")]
+        return self.buildMockRecipesResponse(
+            {recipe_id: response_data["approved_revision"] for recipe_id in recipe_ids}
+        )
+
+    def buildMockRecipesResponse(self, recipes, next_url=None, headers=None):
+        mock_response_data = {
+            "count": len(recipes),
+            "next": next_url,
+            "previous": None,
+            "results": [
+                {"id": recipe_id, "approved_revision": approved_revision}
+                for recipe_id, approved_revision in recipes.items()
+            ],
+        }
+        mock_response = mock.Mock()
+        mock_response.json = mock.Mock()
+        mock_response.json.return_value = mock_response_data
+        mock_response.raise_for_status = mock.Mock()
+        mock_response.raise_for_status.side_effect = None
+        mock_response.status_code = 200
+        mock_response.headers = headers or {}
+        return mock_response
 
     def buildMockSuccessEnabledResponse(self):
         mock_response_data = {
@@ -28,6 +64,7 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
         return mock_response
 
     def buildMockFailedResponse(self):
@@ -38,6 +75,17 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 404
+        mock_response.headers = {}
+        return mock_response
+
+    def buildMockNotModifiedResponse(self):
+        mock_response = mock.Mock()
+        mock_response.json = mock.Mock()
+        mock_response.json.side_effect = ValueError()
+        mock_response.raise_for_status = mock.Mock()
+        mock_response.raise_for_status.side_effect = None
+        mock_response.status_code = 304
+        mock_response.headers = {}
         return mock_response
 
     def buildMockSuccessDisabledResponse(self):
@@ -53,6 +101,7 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
         return mock_response
 
     def buildMockSucessWithNoPauseEnrollment(self):
@@ -69,11 +118,21 @@ class MockNormandyMixin(object):
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
         mock_response.status_code = 200
+        mock_response.headers = {}
         return mock_response
 
     def setUpMockNormandyFailWithSpecifiedID(self, normandy_id):
-        def determine_response(url, verify=None):
-            if normandy_id in url:
+        def determine_response(url, params=None, headers=None, verify=None):
+            if params and "id_in" in params:
+                recipe = self.buildMockSuccessEnabledResponse().json()
+                return self.buildMockRecipesResponse(
+                    {
+                        int(recipe_id): recipe["approved_revision"]
+                        for recipe_id in params["id_in"].split(",")
+                        if recipe_id != normandy_id
+                    }
+                )
+            elif normandy_id in url:
                 return self.buildMockFailedResponse()
             else:
                 return self.buildMockSuccessEnabledResponse()
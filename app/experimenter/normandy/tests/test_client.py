@@ -1,13 +1,16 @@
 import mock
 from requests.exceptions import RequestException, HTTPError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from experimenter.base.tests.mixins import MockRedisMixin, StubServerMixin
 from experimenter.normandy import (
     APINormandyError,
     NonsuccessfulNormandyCall,
     NormandyDecodeError,
     make_normandy_call,
+    get_modified_recipes,
     get_recipe,
+    get_recipes,
 )
 from experimenter.normandy.tests.mixins import MockNormandyMixin
 
@@ -50,3 +53,122 @@ class TestMakeNormandyCall(MockNormandyMixin, TestCase):
     def test_successful_get_recipe_returns_recipe_data(self):
         response_data = get_recipe(1234)
         self.assertTrue(response_data["enabled"])
+
+
+class TestGetRecipes(MockNormandyMixin, TestCase):
+    def test_get_recipes_follows_next_page(self):
+        self.mock_normandy_requests_get.side_effect = [
+            self.buildMockRecipesResponse(
+                {1: {"id": 11, "enabled": True}, 3: {"id": 33, "enabled": True}},
+                next_url="/next/",
+            ),
+            self.buildMockRecipesResponse({2: {"id": 22, "enabled": False}}),
+        ]
+
+        recipes = get_recipes([1, 2])
+
+        self.assertEqual(
+            recipes, {1: {"id": 11, "enabled": True}, 2: {"id": 22, "enabled": False}}
+        )
+        self.assertEqual(self.mock_normandy_requests_get.call_count, 2)
+        self.assertEqual(
+            self.mock_normandy_requests_get.call_args_list[1],
+            mock.call("/next/", params=None, headers={}, verify=mock.ANY),
+        )
+
+    def test_get_modified_recipes_returns_validators(self):
+        self.mock_normandy_requests_get.side_effect = [
+            self.buildMockRecipesResponse(
+                {1: {"id": 11}},
+                headers={"ETag": '"abc"', "Last-Modified": "Tue, 01 Sep 2020"},
+            )
+        ]
+
+        recipes, etag, last_modified = get_modified_recipes([1])
+
+        self.assertEqual(recipes, {1: {"id": 11}})
+        self.assertEqual(etag, '"abc"')
+        self.assertEqual(last_modified, "Tue, 01 Sep 2020")
+
+    def test_get_modified_recipes_ignores_validators_of_paginated_response(self):
+        self.mock_normandy_requests_get.side_effect = [
+            self.buildMockRecipesResponse(
+                {1: {"id": 11}}, next_url="/next/", headers={"ETag": '"abc"'}
+            ),
+            self.buildMockRecipesResponse({2: {"id": 22}}, headers={"ETag": '"def"'}),
+        ]
+
+        recipes, etag, last_modified = get_modified_recipes([1, 2])
+
+        self.assertEqual(recipes, {1: {"id": 11}, 2: {"id": 22}})
+        self.assertEqual(etag, "")
+        self.assertEqual(last_modified, "")
+
+    def test_get_modified_recipes_not_modified(self):
+        self.mock_normandy_requests_get.side_effect = [
+            self.buildMockNotModifiedResponse()
+        ]
+
+        recipes, etag, last_modified = get_modified_recipes(
+            [1], etag='"abc"', last_modified="Tue, 01 Sep 2020"
+        )
+
+        self.assertIsNone(recipes)
+        self.assertEqual(etag, '"abc"')
+        self.assertEqual(last_modified, "Tue, 01 Sep 2020")
+        self.mock_normandy_requests_get.assert_called_once_with(
+            mock.ANY,
+            params={"id_in": "1", "page_size": 1},
+            headers={"If-None-Match": '"abc"', "If-Modified-Since": "Tue, 01 Sep 2020"},
+            verify=mock.ANY,
+        )
+
+
+class TestGetRecipesStubServer(MockRedisMixin, StubServerMixin, TestCase):
+    PAGE_SIZE = 2
+
+    def stubResponse(self, method, path, query, body):
+        if path != "/api/v3/recipe/":
+            return 404, {"detail": "Not found."}
+
+        recipe_ids = [int(i) for i in query["id_in"][0].split(",")]
+        page = int(query.get("page", ["1"])[0])
+        page_start = (page - 1) * self.PAGE_SIZE
+        page_ids = recipe_ids[page_start:][: self.PAGE_SIZE]
+
+        next_url = None
+        if page * self.PAGE_SIZE < len(recipe_ids):
+            next_url = "{url}{path}?id_in={ids}&page={page}".format(
+                url=self.stub_url, path=path, ids=query["id_in"][0], page=page + 1
+            )
+
+        return (
+            200,
+            {
+                "count": len(recipe_ids),
+                "next": next_url,
+                "previous": None,
+                "results": [
+                    {"id": i, "approved_revision": {"id": i * 10, "enabled": True}}
+                    for i in page_ids
+                ],
+            },
+        )
+
+    def test_get_recipes_returns_all_pages(self):
+        with override_settings(
+            NORMANDY_API_RECIPES_URL="{url}/api/v3/recipe/".format(url=self.stub_url)
+        ):
+            recipes = get_recipes([5, 1, 3, 2, 4])
+
+        self.assertEqual(
+            recipes, {i: {"id": i * 10, "enabled": True} for i in (1, 2, 3, 4, 5)}
+        )
+        self.assertEqual(len(self.stub_requests), 3)
+
+    def test_get_recipes_raises_for_missing_endpoint(self):
+        with override_settings(
+            NORMANDY_API_RECIPES_URL="{url}/missing/".format(url=self.stub_url)
+        ):
+            with self.assertRaises(NonsuccessfulNormandyCall):
+                get_recipes([1])
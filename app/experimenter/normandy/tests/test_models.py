@@ -0,0 +1,28 @@
+from django.test import TestCase
+
+from experimenter.normandy.models import RecipeCache
+
+
+class TestRecipeCache(TestCase):
+    def test_is_current_matches_revision_and_enabled_state(self):
+        recipe_cache = RecipeCache(normandy_id=1, revision_id=10, enabled=True)
+
+        self.assertTrue(recipe_cache.is_current({"id": 10, "enabled": True}))
+        self.assertFalse(recipe_cache.is_current({"id": 11, "enabled": True}))
+        self.assertFalse(recipe_cache.is_current({"id": 10, "enabled": False}))
+        self.assertFalse(recipe_cache.is_current(None))
+
+    def test_is_current_without_revision(self):
+        recipe_cache = RecipeCache(normandy_id=1)
+
+        self.assertFalse(recipe_cache.is_current({"enabled": True}))
+
+    def test_store_revisions_of_empty_recipe(self):
+        RecipeCache.objects.create(normandy_id=1, revision_id=10, enabled=True)
+
+        RecipeCache.objects.store_revisions({1: None, 2: {"id": 20}})
+
+        recipe_cache = RecipeCache.objects.get(normandy_id=1)
+        self.assertIsNone(recipe_cache.revision_id)
+        self.assertIsNone(recipe_cache.enabled)
+        self.assertFalse(RecipeCache.objects.filter(normandy_id=2).exists())
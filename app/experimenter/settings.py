@@ -51,6 +51,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django.forms",
     "corsheaders",
     "raven.contrib.django.raven_compat",
@@ -62,6 +63,7 @@ INSTALLED_APPS = [
     "experimenter.openidc",
     "experimenter.projects",
     "experimenter.normandy",
+    "experimenter.bugzilla",
     "django_markdown2",
 ]
 
@@ -128,7 +130,11 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 OPENIDC_EMAIL_HEADER = config("OPENIDC_HEADER")
-OPENIDC_AUTH_WHITELIST = ("experiments-api-list", "experiments-api-recipe")
+OPENIDC_AUTH_WHITELIST = (
+    "experiments-api-list",
+    "experiments-api-recipe",
+    "experiments-api-normandy-recipe-changed",
+)
 
 
 # Internationalization
@@ -237,6 +243,16 @@ EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = not DEBUG
 EMAIL_USE_SSL = False
 
+# Queued emails are sent in batches over one SMTP connection
+EMAIL_OUTBOX_BATCH_SIZE = config("EMAIL_OUTBOX_BATCH_SIZE", default=50, cast=int)
+EMAIL_OUTBOX_RETRY_DELAY = config("EMAIL_OUTBOX_RETRY_DELAY", default=60, cast=int)
+
+# Send subscribers one daily digest instead of an email per experiment event
+EMAIL_SUBSCRIBER_DIGEST = config("EMAIL_SUBSCRIBER_DIGEST", default=False, cast=bool)
+EMAIL_SUBSCRIBER_DIGEST_INTERVAL = config(
+    "EMAIL_SUBSCRIBER_DIGEST_INTERVAL", default=86400, cast=int
+)
+
 # Email to send to when an experiment is ready for review
 EMAIL_REVIEW = config("EMAIL_REVIEW")
 
@@ -246,6 +262,22 @@ EMAIL_SHIP = config("EMAIL_SHIP")
 # Email to send to when an experiment is being signed-off
 EMAIL_RELEASE_DRIVERS = config("EMAIL_RELEASE_DRIVERS")
 
+# Outbound HTTP requests to Bugzilla and Normandy
+HTTP_CONNECT_TIMEOUT = config("HTTP_CONNECT_TIMEOUT", default=3.05, cast=float)
+HTTP_READ_TIMEOUT = config("HTTP_READ_TIMEOUT", default=30, cast=float)
+HTTP_RETRIES = config("HTTP_RETRIES", default=3, cast=int)
+HTTP_RETRY_BACKOFF = config("HTTP_RETRY_BACKOFF", default=0.5, cast=float)
+# Keep-alive connections kept open per host
+HTTP_POOL_SIZE = config("HTTP_POOL_SIZE", default=10, cast=int)
+# Consecutive failures after which requests to an upstream fail fast
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = config(
+    "CIRCUIT_BREAKER_FAILURE_THRESHOLD", default=5, cast=int
+)
+# Seconds a tripped circuit stays open before a probe request is let through
+CIRCUIT_BREAKER_RESET_TIMEOUT = config(
+    "CIRCUIT_BREAKER_RESET_TIMEOUT", default=60, cast=int
+)
+
 # Bugzilla API Integration
 BUGZILLA_HOST = config("BUGZILLA_HOST")
 BUGZILLA_API_KEY = config("BUGZILLA_API_KEY")
@@ -262,17 +294,47 @@ BUGZILLA_UPDATE_URL = "{path}?api_key={api_key}".format(
 BUGZILLA_USER_URL = "{path}?api_key={api_key}".format(
     path=urljoin(BUGZILLA_HOST, "/rest/user/{email}"), api_key=BUGZILLA_API_KEY
 )
+BUGZILLA_USERS_URL = "{path}?api_key={api_key}".format(
+    path=urljoin(BUGZILLA_HOST, "/rest/user"), api_key=BUGZILLA_API_KEY
+)
 
 BUGZILLA_BUG_URL = "{path}?api_key={api_key}".format(
     path=urljoin(BUGZILLA_HOST, "/rest/bug?id={bug_id}"), api_key=BUGZILLA_API_KEY
 )
+# bug searches send the ids and api_key as query parameters
+BUGZILLA_SEARCH_URL = urljoin(BUGZILLA_HOST, BUGZILLA_CREATE_PATH)
 BUGZILLA_COMMENT_URL = "{path}?api_key={api_key}".format(
     path=urljoin(BUGZILLA_HOST, "/rest/bug/{id}/comment"), api_key=BUGZILLA_API_KEY
 )
 
+# Bugzilla updates requested within this many seconds are sent as one
+BUGZILLA_UPDATE_DEBOUNCE = config("BUGZILLA_UPDATE_DEBOUNCE", default=30, cast=int)
+
+# Bug resolutions updated together are sent in batches of this many bugs
+BUGZILLA_BULK_UPDATE_SIZE = config("BUGZILLA_BULK_UPDATE_SIZE", default=100, cast=int)
+
+# Tracked bugs are fetched from Bugzilla in searches of this many ids
+BUGZILLA_SEARCH_CHUNK_SIZE = config("BUGZILLA_SEARCH_CHUNK_SIZE", default=500, cast=int)
+
+# Bugzilla user and bug lookups are cached, missing ones for a shorter time
+BUGZILLA_CACHE_TTL = config("BUGZILLA_CACHE_TTL", default=86400, cast=int)
+BUGZILLA_CACHE_MISSING_TTL = config("BUGZILLA_CACHE_MISSING_TTL", default=900, cast=int)
+BUGZILLA_CACHE_WARM_BATCH_SIZE = config(
+    "BUGZILLA_CACHE_WARM_BATCH_SIZE", default=50, cast=int
+)
+
 # DS Issue URL
 DS_ISSUE_HOST = config("DS_ISSUE_HOST")
 
+# Experiment typeahead search
+EXPERIMENT_TYPEAHEAD_LIMIT = config("EXPERIMENT_TYPEAHEAD_LIMIT", default=10, cast=int)
+EXPERIMENT_TYPEAHEAD_CACHE_TTL = config(
+    "EXPERIMENT_TYPEAHEAD_CACHE_TTL", default=60, cast=int
+)
+EXPERIMENT_TYPEAHEAD_MAX_LENGTH = config(
+    "EXPERIMENT_TYPEAHEAD_MAX_LENGTH", default=100, cast=int
+)
+
 REDIS_HOST = config("REDIS_HOST")
 REDIS_PORT = config("REDIS_PORT")
 REDIS_DB = config("REDIS_DB")
@@ -281,16 +343,71 @@ REDIS_DB = config("REDIS_DB")
 CELERY_BROKER_URL = "redis://{host}:{port}/{db}".format(
     host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB
 )
+# Chords need a result backend, results are only stored for tasks that opt in
+CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_SCHEDULE_INTERVAL = config("CELERY_SCHEDULE_INTERVAL", default=300, cast=int)
 CELERY_BEAT_SCHEDULE = {
     "debug_task": {
         "task": "experimenter.experiments.tasks.update_experiment_info",
-        "schedule": config("CELERY_SCHEDULE_INTERVAL", default=300, cast=int),
-    }
+        "schedule": CELERY_SCHEDULE_INTERVAL,
+    },
+    "send_outbox_emails": {
+        "task": "experimenter.experiments.tasks.send_outbox_emails",
+        "schedule": config("EMAIL_OUTBOX_INTERVAL", default=300, cast=int),
+    },
+    "send_subscriber_digest": {
+        "task": "experimenter.experiments.tasks.send_subscriber_digest",
+        "schedule": EMAIL_SUBSCRIBER_DIGEST_INTERVAL,
+    },
+    "warm_bugzilla_user_cache": {
+        "task": "experimenter.experiments.tasks.warm_bugzilla_user_cache",
+        "schedule": config("BUGZILLA_CACHE_WARM_INTERVAL", default=43200, cast=int),
+    },
+    "reconcile_bugzilla_bugs": {
+        "task": "experimenter.experiments.tasks.reconcile_bugzilla_bugs",
+        "schedule": config("BUGZILLA_RECONCILE_INTERVAL", default=3600, cast=int),
+    },
+    "send_period_ending_emails": {
+        "task": "experimenter.experiments.tasks.send_period_ending_emails",
+        "schedule": config("PERIOD_ENDING_EMAILS_INTERVAL", default=3600, cast=int),
+    },
+}
+
+# Split the Normandy sync into chunks of recipes that run as separate tasks
+NORMANDY_SYNC_FAN_OUT = config("NORMANDY_SYNC_FAN_OUT", default=False, cast=bool)
+NORMANDY_SYNC_CHUNK_SIZE = config("NORMANDY_SYNC_CHUNK_SIZE", default=50, cast=int)
+NORMANDY_SYNC_QUEUE = config("NORMANDY_SYNC_QUEUE", default="celery")
+
+# Seconds a sync may hold its lock before another run can start
+NORMANDY_SYNC_LOCK_TIMEOUT = config("NORMANDY_SYNC_LOCK_TIMEOUT", default=600, cast=int)
+
+# Seconds between Normandy syncs of an experiment, each beat only syncs the
+# experiments that are due
+NORMANDY_SYNC_INTERVALS = {
+    # accepted experiments are polled every beat to catch their launch
+    "accepted": config(
+        "NORMANDY_SYNC_INTERVAL_ACCEPTED", default=CELERY_SCHEDULE_INTERVAL, cast=int
+    ),
+    # live experiments within a day of their proposed start date
+    "launching": config(
+        "NORMANDY_SYNC_INTERVAL_LAUNCHING", default=CELERY_SCHEDULE_INTERVAL, cast=int
+    ),
+    # live experiments whose enrollment or duration ends soon
+    "ending": config("NORMANDY_SYNC_INTERVAL_ENDING", default=900, cast=int),
+    "live": config("NORMANDY_SYNC_INTERVAL_LIVE", default=3600, cast=int),
+    "paused": config("NORMANDY_SYNC_INTERVAL_PAUSED", default=21600, cast=int),
 }
 
 # Normandy Configuration
 NORMANDY_SLUG_MAX_LEN = 80
 
+# Maximum number of recipes fetched from Normandy in parallel while syncing
+NORMANDY_FETCH_CONCURRENCY = config("NORMANDY_FETCH_CONCURRENCY", default=10, cast=int)
+
+# Number of recipes requested from the Normandy recipe list endpoint at once
+NORMANDY_RECIPE_BATCH_SIZE = config("NORMANDY_RECIPE_BATCH_SIZE", default=50, cast=int)
+
 # Monitoring
 MONITORING_URL = (
     "https://grafana.telemetry.mozilla.org/d/XspgvdxZz/"
@@ -326,6 +443,11 @@ DELIVERY_CONSOLE_EXPERIMENT_IMPORT_URL = urljoin(
 )
 NORMANDY_API_HOST = config("NORMANDY_API_HOST")
 NORMANDY_API_RECIPE_URL = urljoin(NORMANDY_API_HOST, "/api/v3/recipe/{id}/")
+NORMANDY_API_RECIPES_URL = urljoin(NORMANDY_API_HOST, "/api/v3/recipe/")
+
+# Shared secret Normandy signs recipe change notifications with,
+# notifications are rejected while it is unset
+NORMANDY_WEBHOOK_SECRET = config("NORMANDY_WEBHOOK_SECRET", default="")
 
 # Jira URL
 JIRA_URL = config(